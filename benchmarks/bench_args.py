@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2020 Christiaan Frans Rademan <chris@fwiw.co.za>.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+"""Statement conversion benchmark.
+
+Compares args_to converting placeholders to the qmark paramstyle with the
+previous implementation, scanning and rewriting the query on every call,
+against the cached statement plan. Queries with 2 and 500 placeholders are
+measured using dict and positional arguments.
+
+Usage:
+    python benchmarks/bench_args.py
+"""
+import timeit
+from datetime import datetime
+
+from luxon.core.db.base.args import (args_to,
+                                     interpolation_format_match,
+                                     named_re_match,
+                                     pyformat_re_match)
+from luxon.core.db.base.connection import cast_map
+from luxon.utils.timezone import to_utc
+
+
+def _parse_param(value, cast_map):
+    if isinstance(value, bool):
+        return int(value)
+    elif isinstance(value, datetime):
+        return to_utc(value)
+
+    for cast in cast_map:
+        if isinstance(value, cast[0]):
+            return cast[1](value)
+
+    return value
+
+
+def previous(query, args, to='qmark', cast=None):
+    args = args.copy() if isinstance(args, dict) else list(args)
+    new_args = []
+    for expr in interpolation_format_match.findall(query):
+        if pyformat_re_match.match(expr):
+            column = expr[2:][:-2]
+        elif named_re_match.match(expr):
+            column = expr[1:]
+        else:
+            column = expr
+        query = query.replace(expr, '?', 1)
+        if isinstance(args, dict):
+            new_args.append(_parse_param(args[column], cast))
+        else:
+            new_args.append(_parse_param(args.pop(0), cast))
+
+    return (query, new_args)
+
+
+def main():
+    for placeholders in (2, 500):
+        columns = ['col%s' % i for i in range(placeholders)]
+        named = ('INSERT INTO bench (%s) VALUES (%s)' %
+                 (','.join(columns),
+                  ','.join('%%(%s)s' % c for c in columns)))
+        positional = ('INSERT INTO bench (%s) VALUES (%s)' %
+                      (','.join(columns),
+                       ','.join('%s' for c in columns)))
+        values = {c: i for i, c in enumerate(columns)}
+        values['col0'] = True
+        values['col1'] = 'text'
+
+        for query, args in ((named, values),
+                            (positional, list(values.values()))):
+            assert (previous(query, args, cast=cast_map) ==
+                    args_to(query, args, cast=cast_map))
+            number = 200000 // placeholders
+            for func in (previous, args_to):
+                seconds = timeit.timeit(
+                    lambda: func(query, args, 'qmark', cast_map),
+                    number=number)
+                print('%-4s %-10s %-8s %10.2f us/call' % (
+                    placeholders,
+                    'dict' if isinstance(args, dict) else 'list',
+                    func.__name__,
+                    seconds / number * 1000000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2020 Christiaan Frans Rademan <chris@fwiw.co.za>.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+"""ASGI throughput benchmark.
+
+Compares WSGI and ASGI throughput for views fanning out to a slow backend
+API. The backend is a local stub server responding after 20ms. Each
+request calls the backend 3 times with 64 concurrent clients.
+
+    * WSGI: Sync view on 4 sync workers.
+    * ASGI sync: Same sync view on thread pool of 32 threads.
+    * ASGI async: Async view awaiting the backend calls concurrently.
+
+Usage:
+    python benchmarks/bench_asgi.py
+"""
+import os
+import time
+import json
+import asyncio
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from socketserver import ThreadingMixIn
+
+from luxon import register
+from luxon.utils.http import Client
+from luxon.testing.wsgi.request import request as wsgi_request
+
+LATENCY = 0.02
+CALLS = 3
+REQUESTS = 256
+CONCURRENCY = 64
+WORKERS = 4
+
+
+class Backend(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.0'
+
+    def do_GET(self):
+        time.sleep(LATENCY)
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class ThreadingServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+
+server = ThreadingServer(('127.0.0.1', 0), Backend)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+HOST, PORT = server.server_address
+client = Client('http://%s:%s' % (HOST, PORT))
+
+
+async def fetch(path):
+    reader, writer = await asyncio.open_connection(HOST, PORT)
+    writer.write(b'GET ' + path.encode() + b' HTTP/1.0\r\n\r\n')
+    response = await reader.read()
+    writer.close()
+    return json.loads(response.split(b'\r\n\r\n', 1)[1])
+
+
+@register.resource('GET', '/sync')
+def sync_view(req, resp):
+    return [client.execute('GET', '/').json for i in range(CALLS)]
+
+
+@register.resource('GET', '/async')
+async def async_view(req, resp):
+    return await asyncio.gather(*[fetch('/') for i in range(CALLS)])
+
+
+def bench_wsgi(app):
+    def call(i):
+        assert wsgi_request(app, 'GET', '/sync').status_code == 200
+
+    start = time.time()
+    with ThreadPoolExecutor(max_workers=WORKERS) as workers:
+        list(workers.map(call, range(REQUESTS)))
+    return REQUESTS / (time.time() - start)
+
+
+def bench_asgi(app, path):
+    scope = {'type': 'http', 'http_version': '1.1', 'method': 'GET',
+             'scheme': 'http', 'path': path, 'root_path': '',
+             'query_string': b'', 'headers': [(b'host', b'localhost')],
+             'server': ('localhost', 80)}
+
+    async def receive():
+        return {'type': 'http.request', 'body': b''}
+
+    async def call(semaphore):
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        async with semaphore:
+            await app(scope, receive, send)
+        assert sent[0]['status'] == 200
+
+    async def main():
+        semaphore = asyncio.Semaphore(CONCURRENCY)
+        await asyncio.gather(*[call(semaphore) for i in range(REQUESTS)])
+
+    loop = asyncio.new_event_loop()
+    start = time.time()
+    loop.run_until_complete(main())
+    loop.close()
+    return REQUESTS / (time.time() - start)
+
+
+def main():
+    from luxon.core.handlers.wsgi import Wsgi
+    from luxon.core.handlers.asgi import Asgi
+
+    path = tempfile.mkdtemp()
+    open(os.path.join(path, 'settings.ini'), 'w').close()
+
+    print('%s requests, %s concurrent, %s backend calls of %sms each' % (
+        REQUESTS, CONCURRENCY, CALLS, int(LATENCY * 1000)))
+    print('%-12s %10.1f req/s' % ('WSGI', bench_wsgi(Wsgi(__name__, path))))
+    asgi = Asgi(__name__, path)
+    print('%-12s %10.1f req/s' % ('ASGI sync', bench_asgi(asgi, '/sync')))
+    print('%-12s %10.1f req/s' % ('ASGI async', bench_asgi(asgi, '/async')))
+
+
+if __name__ == '__main__':
+    main()
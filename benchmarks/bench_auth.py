@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2020 Christiaan Frans Rademan <chris@fwiw.co.za>.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+"""Authentication benchmark.
+
+Compares the previous Auth, reading the PEM files and verifying the RS256
+signature for every request, with the process wide key cache and verified
+token cache, for the same bearer token.
+
+Usage:
+    python benchmarks/bench_auth.py
+"""
+import timeit
+import tempfile
+
+from authlib.jose import jwt
+
+from luxon import g
+from luxon.core.app import App
+from luxon.core.auth import Auth
+from luxon.utils.rsa import RSAKey
+
+
+def previous(token):
+    with open(g.app.path + '/private.pem', 'rb') as f:
+        f.read()
+    with open(g.app.path + '/public.pem', 'rb') as f:
+        public = f.read()
+    claims = jwt.decode(token, public)
+    claims.validate()
+    return claims
+
+
+def current(token):
+    auth = Auth(expire=3600)
+    auth.token = token
+    return auth._jwt
+
+
+def main():
+    path = tempfile.mkdtemp()
+    rsakey = RSAKey()
+    with open(path + '/private.pem', 'w') as f:
+        f.write(rsakey.generate_private_key())
+    with open(path + '/public.pem', 'w') as f:
+        f.write(rsakey.public_key)
+    App(__name__, path)
+
+    auth = Auth(expire=3600)
+    auth.new('user', username='user', roles=['Administrator'])
+    token = auth.token
+
+    assert previous(token) == current(token)
+    for func in (previous, current):
+        seconds = timeit.timeit(lambda: func(token), number=1000)
+        print('%-10s %10.2f us/request' % (func.__name__, seconds * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2020 Christiaan Frans Rademan <chris@fwiw.co.za>.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+"""Memory cache benchmark.
+
+Compares the previous Memory cache, an unlocked OrderedDict with
+timezone aware expiry, with the current locked byte budgeted LRU. Each
+thread loads and stores random keys from a key space twice the size of the
+cache. Errors raised by the unlocked cache under concurrency are counted.
+
+Usage:
+    python benchmarks/bench_cache.py
+"""
+import sys
+import time
+import pickle
+import random
+import collections
+import threading
+from datetime import timedelta
+
+from luxon.core.cache import Memory
+from luxon.utils.timezone import now
+
+
+class Previous(object):
+    def __init__(self, max_objs=5000, max_obj_size=50):
+        self._cache = collections.OrderedDict()
+        self._max_objs = max_objs
+        self._max_obj_size = 1024 * max_obj_size
+
+    def load(self, key):
+        try:
+            value, expire = self._cache.pop(key)
+            if expire > now():
+                self._cache[key] = (value, expire,)
+                return pickle.loads(value)
+        except KeyError:
+            return None
+
+    def store(self, key, value, expire):
+        if sys.getsizeof(value, 0) <= self._max_obj_size:
+            try:
+                self._cache.pop(key)
+            except KeyError:
+                if len(self._cache) >= self._max_objs:
+                    self._cache.popitem(last=False)
+            self._cache[key] = (pickle.dumps(value),
+                                now() + timedelta(seconds=expire),)
+
+
+def run(cache, threads, operations):
+    errors = []
+    value = {'id': 1, 'name': 'value', 'rows': list(range(50))}
+
+    def worker(seed):
+        rnd = random.Random(seed)
+        for i in range(operations):
+            key = str(rnd.randrange(2000))
+            try:
+                if cache.load(key) is None:
+                    cache.store(key, value, 60)
+            except Exception as e:
+                errors.append(e)
+
+    workers = [threading.Thread(target=worker, args=(i,))
+               for i in range(threads)]
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return time.perf_counter() - start, len(errors)
+
+
+def main():
+    operations = 20000
+    for threads in (1, 4, 16):
+        for name, cache in (('previous', Previous(1000, 50)),
+                            ('memory', Memory(1000, 50))):
+            seconds, errors = run(cache, threads, operations)
+            print('%-10s threads %2d %10.0f ops/s errors %d' % (
+                name, threads, threads * operations / seconds, errors))
+        print('memory     %r' % cache.stats())
+
+
+if __name__ == '__main__':
+    main()
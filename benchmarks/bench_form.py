@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2020 Christiaan Frans Rademan <chris@fwiw.co.za>.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+"""Form parsing benchmark.
+
+Compares cgi.FieldStorage, previously used by Request.form, with the
+streaming luxon.utils.form parser for a large upload (64 MB file) and a
+form with many small fields and files (1000 fields, 200 files of 1 KB).
+Reports time and peak memory allocated during parsing.
+
+Usage:
+    python benchmarks/bench_form.py
+"""
+import os
+import time
+import tracemalloc
+from io import BytesIO
+
+from luxon.utils.form import parse
+
+try:
+    from cgi import FieldStorage
+except ImportError:
+    # Python 3.13 removed cgi.
+    FieldStorage = None
+
+BOUNDARY = b'boundary'
+CONTENT_TYPE = 'multipart/form-data; boundary=boundary'
+
+
+def payload(fields, files, file_size):
+    parts = []
+    for i in range(fields):
+        parts.append(b'--boundary\r\n'
+                     b'Content-Disposition: form-data; name="field%d"\r\n'
+                     b'\r\n'
+                     b'value %d\r\n' % (i, i))
+    for i in range(files):
+        parts.append(b'--boundary\r\n'
+                     b'Content-Disposition: form-data; name="file%d";'
+                     b' filename="file%d"\r\n'
+                     b'Content-Type: application/octet-stream\r\n'
+                     b'\r\n' % (i, i))
+        parts.append(os.urandom(file_size))
+        parts.append(b'\r\n')
+    parts.append(b'--boundary--\r\n')
+    return b''.join(parts)
+
+
+def consume(field):
+    # Read uploaded files in blocks as a view copying it to storage would.
+    if field.filename:
+        while field.file.read(64 * 1024):
+            pass
+    else:
+        field.value
+
+
+def field_storage(body):
+    environ = {'REQUEST_METHOD': 'POST',
+               'CONTENT_TYPE': CONTENT_TYPE,
+               'CONTENT_LENGTH': str(len(body))}
+    form = FieldStorage(fp=BytesIO(body), environ=environ,
+                        keep_blank_values=True)
+    for name in form:
+        consume(form[name])
+
+
+def streaming(body):
+    form = parse(BytesIO(body), CONTENT_TYPE, len(body))
+    for name in form:
+        consume(form[name])
+    form.close()
+
+
+def measure(func, body):
+    tracemalloc.start()
+    start = time.perf_counter()
+    func(body)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    cases = (('64 MB file', payload(0, 1, 64 * 1024 * 1024)),
+             ('many small', payload(1000, 200, 1024)),)
+
+    parsers = [('streaming', streaming)]
+    if FieldStorage is not None:
+        parsers.insert(0, ('FieldStorage', field_storage))
+
+    for case, body in cases:
+        for name, func in parsers:
+            elapsed, peak = measure(func, body)
+            print('%-12s %-14s %8.3fs %10.1f MB peak' % (
+                case, name, elapsed, peak / 1024 / 1024))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2020 Christiaan Frans Rademan <chris@fwiw.co.za>.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+"""Batched insert benchmark.
+
+Compares inserting rows into an SQLite table with the previous
+Cursor.insert, building the statement and executing once per row, with the
+current batched insert using executemany.
+
+Usage:
+    python benchmarks/bench_insert.py
+"""
+import os
+import time
+import tempfile
+
+from luxon.core.app import App
+from luxon.core.db.sqlite import connect
+
+
+def previous(conn, table, data):
+    crsr = conn._crsr
+    for row in data:
+        query = "INSERT INTO %s (" % table
+        query += ','.join(row.keys())
+        query += ')'
+        query += ' VALUES'
+        query += ' ('
+        placeholders = []
+        for ph in range(len(row)):
+            placeholders.append('%s')
+        query += ','.join(placeholders)
+        query += ')'
+        crsr.execute(query, list(row.values()))
+    crsr.commit()
+
+
+def batched(conn, table, data):
+    conn.insert(table, data)
+
+
+def main():
+    path = tempfile.mkdtemp()
+    App(__name__, path)
+    conn = connect(os.path.join(path, 'bench.db'))
+    conn.execute('CREATE TABLE bench (id INTEGER, name TEXT,'
+                 ' email TEXT, amount REAL, enabled INTEGER)')
+    rows = [{'id': i,
+             'name': 'name %s' % i,
+             'email': 'user%s@example.com' % i,
+             'amount': i * 1.5,
+             'enabled': True} for i in range(100000)]
+
+    for func in (previous, batched):
+        conn.execute('DELETE FROM bench')
+        conn.commit()
+        start = time.perf_counter()
+        func(conn, 'bench', rows)
+        seconds = time.perf_counter() - start
+        count = conn.execute('SELECT count(*) AS count'
+                             ' FROM bench').fetchone()['count']
+        assert count == len(rows)
+        print('%-10s %10.0f rows/s' % (func.__name__, len(rows) / seconds))
+
+    conn.close()
+
+
+if __name__ == '__main__':
+    main()
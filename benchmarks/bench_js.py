@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2020 Christiaan Frans Rademan <chris@fwiw.co.za>.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+"""JSON decoding benchmark.
+
+Compares the previous js.loads, sanitising with parse_load as object_hook
+and a new HTMLParser class per string, with the current single pass
+js.loads for a nested document (200 levels) and a wide document (10000
+rows of 10 fields, 1 in 10 strings with tags).
+
+Compares encoding 10000 rows with Decimal, IP address and datetime values
+using the previous js.dumps (indent=4) with js.encode backends.
+
+Usage:
+    python benchmarks/bench_js.py
+"""
+import json
+import timeit
+import tempfile
+from datetime import datetime, timezone
+from decimal import Decimal
+from ipaddress import IPv4Address
+from html.parser import HTMLParser
+
+from luxon.utils import js
+from luxon.utils.html5 import BR_P_HTML_TAG
+
+
+def strip_tags(html):
+    class _HTMLStripper(HTMLParser):
+        def __init__(self):
+            self.reset()
+            self.fed = []
+            self.convert_charrefs = True
+
+        def handle_data(self, d):
+            self.fed.append(d)
+
+        def get_data(self):
+            return ''.join(self.fed)
+
+    html = BR_P_HTML_TAG.sub('\n', html)
+    stripper = _HTMLStripper()
+    stripper.feed(html)
+    return stripper.get_data()
+
+
+def parse_load(parse):
+    if isinstance(parse, list):
+        for i, obj in enumerate(parse):
+            parse[i] = parse_load(obj)
+        return parse
+    elif isinstance(parse, dict):
+        for obj in parse:
+            parse[obj] = parse_load(parse[obj])
+        return parse
+    else:
+        if isinstance(parse, str):
+            parse = strip_tags(parse)
+        return parse
+
+
+def previous(json_text):
+    return json.loads(json_text, object_hook=parse_load)
+
+
+def nested(depth):
+    doc = {'name': 'leaf'}
+    for i in range(depth):
+        doc = {'name': 'level %d' % i, 'tags': ['a', 'b'], 'child': doc}
+    return json.dumps(doc)
+
+
+def wide(rows):
+    return json.dumps([{'field%d' % f: ('<b>value</b>' if f == 0 else
+                                        'value %d' % f)
+                        for f in range(10)} for r in range(rows)])
+
+
+def rows(count):
+    return [{'id': i,
+             'name': 'row %d' % i,
+             'amount': Decimal('10.50'),
+             'ip': IPv4Address('10.0.0.1'),
+             'created': datetime(2020, 1, 1, 12, tzinfo=timezone.utc),
+             'enabled': True} for i in range(count)]
+
+
+def encoding():
+    from luxon.core.app import App
+    App(__name__, tempfile.mkdtemp())
+
+    obj = {'payload': rows(10000)}
+    backends = [('dumps', None),
+                ('json', 'json')]
+    if js.orjson is not None:
+        backends.append(('orjson', 'orjson'))
+
+    for name, backend in backends:
+        if backend is None:
+            def func(obj):
+                return js.dumps(obj).encode('UTF-8')
+        else:
+            js.configure(backend)
+            func = js.encode
+            assert json.loads(func(obj)) == json.loads(js.dumps(obj))
+
+        seconds = timeit.timeit(lambda: func(obj), number=5)
+        print('%-8s %-10s %10.2f ms %8.0f KB' % ('encode', name,
+                                                 seconds / 5 * 1000,
+                                                 len(func(obj)) / 1024))
+
+
+def main():
+    for name, doc, number in (('nested', nested(200), 5),
+                              ('wide', wide(10000), 5),):
+        assert previous(doc) == js.loads(doc)
+        for func in (previous, js.loads):
+            seconds = timeit.timeit(lambda: func(doc), number=number)
+            print('%-8s %-10s %10.2f ms' % (name, func.__name__,
+                                            seconds / number * 1000))
+
+    encoding()
+
+
+if __name__ == '__main__':
+    main()
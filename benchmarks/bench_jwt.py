@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2020 Christiaan Frans Rademan <chris@fwiw.co.za>.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+"""JWT signature algorithm benchmark.
+
+Signing and verifying operations per second of a token with typical claims
+for RS256 (RSA 2048 and 4096 bits), ES256 (NIST P-256) and EdDSA (Ed25519)
+keys generated by luxon -r.
+
+Usage:
+    python benchmarks/bench_jwt.py
+"""
+import timeit
+
+from authlib.jose import jwt
+from authlib.jose import JsonWebKey
+
+from luxon.utils.rsa import RSAKey
+from luxon.utils.ecc import ECKey, EdKey
+from luxon.utils.timezone import epoch
+
+
+def rsa(bits):
+    def generate():
+        key = RSAKey()
+        return key.generate_private_key(bits=bits), key.public_key
+    return generate
+
+
+def generate(cls):
+    def generate():
+        key = cls()
+        return key.generate_private_key(), key.public_key
+    return generate
+
+
+def main():
+    claims = {'user_id': '4c0a0d5e-0c36-4b8f-a05b-2e5d7d1d1a3c',
+              'username': 'user',
+              'user_domain': 'default',
+              'roles': ['Administrator', 'Operations'],
+              'metadata': {},
+              'exp': int(epoch() + 3600)}
+
+    for name, algorithm, keys in (('RS256-2048', 'RS256', rsa(2048)),
+                                  ('RS256-4096', 'RS256', rsa(4096)),
+                                  ('ES256', 'ES256', generate(ECKey)),
+                                  ('EdDSA', 'EdDSA', generate(EdKey))):
+        private, public = keys()
+        private = JsonWebKey.import_key(private)
+        public = JsonWebKey.import_key(public)
+        header = {'alg': algorithm}
+        token = jwt.encode(header, claims, private)
+        assert jwt.decode(token, public) == claims
+
+        number = 200
+        sign = timeit.timeit(lambda: jwt.encode(header, claims, private),
+                             number=number)
+        verify = timeit.timeit(lambda: jwt.decode(token, public),
+                               number=number)
+        print('%-12s sign %8.0f ops/s verify %8.0f ops/s' % (
+            name, number / sign, number / verify))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2020 Christiaan Frans Rademan <chris@fwiw.co.za>.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+"""Cache stampede benchmark.
+
+Counts how often an expensive function (50ms) is computed when 32 threads
+call it concurrently after its cached result expired, with the previous
+load, call and store cache helper and the current single flight helper,
+with and without stale while revalidate.
+
+Usage:
+    python benchmarks/bench_memoize.py
+"""
+import time
+import tempfile
+import threading
+
+from luxon.core.app import App
+from luxon.core.cache import Cache
+from luxon.helpers.cache import cached, _reference
+
+
+def previous(func, args, kwargs, expire=60, stale=0):
+    cache = Cache()
+    key = 'previous' + _reference(func, args, kwargs)
+    result = cache.load(key)
+    if result is not None:
+        return result
+    result = func(*args, **kwargs)
+    cache.store(key, result, expire)
+    return result
+
+
+def run(name, helper, stale):
+    calls = []
+
+    def expensive(value):
+        calls.append(value)
+        time.sleep(0.05)
+        return value
+
+    helper(expensive, (name,), {}, expire=0.1, stale=stale)
+    time.sleep(0.15)
+
+    latencies = []
+
+    def worker():
+        start = time.perf_counter()
+        helper(expensive, (name,), {}, expire=0.1, stale=stale)
+        latencies.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=worker) for i in range(32)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return len(calls) - 1, sum(latencies) / len(latencies)
+
+
+def main():
+    App(__name__, tempfile.mkdtemp())
+    for name, helper, stale in (('previous', previous, 0),
+                                ('cached', cached, 0),
+                                ('stale', cached, 60)):
+        calls, latency = run(name, helper, stale)
+        print('%-10s computed %2d times, mean latency %6.2f ms' % (
+            name, calls, latency * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2020 Christiaan Frans Rademan <chris@fwiw.co.za>.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+"""Policy validation benchmark.
+
+Compares the previous Policy.validate, executing the whole compiled rule
+set per check, with calling the compiled rule function for every rule in
+the bundled policy.json.
+
+Usage:
+    python benchmarks/bench_policy.py
+"""
+import re
+import timeit
+
+from luxon.utils import js
+from luxon.utils.pkg import Module
+from luxon.core.policy import compiler, Policy
+
+
+class Credentials(object):
+    roles = ['Support', 'Customer']
+    authenticated = True
+
+
+class Request(object):
+    credentials = Credentials()
+
+
+def previous(rule_set):
+    interpolation = re.compile(r"\$[a-z_\-:]+", re.IGNORECASE)
+    code = '_rules = {}\n'
+    for rule, condition in rule_set.items():
+        condition = interpolation.sub(
+            lambda m: m.group(0)[1:].replace(':', '_') + '()', condition)
+        code += 'def %s():\n    return %s\n' % (rule.replace(':', '_'),
+                                                  condition)
+        code += "_rules['%s'] = %s\n" % (rule, rule.replace(':', '_'))
+    code += '_validate_result = _rules[_validate_rule]()\n'
+    compiled = compile(code, 'policy.json.compiled', 'exec')
+
+    def validate(rule, **kwargs):
+        exec_globals = {'_validate_rule': rule}
+        exec_globals.update(kwargs)
+        exec(compiled, exec_globals, exec_globals)
+        return exec_globals['_validate_result']
+
+    return validate
+
+
+def main():
+    rule_set = js.loads(Module('luxon').read('policy.json'))
+    req = Request()
+
+    validate = previous(rule_set)
+    policy = Policy(compiler(rule_set), req=req)
+
+    for rule in rule_set:
+        assert validate(rule, req=req) == policy.validate(rule)
+
+    for name, func in (('previous', lambda r: validate(r, req=req)),
+                       ('compiled', policy.validate)):
+        seconds = timeit.timeit(lambda: [func(rule) for rule in rule_set],
+                                number=100)
+        print('%-10s %10.2f us/check' % (name, seconds / 100 /
+                                         len(rule_set) * 1000000))
+
+
+if __name__ == '__main__':
+    main()
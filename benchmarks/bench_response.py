@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2020 Christiaan Frans Rademan <chris@fwiw.co.za>.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+"""Response body iteration benchmark.
+
+Compares the throughput of the previous 8 KiB chunk slicing iteration of
+bytes bodies with the current Response iteration for 1 KB, 1 MB and
+100 MB bodies.
+
+Usage:
+    python benchmarks/bench_response.py
+"""
+import timeit
+
+from luxon.core.handlers.wsgi.response import Response
+
+SIZES = (('1 KB', 1024, 20000),
+         ('1 MB', 1024 * 1024, 200),
+         ('100 MB', 100 * 1024 * 1024, 3),)
+
+
+def start_response(status, headers):
+    pass
+
+
+def sliced(stream, block_size=8 * 1024):
+    for i in range(0, len(stream), block_size):
+        yield stream[i:i + block_size]
+
+
+def consume(iterable):
+    for chunk in iterable:
+        pass
+
+
+def main():
+    for name, size, number in SIZES:
+        body = b'x' * size
+        resp = Response({}, start_response)
+        resp.body(body)
+
+        t_sliced = timeit.timeit(lambda: consume(sliced(body)),
+                                 number=number)
+        t_iter = timeit.timeit(lambda: consume(resp),
+                               number=number)
+        mb = size * number / 1024 / 1024
+        print('%-6s sliced: %10.1f MB/s  response: %10.1f MB/s' %
+              (name, mb / t_sliced, mb / t_iter))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2020 Christiaan Frans Rademan <chris@fwiw.co.za>.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+"""Router benchmark.
+
+Compares the linear regex route scan with the prefix trie regex matcher
+for 1000 regex routes.
+
+Usage:
+    python benchmarks/bench_router.py
+"""
+import timeit
+
+from luxon.core.router import Router, _RegexMatcher
+
+ROUTES = 1000
+NUMBER = 2000
+
+
+def view(req, resp):
+    pass
+
+
+def linear(regex_routes, route):
+    for regex_route in regex_routes:
+        if regex_route[3].match(route):
+            return regex_route
+    return (None, None, {}, None, None, 0)
+
+
+def main():
+    router = Router()
+    for i in range(ROUTES):
+        router.add('GET', 'regex:^/assets%s/.*\\.(css|js)$' % i, view)
+
+    regex_routes = router._regex_routes['GET']
+    matcher = _RegexMatcher(regex_routes)
+    paths = (('first', '/assets0/main.css'),
+             ('last', '/assets%s/main.js' % (ROUTES - 1)),
+             ('miss', '/notfound/main.js'),)
+
+    print('%s regex routes, %s lookups each' % (ROUTES, NUMBER))
+    for name, path in paths:
+        assert (router.find('GET', path)[0] is
+                linear(regex_routes, path)[0])
+        t_linear = timeit.timeit(lambda: linear(regex_routes, path),
+                                 number=NUMBER)
+        t_trie = timeit.timeit(lambda: matcher.match(path),
+                               number=NUMBER)
+        print('%-6s linear: %8.2f us  trie: %8.2f us' %
+              (name,
+               t_linear / NUMBER * 1000000,
+               t_trie / NUMBER * 1000000))
+
+
+if __name__ == '__main__':
+    main()
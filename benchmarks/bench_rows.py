@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2020 Christiaan Frans Rademan <chris@fwiw.co.za>.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+"""Row conversion benchmark.
+
+Compares converting a SQLite result set of 100000 rows with 30 columns, two
+of them timestamps, with the previous conversion running parse_row on a dict
+of every sqlite3.Row against the description driven Parser used by the
+cursor. The time of the driver alone fetching tuples is shown for reference.
+
+Usage:
+    python benchmarks/bench_rows.py
+"""
+import os
+import time
+import sqlite3
+import tempfile
+
+from luxon.core.app import App
+from luxon.core.db.sqlite import connect
+from luxon.core.db.base.parse import parse_row
+
+ROWS = 100000
+COLUMNS = 30
+QUERY = 'SELECT * FROM bench'
+
+
+def driver(conn):
+    crsr = conn._conn.cursor()
+    crsr.execute(QUERY)
+    return crsr.fetchall()
+
+
+def previous(conn):
+    conn._conn.row_factory = sqlite3.Row
+    try:
+        crsr = conn._conn.cursor()
+        crsr.execute(QUERY)
+        return [parse_row(dict(row)) for row in crsr.fetchall()]
+    finally:
+        conn._conn.row_factory = None
+
+
+def fetchall(conn):
+    return conn.execute(QUERY).fetchall()
+
+
+def iterate(conn):
+    return [row for row in conn.execute(QUERY)]
+
+
+def main():
+    path = tempfile.mkdtemp()
+    App(__name__, path)
+    conn = connect(os.path.join(path, 'bench.db'))
+    columns = ['created TIMESTAMP', 'updated TIMESTAMP']
+    columns += ['col%s TEXT' % i for i in range(COLUMNS - len(columns))]
+    conn.execute('CREATE TABLE bench (%s)' % ', '.join(columns))
+    conn.insert('bench', [['2020-01-01 12:00:00'] * 2 +
+                          ['value %s' % i] * (COLUMNS - 2)
+                          for i in range(ROWS)])
+
+    for func in (driver, previous, fetchall, iterate):
+        start = time.perf_counter()
+        rows = func(conn)
+        seconds = time.perf_counter() - start
+        assert len(rows) == ROWS
+        print('%-10s %10.0f rows/s' % (func.__name__, ROWS / seconds))
+
+    conn.close()
+
+
+if __name__ == '__main__':
+    main()
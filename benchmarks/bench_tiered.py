@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2020 Christiaan Frans Rademan <chris@fwiw.co.za>.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+"""Tiered cache benchmark.
+
+Compares loading from Redis only with the Tiered cache, an in-process L1
+over Redis. Redis is simulated in-process with a 200us round trip per
+operation, to exclude the network setup of a benchmark host.
+
+Usage:
+    python benchmarks/bench_tiered.py
+"""
+import time
+import pickle
+import random
+import timeit
+
+from luxon.core.cache import Tiered
+
+
+class Redis(object):
+    def __init__(self, latency=0.0002):
+        self.latency = latency
+        self.data = {}
+
+    def __call__(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        pass
+
+    def get(self, attr, pickled=False):
+        time.sleep(self.latency)
+        value = self.data.get(attr)
+        if value is not None and not pickled:
+            return pickle.loads(value)
+        return value
+
+    def set(self, attr, value, expire=None, pickled=False):
+        time.sleep(self.latency)
+        if not pickled:
+            value = pickle.dumps(value)
+        self.data[attr] = value
+
+    def delete(self, attr, value=None):
+        time.sleep(self.latency)
+        self.data.pop(attr, None)
+
+    def publish(self, channel, message):
+        time.sleep(self.latency)
+
+    def subscribe(self, *channels):
+        while True:
+            time.sleep(60)
+        yield
+
+
+def main():
+    redis = Redis()
+    tiered = Tiered(None, 50, redis=redis)
+    value = {'id': 1, 'name': 'value', 'rows': list(range(50))}
+    for i in range(200):
+        tiered.store(str(i), value, 60)
+
+    rnd = random.Random(0)
+    keys = [str(rnd.randrange(200)) for i in range(2000)]
+
+    def redis_only():
+        for key in keys:
+            with redis() as r:
+                r.get('cache:' + key)
+
+    def two_tier():
+        for key in keys:
+            tiered.load(key)
+
+    for func in (redis_only, two_tier):
+        seconds = timeit.timeit(func, number=1)
+        print('%-10s %10.0f loads/s' % (func.__name__, len(keys) / seconds))
+    print('tiered     %r' % tiered.stats())
+
+
+if __name__ == '__main__':
+    main()
@@ -27,10 +27,17 @@
 # CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
 # THE POSSIBILITY OF SUCH DAMAGE.
+import os
+import re
 import base64
+import hashlib
+from copy import deepcopy
 from datetime import timedelta
+from threading import Lock
+from collections import OrderedDict
 
 from authlib.jose import jwt
+from authlib.jose import JsonWebKey
 from authlib.jose.rfc7519 import JWTClaims
 import authlib.jose.errors
 
@@ -41,42 +48,177 @@ from luxon.exceptions import (AccessDeniedError,
                               TokenMissingError)
 from luxon.utils import js
 from luxon.utils.timezone import epoch
-from luxon.utils import files
 
 log = GetLogger(__name__)
 
+# JWT algorithm by key type and curve.
+ALGORITHMS = {'RSA': 'RS256',
+              'P-256': 'ES256',
+              'Ed25519': 'EdDSA'}
+
+# PEM encoded key blocks.
+_pem_re = re.compile(rb"-----BEGIN [^-]+-----.+?-----END [^-]+-----",
+                     re.DOTALL)
+
+# Parsed keys by path with modification time.
+_keys = {}
+
+
+def _algorithm(key):
+    if key.kty == 'RSA':
+        return ALGORITHMS['RSA']
+    return ALGORITHMS.get(key.as_dict(is_private=False).get('crv'))
+
+
+def _key(path):
+    """Return parsed keys from PEM file by JWT algorithm.
+
+    The file may contain multiple keys, one per algorithm. For example the
+    previous RSA public key and new Ed25519 public key when rolling over.
+
+    Keys are loaded once per process and reloaded when the modification time
+    of the file changes.
+
+    Args:
+        path (str): Path of PEM file.
+
+    Returns dict of key objects by JWT algorithm or None if the file does
+    not exist.
+    """
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        _keys.pop(path, None)
+        return None
+
+    try:
+        loaded, keys = _keys[path]
+        if loaded == mtime:
+            return keys
+    except KeyError:
+        pass
+
+    with open(path, 'rb') as f:
+        pem = f.read()
+
+    keys = {}
+    for block in _pem_re.findall(pem):
+        try:
+            key = JsonWebKey.import_key(block)
+        except Exception as e:
+            log.error("Unable to load key from '%s' %s" % (path, e))
+            continue
+
+        algorithm = _algorithm(key)
+        if algorithm is None:
+            log.error("Unsupported key in '%s'" % path)
+        elif algorithm not in keys:
+            keys[algorithm] = key
+
+    _keys[path] = (mtime, keys)
+    return keys
+
+
+def _verify_key(keys):
+    def verify_key(header, payload):
+        try:
+            return keys[header['alg']]
+        except KeyError:
+            raise AccessDeniedError("No public key for validating '%s'"
+                                    " JWT Token" % header.get('alg'))
+    return verify_key
+
+
+class _Tokens(object):
+    """LRU cache of verified tokens.
+
+    Tokens are keyed on a SHA256 hash of the token with the keys it was
+    verified with. Claims are returned as a copy, since Auth modifies them
+    when scoping tokens. Expired tokens are not returned.
+
+    Args:
+        max_entries (int): Maximum verified tokens cached.
+    """
+    __slots__ = ('_tokens', '_max_entries', '_lock')
+
+    def __init__(self, max_entries=4096):
+        self._tokens = OrderedDict()
+        self._max_entries = max_entries
+        self._lock = Lock()
+
+    @staticmethod
+    def _hash(token):
+        if isinstance(token, str):
+            token = token.encode('UTF-8')
+        return hashlib.sha256(token).digest()
+
+    def get(self, token, key):
+        digest = self._hash(token)
+        with self._lock:
+            try:
+                verified, claims, header = self._tokens[digest]
+            except KeyError:
+                return None
+
+            exp = claims.get('exp')
+            if verified is not key or (exp is not None and exp <= epoch()):
+                del self._tokens[digest]
+                return None
+
+            self._tokens.move_to_end(digest)
+
+        return JWTClaims(deepcopy(claims), header)
+
+    def set(self, token, key, claims):
+        digest = self._hash(token)
+        with self._lock:
+            self._tokens[digest] = (key, deepcopy(dict(claims)),
+                                    claims.header)
+            if len(self._tokens) > self._max_entries:
+                self._tokens.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._tokens.clear()
+
+
+tokens = _Tokens()
+
 
 class Auth(object):
     """Authentication class.
 
-    Luxon token / authentication provider. Uses JWT Tokens with RSA private
-    keys to sign tokens. Endpoints will require the public key to validate
-    token authenticity.
+    Luxon token / authentication provider. Uses JWT Tokens with RSA (RS256),
+    NIST P-256 (ES256) or Ed25519 (EdDSA) private keys to sign tokens.
+    Endpoints will require the public key to validate token authenticity.
 
     The keys should be stored in the application root. Usually where the
-    wsgi file is located.
+    wsgi file is located. Tokens are validated with the public key matching
+    the algorithm of the token, so public.pem may contain the keys of
+    multiple algorithms while rolling over.
 
-    Generate RSA Private/Public Key pairs:
-        luxon -r
+    Generate Private/Public Key pairs:
+        luxon -r --alg EdDSA
 
     Args:
         expire (int): Token life-span in seconds. (default 60 seconds)
+        algorithm (str): JWT algorithm for signing tokens. (default RS256)
     """
     __slots__ = ('_token',
                  '_token_expire',
                  '_header',
                  '_jwt',
-                 '_rsa_pub',
-                 '_rsa_prv',
+                 '_public_keys',
+                 '_private_keys',
+                 '_generation',
                  )
 
-    def __init__(self, expire=60):
-        def read_file(path):
-            with open(path, 'rb') as f:
-                return f.read()
-
+    def __init__(self, expire=60, algorithm='RS256'):
         # JWT Token header.
-        self._header = {'alg': 'RS256'}
+        self._header = {'alg': algorithm}
+
+        # Incremented when credentials change.
+        self._generation = 0
 
         # Create initial token dict.
         self.clear()
@@ -84,24 +226,24 @@ class Auth(object):
         # Token expiry.
         self._token_expire = expire
 
-        # Read private key.
-        if files.exists(g.app.path.rstrip('/') + '/private.pem'):
-            with open(g.app.path.rstrip('/') + '/private.pem', 'rb') as f:
-                self._rsa_prv = f.read()
-        else:
-            self._rsa_prv = None
-
-        # Read public key.
-        if files.exists(g.app.path.rstrip('/') + '/public.pem'):
-            with open(g.app.path.rstrip('/') + '/public.pem', 'rb') as f:
-                self._rsa_pub = f.read()
-        else:
-            self._rsa_pub = None
+        # Private and public keys, cached per process.
+        self._private_keys = _key(g.app.path.rstrip('/') + '/private.pem')
+        self._public_keys = _key(g.app.path.rstrip('/') + '/public.pem')
 
     def clear(self):
         """Clear authentication."""
         self._token = None
         self._jwt = None
+        self._generation += 1
+
+    @property
+    def generation(self):
+        """Counter incremented when the token, roles or scope change.
+
+        Used to detect credentials changing during a request, for example
+        to discard policy decisions.
+        """
+        return self._generation
 
     def validate(self):
         if self._jwt:
@@ -128,24 +270,33 @@ class Auth(object):
             raise TokenMissingError()
 
         if not self._token:
-            if self._rsa_prv:
-                return jwt.encode(self._header,
-                                  self._jwt,
-                                  self._rsa_prv)
-            else:
-                raise AccessDeniedError('No private key for signing JWT Token')
+            try:
+                key = self._private_keys[self._header['alg']]
+            except (TypeError, KeyError):
+                raise AccessDeniedError("No private key for signing '%s'"
+                                        " JWT Token" %
+                                        self._header['alg']) from None
+            return jwt.encode(self._header,
+                              self._jwt,
+                              key)
         else:
             return self._token
 
     @token.setter
     def token(self, token):
-        if not self._rsa_pub:
+        if not self._public_keys:
             raise AccessDeniedError('No public key for validating JWT Token')
 
         if token is not None:
+            self._generation += 1
             self._token = token
-            self._jwt = jwt.decode(token, self._rsa_pub)
-            self.validate()
+            self._jwt = tokens.get(token, self._public_keys)
+            if self._jwt is None:
+                self._jwt = jwt.decode(token, _verify_key(self._public_keys))
+                self.validate()
+                tokens.set(token, self._public_keys, self._jwt)
+            else:
+                self.validate()
 
     @property
     def json(self):
@@ -196,6 +347,7 @@ class Auth(object):
     @roles.setter
     def roles(self, value):
         self._token = None
+        self._generation += 1
         self.validate()
 
         if 'roles' not in self._jwt:
@@ -220,9 +372,16 @@ class Auth(object):
     @metadata.setter
     def metadata(self, value):
         self._token = None
+        self._generation += 1
         self.validate()
         self._jwt['metadata'] = value
 
+    @property
+    def expires(self):
+        """Epoch when token expires."""
+        if self._jwt:
+            return self._jwt.get('exp', None)
+
     @property
     def user_id(self):
         if self._jwt:
@@ -267,6 +426,7 @@ class Auth(object):
     @tenant_id.setter
     def tenant_id(self, value):
         self._token = None
+        self._generation += 1
         self.validate()
 
         if ('tenant_id' in self._jwt and
@@ -284,6 +444,7 @@ class Auth(object):
     @domain.setter
     def domain(self, value):
         self._token = None
+        self._generation += 1
         self.validate()
 
         if ('domain' in self._jwt and
@@ -2,3 +2,4 @@ from luxon.core.cache.cache import Cache
 from luxon.core.cache.memory import Memory
 from luxon.core.cache.rd import Redis
 from luxon.core.cache.nocache import NoCache
+from luxon.core.cache.tiered import Tiered
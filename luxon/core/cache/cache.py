@@ -53,6 +53,11 @@ class Cache(metaclass=Singleton):
                              max_objects,
                              max_object_size)
 
+    @property
+    def backend(self):
+        """Cache backend object. (e.g. luxon.core.cache.Memory)"""
+        return self._cached_backend
+
     def store(self, reference, obj, expire=60):
         """Store object
 
@@ -76,3 +81,11 @@ class Cache(metaclass=Singleton):
             object from cache
         """
         return self._cached_backend.load(reference)
+
+    def delete(self, reference):
+        """Delete Cached Object
+
+        Args:
+            reference (str): reference to object to be deleted
+        """
+        self._cached_backend.delete(reference)
@@ -27,13 +27,12 @@
 # CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
 # THE POSSIBILITY OF SUCH DAMAGE.
-import sys
 import pickle
-import collections
-from datetime import timedelta
+from time import monotonic
+from threading import Lock
+from collections import OrderedDict
 
 from luxon.core.logger import GetLogger
-from luxon.utils.timezone import now
 
 log = GetLogger(__name__)
 
@@ -41,24 +40,42 @@ log = GetLogger(__name__)
 class Memory(object):
     """LRU Memory Cache.
 
-    Least Recently Used cache.
+    Thread safe Least Recently Used cache.
 
-    Cache has a fixed capacity and discards the oldest entries. This is
-    specially useful if you have the need to control the cache memory usage.
+    Cache has a fixed capacity and discards the least recently used entries.
+    This is specially useful if you have the need to control the cache memory
+    usage. Both the number of objects and the total size of the pickled
+    objects stored are limited.
 
     Defaults are max_objects 5000 * max_obj_size of 50Kbytes is 250Mbyte.
 
     Its reasonable to assume a host has atleast 250Mbytes * each process.
+
+    Args:
+        max_objs (int): Maximum objects cached.
+        max_obj_size (int): Maximum size of pickled object in Kbytes.
+        max_size (int): Maximum total size of pickled objects in Kbytes.
+            (default max_objs * max_obj_size)
     """
-    def __init__(self, max_objs=5000, max_obj_size=50):
-        self._cache = collections.OrderedDict()
+    __slots__ = ('_cache', '_lock', '_max_objs', '_max_obj_size',
+                 '_max_size', '_size', '_hits', '_misses', '_evictions')
+
+    def __init__(self, max_objs=5000, max_obj_size=50, max_size=None):
+        if max_size is None:
+            max_size = max_objs * max_obj_size
+        self._cache = OrderedDict()
+        self._lock = Lock()
         self._max_objs = max_objs
         self._max_obj_size = 1024 * max_obj_size
-        max_mem = (max_obj_size * max_objs) / 1000
+        self._max_size = 1024 * max_size
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
         log.info('Memory Cache Initialized' +
-                 ' max_objs=%s' % (max_obj_size,) +
-                 ' max_obj_size=%sKbytes' % (max_objs,) +
-                 ' max_memory=%sMBytes' % (max_mem,))
+                 ' max_objs=%s' % (max_objs,) +
+                 ' max_obj_size=%sKbytes' % (max_obj_size,) +
+                 ' max_memory=%sMBytes' % (max_size / 1024,))
 
     def load(self, key):
         """Loads cached data from key
@@ -66,27 +83,89 @@ class Memory(object):
         Args:
             key (str): key for required data
         """
-        try:
-            value, expire = self._cache.pop(key)
-            if expire > now():
-                self._cache[key] = (value, expire,)
-                return pickle.loads(value)
-        except KeyError:
-            return None
-
-    def store(self, key, value, expire):
+        with self._lock:
+            try:
+                value, expire = self._cache[key]
+            except KeyError:
+                self._misses += 1
+                return None
+
+            if expire <= monotonic():
+                del self._cache[key]
+                self._size -= len(value)
+                self._misses += 1
+                return None
+
+            self._cache.move_to_end(key)
+            self._hits += 1
+
+        return pickle.loads(value)
+
+    def store(self, key, value, expire, pickled=False):
         """Stores data
 
         Args:
             key (str): key associated with cached data
             value (obj): data to be cached
             expire (int): time to expire (s)
+
+        Keyword Args:
+            pickled (bool): value is already pickled bytes.
+        """
+        if not pickled:
+            value = pickle.dumps(value)
+        size = len(value)
+        expire = monotonic() + expire
+
+        with self._lock:
+            try:
+                # NOTE(cfrademan): Always remove the previous value, its
+                # stale even if the new value is too large to cache.
+                self._size -= len(self._cache.pop(key)[0])
+            except KeyError:
+                pass
+
+            if size > self._max_obj_size or size > self._max_size:
+                return
+
+            while self._cache and (len(self._cache) >= self._max_objs or
+                                   self._size + size > self._max_size):
+                self._size -= len(self._cache.popitem(last=False)[1][0])
+                self._evictions += 1
+
+            self._cache[key] = (value, expire,)
+            self._size += size
+
+    def delete(self, key):
+        """Deletes data
+
+        Args:
+            key (str): key associated with cached data
         """
-        if sys.getsizeof(value, 0) <= self._max_obj_size:
+        with self._lock:
             try:
-                self._cache.pop(key)
+                self._size -= len(self._cache.pop(key)[0])
             except KeyError:
-                if len(self._cache) >= self._max_objs:
-                    self._cache.popitem(last=False)
-            self._cache[key] = (pickle.dumps(value),
-                                now() + timedelta(seconds=expire),)
+                pass
+
+    def clear(self):
+        """Clear cached data and counters."""
+        with self._lock:
+            self._cache.clear()
+            self._size = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def stats(self):
+        """Return dict of cache counters.
+
+        Includes hits, misses, evictions, number of objects and total bytes
+        of pickled objects cached.
+        """
+        with self._lock:
+            return {'hits': self._hits,
+                    'misses': self._misses,
+                    'evictions': self._evictions,
+                    'objects': len(self._cache),
+                    'bytes': self._size}
@@ -38,3 +38,6 @@ class NoCache(object):
 
     def store(self, key, value, expire):
         pass
+
+    def delete(self, key):
+        pass
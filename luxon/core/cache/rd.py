@@ -64,3 +64,12 @@ class Redis(object):
                 redis.set('cache:' + key,
                           value,
                           expire=expire)
+
+    def delete(self, key):
+        """Deletes data
+
+        Args:
+            key (str): key associated with cached data
+        """
+        with RedisHelper() as redis:
+            redis.delete('cache:' + key)
@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2020 Christiaan Frans Rademan <chris@fwiw.co.za>.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+import os
+import time
+import pickle
+from uuid import uuid4
+from threading import Lock, Thread
+
+from luxon import g
+from luxon.core.cache.memory import Memory
+from luxon.helpers.rd import Redis as RedisHelper
+from luxon.core.logger import GetLogger
+from luxon.exceptions import NoContextError
+
+log = GetLogger(__name__)
+
+# Redis pub/sub channel for invalidations.
+CHANNEL = 'cache:invalidate'
+
+
+class Tiered(object):
+    """Two tier cache, in-process Memory L1 over Redis L2.
+
+    Objects are loaded from the small short lived L1 cache of the process,
+    falling back to Redis. Stores and deletes are published on a Redis
+    pub/sub channel, so other processes drop their L1 copy.
+
+    The size and maximum seconds objects are kept in the L1 cache are set in
+    the *settings.ini* file:
+
+    .. code:: ini
+
+        [cache]
+        backend = luxon.core.cache:Tiered
+        l1_objects = 1000
+        l1_expire = 5
+
+    Args:
+        max_objs (int): Not used, limited by Redis.
+        max_obj_size (int): Maximum size of pickled object in Kbytes.
+        redis (callable): Returns context manager for Redis interface.
+            (default luxon.helpers.rd.Redis)
+    """
+    __slots__ = ('_l1', '_l1_expire', '_max_obj_size', '_redis', '_origin',
+                 '_pid', '_lock', '_hits', '_misses', '_invalidations')
+
+    def __init__(self, max_objs=None, max_obj_size=50, redis=RedisHelper):
+        try:
+            l1_objects = g.app.config.getint('cache', 'l1_objects',
+                                             fallback=1000)
+            self._l1_expire = g.app.config.getint('cache', 'l1_expire',
+                                                  fallback=5)
+        except (AttributeError, NoContextError):
+            l1_objects = 1000
+            self._l1_expire = 5
+        self._l1 = Memory(l1_objects, max_obj_size)
+        self._max_obj_size = 1024 * max_obj_size
+        self._redis = redis
+        self._lock = Lock()
+        self._pid = None
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+        log.info('Tiered Cache Initialized' +
+                 ' l1_objects=%s' % (l1_objects,) +
+                 ' l1_expire=%ss' % (self._l1_expire,) +
+                 ' max_obj_size=%sKbytes' % (max_obj_size,))
+
+    def _subscribe(self):
+        # NOTE(cfrademan): Subscriber thread started on first use in each
+        # process, since workers are usually forked after initialization.
+        pid = os.getpid()
+        if self._pid != pid:
+            with self._lock:
+                if self._pid != pid:
+                    self._l1.clear()
+                    self._origin = uuid4().hex
+                    Thread(target=self._listen,
+                           args=(self._origin,),
+                           daemon=True).start()
+                    self._pid = pid
+
+    def _listen(self, origin):
+        while True:
+            try:
+                with self._redis() as redis:
+                    for message in redis.subscribe(CHANNEL):
+                        if isinstance(message, bytes):
+                            message = message.decode('UTF-8')
+                        sender, key = message.split(' ', 1)
+                        if sender != origin:
+                            self._l1.delete(key)
+                            with self._lock:
+                                self._invalidations += 1
+            except Exception as e:
+                log.error('Cache invalidation subscriber failed %s:%s' %
+                          (e.__class__.__name__, e))
+                time.sleep(1)
+            # NOTE(cfrademan): Invalidations may have been missed while
+            # (re)connecting.
+            self._l1.clear()
+
+    def _publish(self, redis, key):
+        redis.publish(CHANNEL, self._origin + ' ' + key)
+
+    def load(self, key):
+        """Loads cached data from key
+
+        Args:
+            key (str): key for required data
+        """
+        self._subscribe()
+
+        value = self._l1.load(key)
+        if value is not None:
+            return value
+
+        with self._redis() as redis:
+            value = redis.get('cache:' + key, pickled=True)
+
+        with self._lock:
+            if value is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+
+        # NOTE(cfrademan): Pickled value from Redis is stored as is in L1.
+        self._l1.store(key, value, self._l1_expire, pickled=True)
+
+        return pickle.loads(value)
+
+    def store(self, key, value, expire):
+        """Stores data
+
+        Args:
+            key (str): key associated with cached data
+            value (obj): data to be cached
+            expire (int): time to expire (s)
+        """
+        self._subscribe()
+
+        # NOTE(cfrademan): Pickled once for size, Redis and L1.
+        value = pickle.dumps(value)
+        if len(value) > self._max_obj_size:
+            self.delete(key)
+            return
+
+        with self._redis() as redis:
+            redis.set('cache:' + key, value, expire=expire, pickled=True)
+            self._publish(redis, key)
+
+        self._l1.store(key, value, min(expire, self._l1_expire),
+                       pickled=True)
+
+    def delete(self, key):
+        """Deletes data
+
+        Args:
+            key (str): key associated with cached data
+        """
+        self._subscribe()
+
+        self._l1.delete(key)
+        with self._redis() as redis:
+            redis.delete('cache:' + key)
+            self._publish(redis, key)
+
+    def stats(self):
+        """Return dict of cache counters per tier.
+
+        'l1' contains the Memory.stats() of the process L1 cache, 'l2' the
+        Redis hits and misses for L1 misses, and 'invalidations' the number of
+        L1 entries dropped by other processes. Each tier includes its
+        'hit_ratio'.
+        """
+        l1 = self._l1.stats()
+        l1_total = l1['hits'] + l1['misses']
+        l1['hit_ratio'] = l1['hits'] / l1_total if l1_total else 0.0
+
+        with self._lock:
+            l2_total = self._hits + self._misses
+            l2 = {'hits': self._hits,
+                  'misses': self._misses,
+                  'hit_ratio': self._hits / l2_total if l2_total else 0.0}
+            invalidations = self._invalidations
+
+        return {'l1': l1, 'l2': l2, 'invalidations': invalidations}
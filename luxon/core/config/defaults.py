@@ -48,6 +48,7 @@ defaults = {
     },
     'tokens': {
         'expire': '3600',
+        'algorithm': 'RS256',
     },
     'sessions': {
         'expire': '86400',
@@ -57,6 +58,13 @@ defaults = {
     'database': {
         'type': 'sqlite3',
         'host': '127.0.0.1',
+        'pool_size': '64',
+        'max_overflow': '0',
+        'pool_timeout': '0',
+        'pool_min_size': '0',
+        'pool_ping_idle': '30',
+        'pool_max_lifetime': '0',
+        'pool_max_idle': '0',
     },
     'redis': {
         'db': '0',
@@ -69,5 +77,30 @@ defaults = {
         'backend': 'luxon.core.cache:Memory',
         'max_objects': '5000',
         'max_object_size': '50',
+        'responses': 'False',
+        'l1_objects': '1000',
+        'l1_expire': '5',
+    },
+    'json': {
+        'backend': 'auto',
+        'indent': '0',
+    },
+    'form': {
+        'spool_size': '1048576',
+        'max_field_size': '1048576',
+        'max_file_size': '0',
+        'max_size': '0',
+    },
+    'asgi': {
+        'threads': '32',
+    },
+    'policy': {
+        'cache': 'False',
+    },
+    'timing': {
+        'enabled': 'False',
+        'server_timing': 'False',
+        'route': '',
+        'tag': 'internal',
     },
 }
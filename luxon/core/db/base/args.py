@@ -29,6 +29,8 @@
 # SUCH DAMAGE.
 
 import re
+from threading import Lock
+from collections import OrderedDict
 from ipaddress import IPv4Address, IPv6Address
 from decimal import Decimal
 from datetime import datetime
@@ -50,99 +52,176 @@ numeric_re_match = re.compile(numeric_re, re.IGNORECASE)
 pyformat_re_match = re.compile(pyformat_re, re.IGNORECASE)
 
 
-def _parse_param(value, cast_map):
-    """Parse SQL paramters provided to query.
-    """
+# Statement plans by (query, to).
+_plans = OrderedDict()
+_plans_lock = Lock()
+_plans_size = 1024
+
+# Parameter converters by (type, cast).
+_converters = {}
+
+
+def _identity(value):
+    return value
+
+
+def _callable(value):
+    value = value()
+    if isinstance(value, (Decimal, int, float, str, bytes, datetime)):
+        return value
+    else:
+        return str(value)
+
+
+def _converter(value, cast_map):
+    """Return converter for type of value as per _parse_param."""
+    key = (type(value), cast_map)
+    try:
+        return _converters[key]
+    except KeyError:
+        pass
+
     if isinstance(value, bool):
-        if value is True:
-            return 1
-        else:
-            return 0
+        converter = int
     elif isinstance(value, datetime):
-        return to_utc(value)
+        converter = to_utc
     elif isinstance(value, (IPv4Address, IPv6Address,)):
-        return value.packed
+        def converter(value):
+            return value.packed
     elif hasattr(value, '__call__'):
-        value = value()
-        if isinstance(value, (Decimal, int, float, str, bytes, datetime)):
-            return value
-        else:
-            return str(value)
+        converter = _callable
+    else:
+        converter = _identity
+        for cast in cast_map or ():
+            if isinstance(value, cast[0]):
+                converter = cast[1]
+                break
 
-    for cast in cast_map:
-        if isinstance(value, cast[0]):
-            return cast[1](value)
+    if len(_converters) < 4096:
+        _converters[key] = converter
+    return converter
 
-    return value
 
+class _Plan(object):
+    """Rewritten query and binding plan of statement.
 
-def args_to(query, args, to='qmark', cast=None):
-    if isinstance(args, tuple):
-        args = list(args)
-    if not isinstance(args, (list, dict)):
-        if args is None:
-            return (query, args)
-        args = [args, ]
-    else:
-        args = args.copy()
+    Attributes:
+        query (str): Query in destination format.
+        columns (tuple): Key of each placeholder in order, the column name
+            for pyformat and named placeholders or the placeholder itself.
+        names (tuple): Key of each value for named and pyformat destination,
+            positional placeholders are named by position as 'p0', 'p1'..
+        dict_only (str): Type of first placeholder requiring dict args.
+    """
+    __slots__ = ('query', 'columns', 'names', 'dict_only')
+
+    def __init__(self, query, to):
+        columns = []
+        names = []
+        self.dict_only = None
+
+        def replace(match):
+            expr = match.group(0)
+            if pyformat_re_match.match(expr):
+                column = expr[2:][:-2]
+                if self.dict_only is None:
+                    self.dict_only = 'pyformat'
+            elif named_re_match.match(expr):
+                column = expr[1:]
+                if self.dict_only is None:
+                    self.dict_only = 'named'
+            else:
+                column = None
+
+            name = column or 'p%s' % len(columns)
+            columns.append(column or expr)
+            names.append(name)
 
-    if to == "qmark" or to == "numeric" or to == "format":
-        new_args = []
-    else:
-        new_args = {}
-
-    counter = 0
-    expressions = interpolation_format_match.findall(query)
-    for expr in expressions:
-        if pyformat_re_match.match(expr):
-            if not isinstance(args, dict):
-                raise TypeError('Can only match pyformat using dict args')
-            column = expr[2:][:-2]
-        elif named_re_match.match(expr):
-            if not isinstance(args, dict):
-                raise TypeError('Can only match named using dict args')
-            column = expr[1:]
-        else:
-            column = expr
-        try:
             if to == "qmark":
-                query = query.replace(expr, '?', 1)
-                if isinstance(args, dict):
-                    new_args.append(_parse_param(args[column], cast))
-                else:
-                    new_args.append(_parse_param(args.pop(0), cast))
+                expr = '?'
             elif to == "numeric":
-                query = query.replace(expr, ':%s' % counter, 1)
-                if isinstance(args, dict):
-                    new_args.append(_parse_param(args[column], cast))
-                else:
-                    new_args.append(_parse_param(args.pop(0), cast))
-                counter += 1
+                expr = ':%s' % (len(columns) - 1)
             elif to == "named":
-                query = query.replace(expr, ':%s' % column, 1)
-                if isinstance(args, dict):
-                    new_args.append(_parse_param(args[column], cast))
-                else:
-                    new_args.append(_parse_param(args.pop(0), cast))
+                expr = ':%s' % name
             elif to == "format":
-                query = query.replace(expr, '%s', 1)
-                if isinstance(args, dict):
-                    new_args.append(_parse_param(args[column], cast))
-                else:
-                    new_args.append(_parse_param(args.pop(0), cast))
+                expr = '%s'
             elif to == "pyformat":
-                query = query.replace(expr, '%' + '(%s)s' % column, 1)
-                if isinstance(args, dict):
-                    new_args.append(_parse_param(args[column], cast))
-                else:
-                    new_args.append(_parse_param(args.pop(0), cast))
+                expr = '%' + '(%s)s' % name
             else:
-                raise ValueError("Unknown type '%s'" % type) from None
+                raise ValueError("Unknown type '%s'" % to) from None
+
+            return expr
+
+        self.query = interpolation_format_match.sub(replace, query)
+        self.columns = tuple(columns)
+        self.names = tuple(names)
+
+
+def _plan(query, to):
+    key = (query, to)
+    with _plans_lock:
+        try:
+            plan = _plans[key]
+            _plans.move_to_end(key)
+            return plan
         except KeyError:
-            raise KeyError("DB Query: Field '%s' value not in" % column +
+            pass
+
+    plan = _Plan(query, to)
+
+    with _plans_lock:
+        _plans[key] = plan
+        if len(_plans) > _plans_size:
+            _plans.popitem(last=False)
+
+    return plan
+
+
+def args_to(query, args, to='qmark', cast=None):
+    """Convert query and args to destination paramstyle.
+
+    The rewritten query and placeholder keys are cached in a bounded LRU
+    keyed on (query, to), leaving one pass over the arguments per call.
+
+    Args:
+        query (str): SQL Query with placeholders in any paramstyle.
+        args (list/tuple/dict): Values for placeholders.
+        to (str): Destination paramstyle.
+        cast (tuple): Tuple of (type, callable) to cast values.
+
+    Returns tuple of (query, args).
+    """
+    if args is None:
+        return (query, args)
+    if not isinstance(args, (list, tuple, dict)):
+        args = [args, ]
+
+    plan = _plan(query, to)
+    columns = plan.columns
+
+    if isinstance(args, dict):
+        try:
+            values = [args[column] for column in columns]
+        except KeyError as e:
+            raise KeyError("DB Query: Field '%s' value not in" % e.args[0] +
                            " dictionary provided") from None
-        except IndexError:
+    else:
+        if plan.dict_only is not None:
+            raise TypeError('Can only match %s using dict args' %
+                            plan.dict_only)
+        if len(args) < len(columns):
             raise IndexError("DB Query: Not all field" +
                              " values provided") from None
+        values = args[:len(columns)]
+
+    new_args = []
+    for value in values:
+        try:
+            new_args.append(_converters[(type(value), cast)](value))
+        except KeyError:
+            new_args.append(_converter(value, cast)(value))
+
+    if to == "named" or to == "pyformat":
+        new_args = dict(zip(plan.names, new_args))
 
-    return (query, new_args)
+    return (plan.query, new_args)
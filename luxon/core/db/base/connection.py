@@ -88,6 +88,8 @@ class Connection(BaseExeptions):
     DEST_FORMAT = None
     ERROR_MAP = error_map
     CAST_MAP = cast_map
+    # Description type codes of datetime columns, None if not described.
+    DATETIME_TYPES = None
     _crsr_cls_args = []
     THREADSAFETY = threadsafety
     _instances = {}
@@ -107,14 +109,17 @@ class Connection(BaseExeptions):
             self._conn = self.DB_API.connect(*args, **kwargs)
             self._cached_crsr = None
             self._crsr_cls = None
+            self._stream_crsr_cls = None
             self._cursors = []
+            # Reads executed since transaction ended.
+            self._reads = False
         except Exception as e:
             self._error_handler(self, e, self.ERROR_MAP)
 
     def __repr__(self):
         return str(self)
 
-    def cursor(self):
+    def cursor(self, stream=False):
         """Return a new Cursor Object using the connection.
 
         If the database does not provide a direct cursor concept, the module
@@ -122,8 +127,11 @@ class Connection(BaseExeptions):
         this specification.
 
         Reference PEP-0249
+
+        Keyword Args:
+            stream (bool): Return unbuffered cursor, see execute().
         """
-        crsr = Cursor(self)
+        crsr = Cursor(self, stream=stream)
         self._cursors.append(crsr)
         return crsr
 
@@ -147,7 +155,7 @@ class Connection(BaseExeptions):
         """
         raise NotImplementedError()
 
-    def execute(self, *args, **kwargs):
+    def execute(self, *args, stream=False, **kwargs):
         """Prepare and execute a database operation (query or command).
 
         This method is for conveniance and non-standard.
@@ -177,8 +185,19 @@ class Connection(BaseExeptions):
         always return a list of rows being dictionary of column/key values in
         this "IMPLEMENTATION".
 
+        With stream a new unbuffered cursor is returned, rows are read from
+        the server while iterating or using fetchmany. No other queries can
+        run on the connection until the cursor is exhausted or closed, thus
+        use it as a context manager.
+
         Reference PEP-0249
+
+        Keyword Args:
+            stream (bool): Execute on new unbuffered cursor.
         """
+        if stream:
+            return self.cursor(stream=True).execute(*args, **kwargs)
+
         return self._crsr.execute(*args, **kwargs)
 
     def has_table(self, table):
@@ -209,14 +228,26 @@ class Connection(BaseExeptions):
             # MYSQL USES THIS ONE?
             return False
 
-    def insert(self, table, data):
+    def insert(self, table, data, batch_size=1000):
         """Insert data into table.
 
         Args:
             table (str): Table name.
             data (list): List of rows containing values.
+
+        Keyword Args:
+            batch_size (int): Maximum rows per executemany.
         """
-        self._crsr.insert(table, data)
+        self._crsr.insert(table, data, batch_size=batch_size)
+
+    def executemany(self, *args, **kwargs):
+        """Prepare and execute a database operation against all parameters.
+
+        This method is for conveniance and non-standard.
+
+        See Cursor.executemany().
+        """
+        return self._crsr.executemany(*args, **kwargs)
 
     def clean_up(self):
         """Cleanup server Session.
@@ -232,6 +263,12 @@ class Connection(BaseExeptions):
             self._cursors.remove(crsr)
             crsr.clean_up()
 
+        if self._reads is True:
+            # NOTE(cfrademan): Reads are not uncommited on cursors, ends
+            # the snapshot for the next request.
+            self._conn.rollback()
+            self._reads = False
+
     def close(self):
         """Close the connection
 
@@ -271,7 +308,17 @@ class Connection(BaseExeptions):
 
         Reference PEP-0249
         """
-        self._crsr.commit()
+        # NOTE(cfrademan): Committed through Cursor.commit for logging, the
+        # driver commit covers the connection and so all its cursors.
+        # Otherwise the driver connection is committed, ending any
+        # snapshot and work done through driver cursors.
+        for crsr in self._cursors:
+            if crsr._uncommited is True:
+                crsr.commit()
+                break
+        else:
+            self._conn.commit()
+            self._reads = False
 
     def rollback(self):
         """Rollback current transaction.
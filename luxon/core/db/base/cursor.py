@@ -30,12 +30,15 @@
 from luxon import g
 from luxon.core.logger import GetLogger
 from luxon.core.db.base.args import args_to
-from luxon.core.db.base.parse import parse_row
+from luxon.core.db.base.parse import Parser
 from luxon.core.db.base.exceptions import Exceptions as BaseExeptions
 from luxon.utils.timer import Timer
 
 log = GetLogger(__name__)
 
+# Rows fetched from driver per batch while iterating.
+_ITER_BATCH = 1000
+
 
 def _log(cursor, msg, elapsed=0, values=None):
     """Debug Log Function
@@ -58,15 +61,52 @@ def _log(cursor, msg, elapsed=0, values=None):
     log.debug(log_msg, timer=elapsed)
 
 
+def _insert_query(table, columns):
+    """Return INSERT statement for table.
+
+    Args:
+        table (str): Table name.
+        columns (tuple/int): Column names or number of values.
+    """
+    if isinstance(columns, tuple):
+        query = "INSERT INTO %s (" % table
+        query += ','.join(columns)
+        query += ')'
+        count = len(columns)
+    else:
+        query = "INSERT INTO %s" % table
+        count = columns
+
+    query += ' VALUES'
+    query += ' ('
+    query += ','.join(['%s'] * count)
+    query += ')'
+    return query
+
+
 class Cursor(BaseExeptions):
-    def __init__(self, conn):
+    """Database Cursor.
+
+    Args:
+        conn (obj): Luxon Connection object.
+
+    Keyword Args:
+        stream (bool): Use unbuffered driver cursor if availible, rows are
+            read from the server as fetched rather than on execute.
+    """
+    def __init__(self, conn, stream=False):
         try:
             self._conn = conn
-            self._crsr = conn._crsr_cls(*conn._crsr_cls_args)
+            if stream and conn._stream_crsr_cls is not None:
+                self._crsr = conn._stream_crsr_cls(*conn._crsr_cls_args)
+            else:
+                self._crsr = conn._crsr_cls(*conn._crsr_cls_args)
+            self._stream = stream
             self._uncommited = False
             self.arraysize = 1
             self._rownumber = 0
             self._executed = False
+            self._parser = None
             try:
                 self._debug = g.app.debug
             except AttributeError:
@@ -88,6 +128,14 @@ class Cursor(BaseExeptions):
     def description(self):
         return self._crsr.description
 
+    @property
+    def parser(self):
+        """Row conversion plan for current result set."""
+        if self._parser is None:
+            self._parser = Parser(self._crsr.description,
+                                  self._conn.DATETIME_TYPES)
+        return self._parser
+
     @property
     def rowcount(self):
         return self._crsr.rowcount
@@ -164,12 +212,14 @@ class Cursor(BaseExeptions):
 
         Reference PEP-0249
         """
+        if self._executed is False:
+            raise self.ProgrammingError('No data, use execute method first')
         while True:
-            value = self.fetchone()
-            if value is not None:
-                yield parse_row(value)
-            else:
+            rows = self._crsr.fetchmany(_ITER_BATCH)
+            if not rows:
                 break
+            self._rownumber += len(rows)
+            yield from self.parser.rows(rows)
 
     def execute(self, query, args=None):
         """Prepare and execute a database operation (query or command).
@@ -203,6 +253,7 @@ class Cursor(BaseExeptions):
         """
         with Timer() as elapsed:
             self._rownumber = 0
+            self._parser = None
             try:
                 if args is not None and not isinstance(args, (dict,
                                                               list,
@@ -213,13 +264,17 @@ class Cursor(BaseExeptions):
                                       self._conn.CAST_MAP)
                 if self._debug:
                     _log(self, "Start " + query, elapsed(), values=args)
-                if args is not None:
+                self._executed = True
+                if self._stream or query.lstrip()[:6].upper() == 'SELECT':
+                    # NOTE(cfrademan): Reads are not uncommited, closing
+                    # the cursor never rolls back the transaction of the
+                    # connection. Connection.clean_up ends the snapshot.
+                    self._conn._reads = True
+                else:
                     self._uncommited = True
-                    self._executed = True
+                if args is not None:
                     self._crsr.execute(query, args)
                 else:
-                    self._uncommited = True
-                    self._executed = True
                     self._crsr.execute(query)
                 return self
             except Exception as e:
@@ -231,9 +286,6 @@ class Cursor(BaseExeptions):
     def executemany(self, query, params):
         """Pepare and Execute Many.
 
-        Warning:
-            !!! NOT IMPLEMENTED !!!
-
         Prepare a database operation (query or command) and then execute it
         against all parameter sequences or mappings found in the sequence
         seq_of_parameters.
@@ -252,9 +304,46 @@ class Cursor(BaseExeptions):
 
         Return values are not defined.
 
+        The parameters are converted and passed to the executemany of the
+        driver in one call. For example sqlite3 executes the prepared
+        statement for all parameters and pymysql rewrites INSERT statements
+        into multi-row VALUES.
+
         Reference PEP-0249
         """
-        raise NotImplementedError()
+        with Timer() as elapsed:
+            self._rownumber = 0
+            self._parser = None
+            converted = []
+            try:
+                for args in params:
+                    if args is not None and not isinstance(args, (dict,
+                                                                  list,
+                                                                  tuple)):
+                        args = [args]
+
+                    crsr_query, args = args_to(query, args,
+                                               self._conn.DEST_FORMAT,
+                                               self._conn.CAST_MAP)
+                    converted.append(args)
+
+                if not converted:
+                    return self
+
+                query = crsr_query
+                if self._debug:
+                    _log(self, "Start " + query, elapsed(),
+                         values='%s rows' % len(converted))
+                self._uncommited = True
+                self._executed = True
+                self._crsr.executemany(query, converted)
+                return self
+            except Exception as e:
+                self._error_handler(self, e, self._conn.ERROR_MAP)
+            finally:
+                if self._debug and converted:
+                    _log(self, "Completed " + query, elapsed(),
+                         values='%s rows' % len(converted))
 
     def fetchone(self):
         """Fetch row.
@@ -269,12 +358,11 @@ class Cursor(BaseExeptions):
         """
         if self._executed is False:
             raise self.ProgrammingError('No data, use execute method first')
-        try:
-            row = parse_row(dict(self._crsr.fetchone()))
-            self._rownumber += 1
-            return row
-        except TypeError:
+        row = self._crsr.fetchone()
+        if row is None:
             return None
+        self._rownumber += 1
+        return self.parser.row(row)
 
     def fetchmany(self, size=None):
         """Fetch many rows.
@@ -299,11 +387,12 @@ class Cursor(BaseExeptions):
 
         Reference PEP-0249
         """
-        many = []
+        if self._executed is False:
+            raise self.ProgrammingError('No data, use execute method first')
         if size is None:
             size = self.arraysize
-        for a in range(size):
-            many.append(self.fetchone())
+        many = self.parser.rows(self._crsr.fetchmany(size))
+        self._rownumber += len(many)
         return many
 
     def fetchall(self):
@@ -318,9 +407,10 @@ class Cursor(BaseExeptions):
 
         Reference PEP-0249
         """
-        all = []
-        for a in self:
-            all.append(a)
+        if self._executed is False:
+            raise self.ProgrammingError('No data, use execute method first')
+        all = self.parser.rows(self._crsr.fetchall())
+        self._rownumber += len(all)
         return all
 
     def nextset(self):
@@ -430,14 +520,14 @@ class Cursor(BaseExeptions):
                 try:
                     self._crsr.commit()
                 except AttributeError:
-                    try:
-                        self._conn.commit()
-                    except AttributeError:
-                        self._conn._conn.commit()
+                    self._conn._conn.commit()
 
             if self._debug:
                 _log(self, "Commit", elapsed())
             self._uncommited = False
+            self._conn._reads = False
+            for crsr in self._conn._cursors:
+                crsr._uncommited = False
 
     def rollback(self):
         """Rollback Transactional Queries
@@ -454,40 +544,49 @@ class Cursor(BaseExeptions):
                     self._conn._conn.rollback()
             if self._debug:
                 _log(self, "Rollback", elapsed())
+            self._conn._reads = False
 
-    def insert(self, table, data):
+    def insert(self, table, data, batch_size=1000):
         """Insert data into table.
 
+        Consecutive rows with the same columns are inserted in batches using
+        executemany, building the INSERT statement once per set of columns.
+
         Args:
             table (str): Table name.
             data (list): List of rows containing values.
+
+        Keyword Args:
+            batch_size (int): Maximum rows per executemany.
         """
         if data is not None:
+            query = None
+            columns = None
+            batch = []
+
             for row in data:
                 if isinstance(row, dict):
-                    query = "INSERT INTO %s (" % table
-                    query += ','.join(row.keys())
-                    query += ')'
-                    query += ' VALUES'
-                    query += ' ('
-                    placeholders = []
-                    for ph in range(len(row)):
-                        placeholders.append('%s')
-                    query += ','.join(placeholders)
-                    query += ')'
-                    self.execute(query, list(row.values()))
+                    row_columns = tuple(row.keys())
+                    values = list(row.values())
                 elif isinstance(row, (list, tuple)):
-                    query = "INSERT INTO %s" % table
-                    query += ' VALUES'
-                    query += ' ('
-                    placeholders = []
-                    for ph in range(len(row)):
-                        placeholders.append('%s')
-                    query += ','.join(placeholders)
-                    query += ')'
-                    self.execute(query, list(row))
+                    row_columns = len(row)
+                    values = list(row)
                 else:
-                    pass
+                    continue
+
+                if row_columns != columns or len(batch) >= batch_size:
+                    if batch:
+                        self.executemany(query, batch)
+                        batch = []
+                    if row_columns != columns:
+                        columns = row_columns
+                        query = _insert_query(table, columns)
+
+                batch.append(values)
+
+            if batch:
+                self.executemany(query, batch)
+
             self.commit()
 
     def __enter__(self):
@@ -31,6 +31,16 @@
 from datetime import datetime
 from luxon.utils.timezone import to_utc, TimezoneUTC
 
+_utc = TimezoneUTC()
+
+
+def _to_utc(value):
+    # NOTE(cfrademan): Naive values are stored as UTC, same as to_utc with
+    # UTC fallback without the conversion overhead.
+    if value.tzinfo is None:
+        return value.replace(tzinfo=_utc)
+    return to_utc(value)
+
 
 def parse_row(row):
     """Parse SQL columsn returned.
@@ -41,3 +51,109 @@ def parse_row(row):
                 row[column] = to_utc(row[column], fallback=TimezoneUTC())
 
     return row
+
+
+class Parser(object):
+    """Conversion plan for rows of result set.
+
+    The plan is built once per result set from the cursor description. Only
+    columns holding datetime values are normalised to UTC, all other columns
+    are never inspected.
+
+    When the driver provides no column types (e.g. SQLite3) each column is
+    probed once, using the type of the first value that is not NULL.
+
+    Duplicate column names, for example when joining tables, hold the value
+    of the first column with the name.
+
+    Args:
+        description (tuple): PEP-0249 cursor description.
+        datetime_types (tuple): Description type codes for datetime columns.
+            None if the driver does not describe column types.
+    """
+    __slots__ = ('_columns', '_first', '_convert', '_pending')
+
+    def __init__(self, description, datetime_types=None):
+        self._columns = tuple(column[0] for column in description)
+        if len(set(self._columns)) < len(self._columns):
+            # NOTE(cfrademan): Index of first column per name, zip would
+            # keep the value of the last.
+            first = {}
+            for index, column in enumerate(self._columns):
+                first.setdefault(column, index)
+            self._first = tuple(first.items())
+            self._columns = tuple(first)
+        else:
+            self._first = None
+        if datetime_types is not None:
+            self._convert = tuple(column[0] for column in description
+                                  if column[1] in datetime_types)
+            self._pending = None
+        else:
+            self._convert = ()
+            self._pending = self._columns
+
+    def _probe(self, row):
+        pending = []
+        convert = list(self._convert)
+        for column in self._pending:
+            value = row[column]
+            if value is None:
+                pending.append(column)
+            elif isinstance(value, datetime):
+                convert.append(column)
+        self._convert = tuple(convert)
+        self._pending = tuple(pending) or None
+
+    def row(self, row):
+        """Return row as dict of column values.
+
+        Args:
+            row (tuple/dict): Row from driver cursor.
+        """
+        if not isinstance(row, dict):
+            if self._first is None:
+                row = dict(zip(self._columns, row))
+            else:
+                row = {column: row[index] for column, index in self._first}
+
+        if self._pending:
+            self._probe(row)
+
+        for column in self._convert:
+            value = row[column]
+            if isinstance(value, datetime):
+                row[column] = _to_utc(value)
+
+        return row
+
+    def rows(self, rows):
+        """Return list of rows as dicts of column values.
+
+        Args:
+            rows (list): Rows from driver cursor.
+        """
+        columns = self._columns
+        first = self._first
+        if rows and not isinstance(rows[0], dict):
+            if first is None:
+                rows = [dict(zip(columns, row)) for row in rows]
+            else:
+                rows = [{column: row[index] for column, index in first}
+                        for row in rows]
+        else:
+            rows = list(rows)
+
+        if self._pending:
+            for row in rows:
+                self._probe(row)
+                if not self._pending:
+                    break
+
+        for column in self._convert:
+            for row in rows:
+                value = row[column]
+                if isinstance(value, datetime):
+                    row[column] = _to_utc(value)
+
+        return rows
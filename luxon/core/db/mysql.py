@@ -28,7 +28,7 @@
 # WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF
 # SUCH DAMAGE.
 import pymysql
-from pymysql.constants import COMMAND
+from pymysql.constants import COMMAND, FIELD_TYPE
 
 from luxon.core.db.base.connection import Connection as BaseConnection
 
@@ -95,6 +95,7 @@ class Connection(BaseConnection):
     DB_API = pymysql
     ERROR_MAP = error_map
     CAST_MAP = cast_map
+    DATETIME_TYPES = (FIELD_TYPE.DATETIME, FIELD_TYPE.TIMESTAMP)
     DEST_FORMAT = 'format'
     THREADSAFETY = threadsafety
 
@@ -104,6 +105,7 @@ class Connection(BaseConnection):
         super().__init__(host=host, user=username, passwd=password,
                          db=database, port=port)
         self._crsr_cls = pymysql.cursors.DictCursor
+        self._stream_crsr_cls = pymysql.cursors.SSDictCursor
         self._crsr_cls_args = [self._conn]
         self.execute('SET time_zone = %s', '+00:00')
         self._crsr._uncommited = False
@@ -137,24 +139,6 @@ class Connection(BaseConnection):
                 self._crsr._executed = False
                 return False
 
-    def commit(self):
-        """Commit Transactionl Queries.
-
-        Commit any pending transaction to the database.
-
-        Note that if the database supports an auto-commit feature, this
-        must be initially off. An interface method may be provided to
-        turn it back on.
-
-        Database modules that do not support transactions should implement
-        this method with void functionality.
-
-        Reference PEP-0249
-        """
-        self._conn.commit()
-        for crsr in self._cursors:
-            crsr._uncommited = False
-
 
 def connect(*args, **kwargs):
     """Constructor for creating a connection to the database.
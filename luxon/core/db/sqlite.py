@@ -97,7 +97,8 @@ class Connection(BaseConnection):
         super().__init__(db, detect_types=sqlite3.PARSE_DECLTYPES)
         self._crsr_cls = getattr(self._conn, 'cursor')
         self._db = db
-        self._conn.row_factory = sqlite3.Row
+        # NOTE(cfrademan): Rows are returned as tuples and converted using
+        # the cursor description, see luxon.core.db.base.parse.Parser.
         self.execute('PRAGMA foreign_keys = ON;')
 
     def __str__(self):
@@ -29,10 +29,16 @@
 # THE POSSIBILITY OF SUCH DAMAGE.
 
 from luxon.exceptions import NoContextError
-from luxon.structs.threaddict import ThreadDict
 
+try:
+    from luxon.structs.contextdict import ContextDict as LocalDict
+except ImportError:
+    # NOTE(cfrademan): Python 3.6 has no contextvars, only threads have
+    # unique context.
+    from luxon.structs.threaddict import ThreadDict as LocalDict
 
-_thread_globals = ThreadDict()
+
+_thread_globals = LocalDict()
 _thread_items = ('current_request', )
 
 _context_items = ('current_request',
@@ -56,6 +62,12 @@ class Globals(object):
     def __init__(self):
         self.__dict__ = _globals
 
+    def __setattr__(self, attr, value):
+        if attr in _thread_items:
+            _thread_globals[attr] = value
+        else:
+            _globals[attr] = value
+
     def __delattr__(self, attr):
         try:
             del _thread_globals[attr]
@@ -88,3 +100,13 @@ class Globals(object):
 
 # All globals.... luxon.g = Application wide context.
 luxon_globals = Globals()
+
+
+def isolate():
+    """Use new unique context for current asyncio task.
+
+    Tasks run in a copy of the context they were created in. References such
+    as 'current_request' set within the task would otherwise be shared with
+    other tasks created in the same context.
+    """
+    _thread_globals.isolate()
@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2020 Christiaan Frans Rademan <chris@fwiw.co.za>.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+import asyncio
+import traceback
+from functools import partial
+from inspect import iscoroutinefunction
+from contextvars import copy_context
+from tempfile import SpooledTemporaryFile
+from concurrent.futures import ThreadPoolExecutor
+
+from luxon import g
+from luxon.core.globals import isolate
+from luxon.core.handlers.wsgi.application import Application as Wsgi
+from luxon.core.handlers.wsgi.timing import RequestTiming
+from luxon.core.handlers.asgi.request import Request
+from luxon.core.handlers.asgi.response import Response
+from luxon.exceptions import NotFoundError
+from luxon.core.logger import GetLogger
+from luxon.utils.timer import Timer
+
+log = GetLogger(__name__)
+
+
+def _middleware(middleware, request, response):
+    # Process resource middleware in thread pool.
+    for func in middleware:
+        func(request, response)
+
+
+class Application(Wsgi):
+    """This class is part of the main entry point into the application.
+
+    Each instance provides a callable interface for ASGI HTTP connections.
+
+    Routing, middleware, policies and caching are the same as the WSGI
+    application. Views defined with 'async def' are awaited on the event
+    loop. Routing, policies, middleware, cache and encoding as well as
+    other views run in a bounded thread pool, since they may block on
+    tokens, cache or database.
+
+    Args:
+        name (str): Unique Name for application. Use __name__ of module to
+            ensure root path for application can be found conveniantly.
+
+    Keyword Arguments:
+        app_root (str): Path to application root. (e.g. The location of
+            'settings.ini', 'policy.json' and overiding 'templates')
+    """
+    # Request payload larger than spool size is buffered in temporary file.
+    _SPOOL_SIZE = 1024 * 1024  # 1 MiB
+
+    def __init__(self, name, path=None, ini=None, content_type=None):
+        super().__init__(name, path, ini, content_type)
+        threads = g.app.config.getint('asgi', 'threads', fallback=32)
+        self._executor = ThreadPoolExecutor(max_workers=threads)
+
+    async def run(self, func, *args, **kwargs):
+        """Run function in thread pool.
+
+        The function runs in the context of the current task, providing
+        references such as 'current_request'.
+        """
+        context = copy_context()
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, partial(context.run, func, *args, **kwargs))
+
+    async def receive(self, receive):
+        """Receive request payload.
+
+        Returns:
+            file: Request payload.
+        """
+        body = SpooledTemporaryFile(max_size=self._SPOOL_SIZE)
+        while True:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                break
+            body.write(message.get('body', b''))
+            if not message.get('more_body'):
+                break
+        body.seek(0)
+        return body
+
+    async def lifespan(self, receive, send):
+        """Handle ASGI lifespan protocol.
+
+        Dispatch plans are frozen on startup and thread pool shutdown when
+        the server shuts down.
+        """
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                self.freeze()
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                self._executor.shutdown(wait=False)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def __call__(self, scope, receive, send):
+        """Application Request Interface.
+
+        A clean request and response object is provided to the interface that
+        is unique this to this task.
+        """
+        if scope['type'] == 'lifespan':
+            return await self.lifespan(receive, send)
+
+        if scope['type'] != 'http':
+            raise NotImplementedError("ASGI '%s' not supported" %
+                                      scope['type'])
+
+        # NOTE(cfrademan): Each connection gets its own context, the
+        # 'current_request' is not shared with other tasks.
+        isolate()
+
+        body = await self.receive(receive)
+
+        # NOTE(cfrademan): Request timing is None when disabled, only
+        # checked after each phase.
+        timing = None
+        request = None
+
+        try:
+            with Timer() as elapsed:
+                try:
+                    if self._timing:
+                        timing = RequestTiming()
+
+                    # Request Object.
+                    request = g.current_request = Request(scope, body)
+
+                    # Response Object.
+                    response = Response(scope, send)
+
+                    # Set Response object for request.
+                    request.response = response
+
+                    # Route request.
+                    (resource, r_kwargs, target,
+                     plan, version, cached) = await self.run(self.route,
+                                                             request,
+                                                             response,
+                                                             timing)
+
+                    # Execute Routed View.
+                    # NOTE(cfrademan): Phase in progress, marked when
+                    # failing before the post middleware runs.
+                    phase = 'middleware'
+                    try:
+                        if not cached:
+                            # Process the middleware 'resource' after
+                            # routing it
+                            if plan.middleware:
+                                await self.run(_middleware, plan.middleware,
+                                               request, response)
+
+                            if timing is not None:
+                                timing.mark('middleware')
+                            phase = 'view'
+
+                            # Run View method.
+                            if resource is None:
+                                raise NotFoundError(
+                                    "Route not found" +
+                                    " Method '%s'" % request.method +
+                                    " Route '%s'" % request.route)
+                            elif iscoroutinefunction(resource):
+                                view = await resource(request,
+                                                      response,
+                                                      **r_kwargs)
+                            else:
+                                view = await self.run(resource,
+                                                      request,
+                                                      response,
+                                                      **r_kwargs)
+
+                            if timing is not None:
+                                timing.mark('view')
+                            phase = 'encoding'
+
+                            if view is not None:
+                                await self.run(response.body, view)
+
+                            if timing is not None:
+                                timing.mark('encoding')
+                    except Exception:
+                        if timing is not None:
+                            timing.mark(phase)
+                        raise
+                    finally:
+                        # Process the middleware 'post' at the end
+                        await self.run(self.post_middleware, request,
+                                       response, False)
+
+                        if timing is not None:
+                            timing.mark('middleware')
+
+                    # Cache GET Response.
+                    await self.run(self.cache, request, response, plan,
+                                   target, version, cached)
+
+                    if timing is not None:
+                        timing.mark('cache')
+                        self.timed(request, response, timing)
+
+                except Exception as exception:
+                    trace = str(traceback.format_exc())
+                    await self.run(self.handle_error, request, response,
+                                   exception, trace)
+                    await self.run(self.post_middleware, request, response,
+                                   True)
+                    if timing is not None:
+                        timing.mark('error')
+                        self.timed(request, response, timing)
+
+            # Send response.
+            await response(self._executor)
+
+        finally:
+            if request is not None:
+                request.close()
+            body.close()
+            # Completed Request
+            log.info('Completed Request',
+                     timer=elapsed())
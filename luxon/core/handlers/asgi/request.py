@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2020 Christiaan Frans Rademan <chris@fwiw.co.za>.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+import sys
+
+from luxon.core.handlers.wsgi.request import Request as WsgiRequest
+
+
+def environ(scope, body):
+    """Return PEP-3333 environment for ASGI HTTP connection scope.
+
+    Args:
+        scope (dict): ASGI HTTP connection scope.
+        body (file): Request payload.
+    """
+    env = {}
+    env['REQUEST_METHOD'] = scope['method']
+    env['SCRIPT_NAME'] = scope.get('root_path', '').encode(
+        'utf-8').decode('latin1')
+    # NOTE(cfrademan): PEP 3333 PATH_INFO is "bytes tunneled as latin-1".
+    env['PATH_INFO'] = scope['path'].encode('utf-8').decode('latin1')
+    env['QUERY_STRING'] = scope.get('query_string', b'').decode('latin1')
+    env['SERVER_PROTOCOL'] = 'HTTP/' + scope.get('http_version', '1.1')
+    env['wsgi.url_scheme'] = scope.get('scheme', 'http')
+    env['wsgi.input'] = body
+    env['wsgi.errors'] = sys.stderr
+    env['asgi.scope'] = scope
+
+    server = scope.get('server')
+    if server:
+        env['SERVER_NAME'] = server[0]
+        env['SERVER_PORT'] = str(server[1])
+    else:
+        env['SERVER_NAME'] = 'localhost'
+        env['SERVER_PORT'] = '80'
+
+    client = scope.get('client')
+    if client:
+        env['REMOTE_ADDR'] = client[0]
+        env['REMOTE_PORT'] = str(client[1])
+
+    for name, value in scope.get('headers', ()):
+        name = name.decode('latin1').upper().replace('-', '_')
+        value = value.decode('latin1')
+        if name not in WsgiRequest._WSGI_CONTENT_HEADERS:
+            name = 'HTTP_' + name
+        if name == 'HTTP_COOKIE' and name in env:
+            # NOTE(cfrademan): Multiple cookie headers are combined with
+            # '; ' as per RFC 6265 for the cookie parser.
+            value = env[name] + '; ' + value
+        elif name in env:
+            # NOTE(cfrademan): Multiple headers with the same name are
+            # combined as per RFC 7230.
+            value = env[name] + ',' + value
+        env[name] = value
+
+    return env
+
+
+class Request(WsgiRequest):
+    """Represents a clients HTTP request.
+
+    Request for ASGI HTTP connection providing the same interface as the
+    WSGI request.
+
+    Args:
+        scope (dict): ASGI HTTP connection scope.
+        body (file): Request payload received.
+
+    Attributes:
+        scope (dict): ASGI HTTP connection scope.
+    """
+    __slots__ = ('scope',)
+
+    def __init__(self, scope, body):
+        super().__init__(environ(scope, body), None)
+        self.scope = scope
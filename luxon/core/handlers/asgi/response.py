@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2020 Christiaan Frans Rademan <chris@fwiw.co.za>.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+import asyncio
+from contextvars import copy_context
+
+from luxon.core.handlers.wsgi.response import Response as WsgiResponse
+
+
+class Response(WsgiResponse):
+    """Represents an HTTP response to a client request.
+
+    Response for ASGI HTTP connection providing the same interface as the
+    WSGI response. Awaiting the response sends it to the client.
+
+    Args:
+        scope (dict): ASGI HTTP connection scope.
+        send (function): ASGI coroutine sending event messages to the
+            server.
+    """
+    __slots__ = ('_send', '_raw_headers')
+
+    def __init__(self, scope, send):
+        super().__init__(scope, self._headers_sent)
+        self._send = send
+        self._raw_headers = None
+
+    def _headers_sent(self, status, headers):
+        # NOTE(cfrademan): ASGI header names are lowercased.
+        self._raw_headers = [(name.lower().encode('latin1'),
+                              value.encode('latin1'))
+                             for name, value in headers]
+
+    async def __call__(self, executor=None):
+        """Send response.
+
+        Keyword Args:
+            executor (Executor): Executor used to read streamed bodies such
+                as files without blocking the event loop.
+        """
+        super().__call__()
+
+        await self._send({'type': 'http.response.start',
+                          'status': self.status,
+                          'headers': self._raw_headers})
+
+        stream = self._stream
+        if (stream is None or isinstance(stream, bytes) or
+                self.status in self._BODILESS_STATUS_CODES):
+            await self._send({'type': 'http.response.body',
+                              'body': b''.join(self)})
+            return
+
+        # NOTE(cfrademan): Streams such as generators run in context of
+        # the request.
+        context = copy_context()
+        loop = asyncio.get_running_loop()
+        chunks = iter(self)
+        try:
+            while True:
+                chunk = await loop.run_in_executor(executor, context.run,
+                                                   next, chunks, None)
+                if chunk is None:
+                    break
+                await self._send({'type': 'http.response.body',
+                                  'body': chunk,
+                                  'more_body': True})
+            await self._send({'type': 'http.response.body',
+                              'body': b''})
+        finally:
+            self.close()
@@ -52,12 +52,16 @@ class RequestBase(object):
                                 returns None.
         policy(obj): Returns a cached luxon.core.policy.policy.Policy object
                      from a pool.
+        policy_fingerprint (tuple): Fingerprint of credentials and context
+                                    for caching policy decisions across
+                                    requests.
     """
 
     __slots__ = (
         '_cached_id',
         '_cached_auth',
         '_cached_policy',
+        '_policy_generation',
         '_context',
     )
 
@@ -65,6 +69,7 @@ class RequestBase(object):
         self._cached_id = None
         self._cached_auth = None
         self._cached_policy = None
+        self._policy_generation = 0
         self._context = Container()
 
     def __repr__(self):
@@ -97,7 +102,9 @@ class RequestBase(object):
     def credentials(self):
         if self._cached_auth is None:
             expire = g.app.config.getint('tokens', 'expire', fallback=3600)
-            self._cached_auth = Auth(expire=expire)
+            algorithm = g.app.config.get('tokens', 'algorithm',
+                                         fallback='RS256')
+            self._cached_auth = Auth(expire=expire, algorithm=algorithm)
             if self.unscoped_token:
                 try:
                     if self.scoped_token:
@@ -129,9 +136,55 @@ class RequestBase(object):
     def context_tenant_id(self):
         return None
 
+    @property
+    def policy_fingerprint(self):
+        """Fingerprint of credentials and context for caching policy
+        decisions across requests.
+
+        Returns None when not authenticated.
+        """
+        try:
+            credentials = self.credentials
+            if not credentials.authenticated:
+                return None
+            return (frozenset(credentials.roles or ()),
+                    credentials.user_id,
+                    credentials.user_domain,
+                    credentials.domain,
+                    credentials.tenant_id,
+                    self.context_domain,
+                    self.context_tenant_id)
+        except TokenExpiredError:
+            return None
+
     @property
     def policy(self):
-        if self._cached_policy is None:
-            self._cached_policy = policy_engine(req=self, g=g)
+        # NOTE(cfrademan): Decisions are discarded when credentials change
+        # during the request, such as a token set or scoped by a view.
+        if (self._cached_policy is not None and
+                self._credentials_generation() != self._policy_generation):
+            if self._cached_policy.fingerprint is None:
+                self._cached_policy.clear()
+            else:
+                # Fingerprint is of the previous credentials.
+                self._cached_policy = None
 
+        if self._cached_policy is None:
+            fingerprint = None
+            if g.app.config.getboolean('policy', 'cache', fallback=False):
+                fingerprint = self.policy_fingerprint
+            if fingerprint is not None:
+                self._cached_policy = policy_engine(
+                    fingerprint=fingerprint,
+                    expire=self.credentials.expires,
+                    req=self, g=g)
+            else:
+                self._cached_policy = policy_engine(req=self, g=g)
+
+        self._policy_generation = self._credentials_generation()
         return self._cached_policy
+
+    def _credentials_generation(self):
+        if self._cached_auth is None:
+            return 0
+        return self._cached_auth.generation
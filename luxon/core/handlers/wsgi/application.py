@@ -28,11 +28,16 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
 # THE POSSIBILITY OF SUCH DAMAGE.
 import traceback
+from datetime import datetime
+from collections import namedtuple
 
 from luxon import g, router
 from luxon.core.app import App
 from luxon.core.handlers.wsgi.request import Request
 from luxon.core.handlers.wsgi.response import Response
+from luxon.core.handlers.wsgi.cache import ResponseCache
+from luxon.core.handlers.wsgi.timing import (RequestTiming, timings,
+                                             timings_view)
 from luxon.exceptions import (Error, NotFoundError,
                               AccessDeniedError, JSONDecodeError,
                               ValidationError, FieldError,
@@ -44,10 +49,45 @@ from luxon.constants import TEXT_HTML, TEXT_PLAIN
 from luxon.utils.objects import object_name
 from luxon.utils.timer import Timer
 from luxon.utils.http import etagger
+from luxon.utils import js
+from luxon.utils.timezone import to_gmt, TimezoneUTC
 from luxon.core import register
 
 log = GetLogger(__name__)
 
+NO_CACHE = "no-store, no-cache, max-age=0"
+
+# NOTE(cfrademan): Client should uniquely cache based these request headers.
+CACHE_VARY = 'Cookie, Accept-Encoding, Content-Type'
+
+Plan = namedtuple('Plan', ('middleware',
+                           'policy',
+                           'validator',
+                           'cache',
+                           'cache_control',
+                           'cache_control_private',
+                           'vary'))
+Plan.__doc__ = """Frozen dispatch plan for route.
+
+Attributes:
+    middleware (tuple): Middleware 'resource' methods to run before view.
+    policy (callable): Validates request against route tag or None.
+    validator (callable): Conditional GET validator or None.
+    cache (int): Cache max-age in seconds for GET requests.
+    cache_control (str): Cache-Control header value.
+    cache_control_private (str): Cache-Control header value for sessions.
+    vary (str): Vary header value or None.
+"""
+
+
+def _policy(tag):
+    def validate(request):
+        if not request.policy.validate(tag, access_denied_raise=True):
+            raise AccessDeniedError("Access Denied by" +
+                                    " policy '%s'" % tag)
+
+    return validate
+
 
 class Application(object):
     """This class is part of the main entry point into the application.
@@ -71,6 +111,29 @@ class Application(object):
             if content_type is not None:
                 Response._DEFAULT_CONTENT_TYPE = content_type
 
+            # Dispatch plans, built by freeze.
+            self._frozen = None
+            self._plans = {}
+            self._response_cache = None
+            self._script_name = None
+            self._middleware_pre = ()
+            self._middleware_post = ()
+
+            # Request phase timing.
+            self._timing = app.config.getboolean('timing', 'enabled',
+                                                 fallback=False)
+            self._server_timing = (self._timing and
+                                   app.config.getboolean('timing',
+                                                         'server_timing',
+                                                         fallback=False))
+
+            # Request timing histograms resource.
+            timing_route = app.config.get('timing', 'route', fallback=None)
+            if timing_route:
+                router.add('GET', timing_route, timings_view,
+                           tag=app.config.get('timing', 'tag',
+                                              fallback='internal'))
+
             # Started Application
             log.info('Started Application'
                      ' %s' % app.name +
@@ -81,9 +144,252 @@ class Application(object):
             log.critical("%s" % trace)
             raise
 
+    def freeze(self):
+        """Freeze dispatch plans.
+
+        Builds an immutable dispatch plan for every route with the
+        middleware, policy validation and cache headers resolved. Requests
+        only lookup the plan for the route found.
+
+        Called on the first request. Routes or middleware registered
+        afterwards trigger a new freeze on the following request.
+        """
+        frozen = (router.version, register._version,)
+        resource_middleware = tuple(register._middleware_resource)
+        plans = {}
+
+        for resource, method, kwargs, route, tag, cache in (
+                router._routes.values()):
+            plans[(method, route,)] = self._plan(resource_middleware,
+                                                 resource, tag, cache)
+
+        self._script_name = g.app.config.get('application', 'script',
+                                             fallback=None)
+        if g.app.config.getboolean('cache', 'responses', fallback=False):
+            self._response_cache = ResponseCache()
+        else:
+            self._response_cache = None
+        js.configure(g.app.config.get('json', 'backend', fallback='auto'),
+                     g.app.config.getint('json', 'indent', fallback=0))
+        self._middleware_pre = tuple(register._middleware_pre)
+        self._middleware_post = tuple(reversed(register._middleware_post))
+        self._plans = plans
+        self._frozen = frozen
+        log.info('Frozen dispatch plans for %s routes' % len(plans))
+
+    def _plan(self, middleware, resource, tag, cache):
+        if tag is not None:
+            policy = _policy(tag)
+        else:
+            policy = None
+
+        try:
+            validator = register._validators.get(resource)
+        except TypeError:
+            # Unhashable resource.
+            validator = None
+
+        if cache > 0:
+            # NOTE(cfrademan): Instruct to use cache but revalidate on,
+            # stale cache entry. Expire remote cache in same duration
+            # as internal cache.
+            return Plan(middleware, policy, validator, cache,
+                        "must-revalidate, max-age=" + str(cache),
+                        "must-revalidate, private, max-age=" + str(cache),
+                        CACHE_VARY)
+
+        return Plan(middleware, policy, validator, cache,
+                    NO_CACHE, NO_CACHE, None)
+
+    def conditional(self, request, response, validator, kwargs):
+        """Validate conditional GET before running view.
+
+        Sets the 'ETag' or 'Last-Modified' header from the value returned by
+        the validator and compares with the request 'If-None-Match' or
+        'If-Modified-Since' headers.
+
+        Returns:
+            bool: True if 304 Not Modified.
+        """
+        validated = validator(request, response, **kwargs)
+
+        if isinstance(validated, datetime):
+            # NOTE(cfrademan): HTTP dates have a precision of seconds.
+            validated = to_gmt(validated,
+                               src=TimezoneUTC()).replace(microsecond=0)
+            response.last_modified = validated
+            if (len(request.if_none_match) == 0 and
+                    request.if_modified_since and
+                    request.if_modified_since >= validated):
+                response.not_modified()
+                return True
+        elif validated is not None:
+            # NOTE(cfrademan): Needed Encoding for Different Etag.
+            etag = etagger(request.route,
+                           request.query_string,
+                           validated,
+                           request.get_header('Accept-Encoding'))
+            response.etag.set(etag)
+            if (len(request.if_none_match) > 0 and
+                    etag in request.if_none_match):
+                response.not_modified()
+                return True
+
+        return False
+
+    def timed(self, request, response, timing):
+        """Record request timing.
+
+        Records the phases in the histograms for route and sets the
+        'Server-Timing' response header if enabled.
+        """
+        timings.record(request.method, timing)
+        if self._server_timing:
+            response.set_header('Server-Timing', timing.server_timing())
+
+    def route(self, request, response, timing=None):
+        """Route request.
+
+        Runs the middleware 'pre' methods, finds the route and its dispatch
+        plan, validates the policy for the route tag and the conditional or
+        server side cached GET response.
+
+        Returns:
+            tuple: (resource, route kwargs, route, plan, version, cached)
+        """
+        # Freeze dispatch plans on first request or when routes or
+        # middleware have been registered since.
+        if self._frozen != (router.version, register._version,):
+            self.freeze()
+
+        if self._script_name is not None:
+            request.env['SCRIPT_NAME'] = self._script_name
+
+        script_name = request.get_header('X-Script-Name')
+        if script_name:
+            request.env['SCRIPT_NAME'] = script_name
+
+        # Debug output
+        if g.app.debug is True:
+            log.info('Request %s' % request.route +
+                     ' Method %s\n' % request.method)
+
+        if timing is not None:
+            timing.mark('request')
+
+        # Process the middleware 'pre' method before routing it
+        for middleware in self._middleware_pre:
+            middleware(request, response)
+
+        if timing is not None:
+            timing.mark('middleware')
+
+        # Route Object.
+        resource, method, r_kwargs, target, tag, cache = router.find(
+            request.method,
+            request.route)
+
+        # Dispatch Plan.
+        try:
+            plan = self._plans[(method, target,)]
+        except KeyError:
+            plan = self._plan(tuple(register._middleware_resource),
+                              resource, tag, cache)
+
+        # Route Kwargs in requests.
+        request.route_kwargs = r_kwargs
+
+        # Set route tag in requests.
+        request.tag = tag
+
+        if timing is not None:
+            timing.route = target
+            timing.mark('routing')
+
+        # If route tagged validate with policy
+        if plan.policy is not None:
+            plan.policy(request)
+
+        if timing is not None:
+            timing.mark('policy')
+
+        # Conditional GET validated before running view.
+        cached = (plan.validator is not None and
+                  request.method == 'GET' and
+                  self.conditional(request,
+                                   response,
+                                   plan.validator,
+                                   r_kwargs))
+
+        # Version of resource from validator.
+        version = (response.get_header('Etag') or
+                   response.get_header('Last-Modified'))
+
+        # Server side cached GET Response.
+        cached = cached or (plan.cache > 0 and
+                            request.method == 'GET' and
+                            self._response_cache is not None and
+                            self._response_cache.get(request,
+                                                     response,
+                                                     target,
+                                                     version))
+
+        if timing is not None:
+            timing.mark('cache')
+
+        return resource, r_kwargs, target, plan, version, cached
+
+    def cache(self, request, response, plan, target, version, cached):
+        """Set cache headers for response and store cached GET response."""
+        # Only cache for GET responses!
+        if plan.cache > 0 and request.method == 'GET':
+            # Get session_id if any for Caching
+            if request.cookies.get(request.host):
+                response.set_header("cache-control",
+                                    plan.cache_control_private)
+            else:
+                response.set_header("cache-control",
+                                    plan.cache_control)
+
+            # Set Vary Header
+            response.set_header('Vary', plan.vary)
+
+            # Set Etag
+            # NOTE(cfrademan): Needed Encoding for Different Etag.
+            if not cached and isinstance(response._stream, bytes):
+                if plan.validator is None:
+                    encoding = response.get_header('Content-Encoding')
+                    response.etag.set(etagger(response._stream,
+                                              encoding))
+
+                # Store server side cached response.
+                if self._response_cache is not None:
+                    self._response_cache.set(request,
+                                             response,
+                                             target,
+                                             plan.cache,
+                                             version)
+
+            # If Etag matches do not return full body use
+            # external/user-agent cache.
+            if (len(request.if_none_match) > 0 and
+                    request.if_none_match in response.etag):
+                # Etag matches do not return full body.
+                response.not_modified()
+
+            # NOTE(cfrademan): Use last_modified as last resort for
+            # external/user-agent cache.
+            elif (request.if_modified_since and
+                  response.last_modified and
+                  request.if_modified_since <= response.last_modified):
+                # Last-Modified matches do not return full body.
+                response.not_modified()
+        else:
+            response.set_header("cache-control", NO_CACHE)
+
     def post_middleware(self, request, response, error):
         # Process the middleware 'post' at the end
-        for middleware in reversed(register._middleware_post):
+        for middleware in self._middleware_post:
             middleware(request, response, error)
 
     def __call__(self, *args, **kwargs):
@@ -96,19 +402,19 @@ class Application(object):
 
         Response object is returned.
         """
+        # NOTE(cfrademan): Request timing is None when disabled, only
+        # checked after each phase.
+        timing = None
+        request = None
+
         try:
             with Timer() as elapsed:
+                if self._timing:
+                    timing = RequestTiming()
+
                 # Request Object.
                 request = g.current_request = Request(*args,
                                                       **kwargs)
-                request.env['SCRIPT_NAME'] = g.app.config.get(
-                    'application',
-                    'script',
-                    fallback=request.env['SCRIPT_NAME'])
-
-                script_name = request.get_header('X-Script-Name')
-                if script_name:
-                    request.env['SCRIPT_NAME'] = script_name
 
                 # Response Object.
                 response = Response(*args,
@@ -117,103 +423,63 @@ class Application(object):
                 # Set Response object for request.
                 request.response = response
 
-                # Debug output
-                if g.app.debug is True:
-                    log.info('Request %s' % request.route +
-                             ' Method %s\n' % request.method)
-
-                # Process the middleware 'pre' method before routing it
-                for middleware in register._middleware_pre:
-                    middleware(request, response)
-
-                # Route Object.
-                resource, method, r_kwargs, target, tag, cache = router.find(
-                    request.method,
-                    request.route)
-
-                # Route Kwargs in requests.
-                request.route_kwargs = r_kwargs
-
-                # Set route tag in requests.
-                request.tag = tag
-
-                # If route tagged validate with policy
-                if tag is not None:
-                    if not request.policy.validate(tag,
-                                                   access_denied_raise=True):
-                        raise AccessDeniedError("Access Denied by" +
-                                                " policy '%s'" % tag)
+                # Route request.
+                (resource, r_kwargs, target,
+                 plan, version, cached) = self.route(request,
+                                                     response,
+                                                     timing)
 
                 # Execute Routed View.
+                # NOTE(cfrademan): Phase in progress, marked when failing
+                # before the post middleware runs.
+                phase = 'middleware'
                 try:
-                    # Process the middleware 'resource' after routing it
-                    for middleware in register._middleware_resource:
-                        middleware(request, response)
-                    # Run View method.
-                    if resource is not None:
-                        view = resource(request,
-                                        response,
-                                        **r_kwargs)
-                        if view is not None:
-                            response.body(view)
-                    else:
-                        raise NotFoundError("Route not found" +
-                                            " Method '%s'" % request.method +
-                                            " Route '%s'" % request.route)
+                    if not cached:
+                        # Process the middleware 'resource' after routing it
+                        for middleware in plan.middleware:
+                            middleware(request, response)
+
+                        if timing is not None:
+                            timing.mark('middleware')
+                        phase = 'view'
+
+                        # Run View method.
+                        if resource is not None:
+                            view = resource(request,
+                                            response,
+                                            **r_kwargs)
+
+                            if timing is not None:
+                                timing.mark('view')
+                            phase = 'encoding'
+
+                            if view is not None:
+                                response.body(view)
+
+                            if timing is not None:
+                                timing.mark('encoding')
+                        else:
+                            raise NotFoundError(
+                                "Route not found" +
+                                " Method '%s'" % request.method +
+                                " Route '%s'" % request.route)
+                except Exception:
+                    if timing is not None:
+                        timing.mark(phase)
+                    raise
                 finally:
                     # Process the middleware 'post' at the end
                     self.post_middleware(request, response, False)
 
+                    if timing is not None:
+                        timing.mark('middleware')
+
             # Cache GET Response.
-            # Only cache for GET responses!
-            if cache > 0 and request.method == 'GET':
-                # Get session_id if any for Caching
-                session_id = request.cookies.get(request.host)
-
-                # NOTE(cfrademan): Instruct to use cache but revalidate on,
-                # stale cache entry. Expire remote cache in same duration
-                # as internal cache.
-                if session_id:
-                    response.set_header(
-                        "cache-control",
-                        "must-revalidate, private, max-age=" + str(cache)
-                    )
-                else:
-                    response.set_header(
-                        "cache-control",
-                        "must-revalidate, max-age=" + str(cache)
-                    )
-
-                # Set Vary Header
-                # NOTE(cfrademan): Client should uniquely cache
-                # based these request headers.
-                response.set_header('Vary',
-                                    'Cookie, Accept-Encoding' +
-                                    ', Content-Type')
-
-                # Set Etag
-                # NOTE(cfrademan): Needed Encoding for Different Etag.
-                if isinstance(response._stream, bytes):
-                    encoding = request.get_header('Accept-Encoding')
-                    response.etag.set(etagger(response._stream, encoding))
-
-                # If Etag matches do not return full body use
-                # external/user-agent cache.
-                if (len(request.if_none_match) > 0 and
-                        request.if_none_match in response.etag):
-                    # Etag matches do not return full body.
-                    response.not_modified()
-
-                # NOTE(cfrademan): Use last_modified as last resort for
-                # external/user-agent cache.
-                elif (request.if_modified_since and
-                      response.last_modified and
-                      request.if_modified_since <= response.last_modified):
-                    # Last-Modified matches do not return full body.
-                    response.not_modified()
-            else:
-                response.set_header("cache-control",
-                                    "no-store, no-cache, max-age=0")
+            self.cache(request, response, plan, target, version, cached)
+
+            if timing is not None:
+                timing.mark('cache')
+                self.timed(request, response, timing)
 
             # Return response object.
             return response()
@@ -222,12 +488,18 @@ class Application(object):
             trace = str(traceback.format_exc())
             self.handle_error(request, response, exception, trace)
             self.post_middleware(request, response, True)
+            if timing is not None:
+                timing.mark('error')
+                self.timed(request, response, timing)
             # Return response object.
             return response()
         except Error as exception:
             trace = str(traceback.format_exc())
             self.handle_error(request, response, exception, trace)
             self.post_middleware(request, response, True)
+            if timing is not None:
+                timing.mark('error')
+                self.timed(request, response, timing)
             # Return response object.
             return response()
         except Exception as exception:
@@ -237,16 +509,21 @@ class Application(object):
                               exception,
                               trace)
             self.post_middleware(request, response, True)
+            if timing is not None:
+                timing.mark('error')
+                self.timed(request, response, timing)
             # Return response object.
             return response()
         finally:
+            if request is not None:
+                request.close()
             # Completed Request
             log.info('Completed Request',
                      timer=elapsed())
 
     def handle_error(self, req, resp, exception, trace):
         # Parse Exceptions.
-        resp.cache_control = "no-store, no-cache, max-age=0"
+        resp.cache_control = NO_CACHE
         if isinstance(exception, HTTPError):
             log.debug('%s' % (trace))
             log.warning('%s: %s' % (object_name(exception),
@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2020 Christiaan Frans Rademan <chris@fwiw.co.za>.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+from luxon import g
+from luxon.core.cache import Cache, Memory
+from luxon.core.logger import GetLogger
+from luxon.utils.hashing import md5sum
+from luxon.utils.unique import string_id
+
+log = GetLogger(__name__)
+
+# Request headers used in Vary header for cached responses.
+_VARY_HEADERS = ('Accept-Encoding', 'Content-Type',)
+
+# Request headers that make cached response private.
+_PRIVATE_HEADERS = ('X-Auth-Token', 'X-Tenant-Id', 'X-Domain',)
+
+# Cookies holding session or token, the session cookie is named after the
+# request host. Other cookies such as analytics are not part of the key.
+_PRIVATE_COOKIES = ('photonicLogin', 'unscoped_token', 'scoped_token',)
+
+# Generations per route for per process Memory cache backend.
+_generations = {}
+
+
+def route_id(route):
+    """Return identifier for route used in cache references.
+
+    Args:
+        route (str): Route as registered or found by router.
+    """
+    try:
+        # Compiled regex route.
+        return 'regex:' + route.pattern
+    except AttributeError:
+        pass
+
+    if route[0:6].lower() == "regex:":
+        return 'regex:' + route[6:]
+
+    return route.strip('/')
+
+
+class ResponseCache(object):
+    """Server side response cache.
+
+    Stores responses for GET requests to routes registered with cache > 0
+    using luxon.core.cache.Cache. Responses are referenced by application,
+    route, requested path, query string and the request headers in the
+    'Vary' header. Requests with a session cookie or token get a private
+    entry, keyed on the session and token cookies only.
+
+    The status, headers, etag and last modified are stored seperately from
+    the body. Hence when the etag matches 'If-None-Match' or the response
+    is not modified since 'If-Modified-Since' the body is never loaded.
+    """
+    __slots__ = ()
+
+    def _generation_reference(self, route):
+        return 'response:' + md5sum(g.app.name + ':' + route)
+
+    def _generation(self, route):
+        # NOTE(cfrademan): Random generation per route, replaced to
+        # invalidate all cached responses for route. Empty until the
+        # route is invalidated. The Memory backend is per process, hence
+        # its generations are kept in process and never loaded.
+        if isinstance(Cache().backend, Memory):
+            return _generations.get((g.app.name, route), '')
+
+        return Cache().load(self._generation_reference(route)) or ''
+
+    def _reference(self, req, route, version):
+        values = [g.app.name,
+                  req.app,
+                  route,
+                  self._generation(route),
+                  req.route,
+                  req.query_string or '',
+                  version or '']
+
+        for header in _VARY_HEADERS + _PRIVATE_HEADERS:
+            values.append(req.get_header(header, default=''))
+
+        cookies = req.cookies
+        values.append(cookies.get(req.host, ''))
+        for cookie in _PRIVATE_COOKIES:
+            values.append(cookies.get(cookie, ''))
+
+        return 'response:' + md5sum('\n'.join(values))
+
+    def get(self, req, resp, route, version=None):
+        """Restore cached response.
+
+        Args:
+            req (object): Request Object.
+            resp (object): Response Object.
+            route (str): Route found by router.
+
+        Keyword Args:
+            version (str): Version of resource from conditional GET validator.
+
+        Returns:
+            bool: True if response was restored from cache.
+        """
+        cache = Cache()
+        reference = self._reference(req, route_id(route), version)
+
+        cached = cache.load(reference)
+        if cached is None:
+            return False
+
+        status, content_type, headers, etag, last_modified = cached
+
+        if len(req.if_none_match) > 0:
+            if etag and etag in req.if_none_match:
+                self._restore_headers(resp, headers, etag)
+                resp.not_modified()
+                return True
+        elif (last_modified is not None and
+                req.if_modified_since and
+                req.if_modified_since >= last_modified):
+            self._restore_headers(resp, headers, etag)
+            resp.not_modified()
+            return True
+
+        body = cache.load(reference + ':body')
+        if body is None:
+            return False
+
+        self._restore_headers(resp, headers, etag)
+        resp.content_type = content_type
+        resp.status = status
+        resp._stream = body
+
+        return True
+
+    def _restore_headers(self, resp, headers, etag):
+        resp.set_headers(headers)
+        if etag and len(resp.etag) == 0:
+            resp.etag.set(etag)
+
+    def set(self, req, resp, route, expire, version=None):
+        """Store response in cache.
+
+        Only complete responses with status 200 and bytes body are stored.
+        Cookies are never stored.
+
+        Args:
+            req (object): Request Object.
+            resp (object): Response Object.
+            route (str): Route found by router.
+            expire (int): Seconds to cache response.
+
+        Keyword Args:
+            version (str): Version of resource from conditional GET validator.
+        """
+        if resp.status != 200 or not isinstance(resp._stream, bytes):
+            return
+
+        # NOTE(cfrademan): Responses from validators returning datetime
+        # have a 'Last-Modified' header and no etag.
+        etag = resp.etag.to_header()
+        last_modified = resp.last_modified
+
+        headers = [(name, value) for name, value in resp._headers.items()
+                   if name not in ('Etag', 'Content-Length',
+                                   'Content-Type')]
+
+        cache = Cache()
+        reference = self._reference(req, route_id(route), version)
+        cache.store(reference + ':body', resp._stream, expire)
+        cache.store(reference, (resp.status,
+                                resp.content_type,
+                                headers,
+                                etag,
+                                last_modified,), expire)
+
+    def invalidate(self, route):
+        """Invalidate all cached responses for route.
+
+        Args:
+            route (str): Route as registered. (e.g. '/users/{id}')
+        """
+        route = route_id(route)
+        if isinstance(Cache().backend, Memory):
+            _generations[(g.app.name, route)] = string_id(16)
+        else:
+            Cache().store(self._generation_reference(route),
+                          string_id(16),
+                          604800)
+        log.info("Invalidated cached responses for route '%s'" % route)
+
+
+def invalidate(route):
+    """Invalidate all server side cached responses for route.
+
+    Args:
+        route (str): Route as registered. (e.g. '/users/{id}')
+    """
+    ResponseCache().invalidate(route)
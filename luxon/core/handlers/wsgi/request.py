@@ -29,12 +29,12 @@
 # THE POSSIBILITY OF SUCH DAMAGE.
 
 import base64
-from cgi import FieldStorage
 from http.cookies import SimpleCookie, CookieError
 
 from luxon import g
 from luxon.utils.http import parse_forwarded_header, parse_cache_control_header
 from luxon.utils.files import FileObject
+from luxon.utils.form import parse as parse_form
 from luxon.utils.uri import parse_qs, parse_host
 from luxon.utils import js
 from luxon.utils.cast import to_tuple
@@ -55,6 +55,20 @@ from luxon.core.logger import GetLogger
 log = GetLogger(__name__)
 
 
+def _base64(file):
+    # NOTE(cfrademan): Encoded in blocks of whole base64 lines, the same as
+    # base64.encodebytes without reading the whole file in memory.
+    file.seek(0)
+    encoded = []
+    while True:
+        block = file.read(57 * 1024)
+        if not block:
+            break
+        encoded.append(base64.encodebytes(block))
+    file.seek(0)
+    return b''.join(encoded)
+
+
 class Request(RequestBase):
     """Represents a clients HTTP request.
 
@@ -469,6 +483,14 @@ class Request(RequestBase):
             return self.stream.readline(size)
         return self.stream.readline()
 
+    def close(self):
+        """Release resources of completed request.
+
+        Closes temporary files of uploads in parsed form.
+        """
+        if self._cached_form is not None:
+            self._cached_form.close()
+
     @property
     def session(self):
         if self._cached_session is None:
@@ -777,14 +799,20 @@ class Request(RequestBase):
         if self._cached_form is not None:
             return self._cached_form
 
-        environ = {'REQUEST_METHOD': 'POST',
-                   'CONTENT_LENGTH': self.content_length}
-
-        if 'CONTENT_TYPE' in self.env:
-            environ['CONTENT_TYPE'] = self.env['CONTENT_TYPE']
-
-        self._cached_form = FieldStorage(fp=self, keep_blank_values=True,
-                                         environ=environ)
+        # NOTE(cfrademan): Parsed while read, uploaded files larger than
+        # spool_size are written to temporary files.
+        config = g.app.config
+        self._cached_form = parse_form(
+            self.stream,
+            self.content_type,
+            self.content_length,
+            spool_size=config.getint('form', 'spool_size',
+                                     fallback=1048576),
+            max_field_size=config.getint('form', 'max_field_size',
+                                         fallback=1048576),
+            max_file_size=config.getint('form', 'max_file_size',
+                                        fallback=0),
+            max_size=config.getint('form', 'max_size', fallback=0))
 
         return self._cached_form
 
@@ -801,8 +829,7 @@ class Request(RequestBase):
                     if prop not in json_safe_object:
                         json_safe_object[prop] = []
                     if item.filename:
-                        # Encodestring was changed to encodebytes... ?!?
-                        data = base64.encodebytes(item.file.read())
+                        data = _base64(item.file)
                         file_obj = {'name': item.filename,
                                     'type': item.type,
                                     'base64': data}
@@ -813,8 +840,7 @@ class Request(RequestBase):
                             )
             else:
                 if field.filename:
-                    # Encodestring was changed to encodebytes... ?!?
-                    data = base64.encodebytes(field.file.read())
+                    data = _base64(field.file)
                     file_obj = {'name': field.filename,
                                 'type': field.type,
                                 'base64': data}
@@ -27,7 +27,7 @@
 # CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
 # THE POSSIBILITY OF SUCH DAMAGE.
-from io import BytesIO
+from io import BytesIO, UnsupportedOperation
 from collections import OrderedDict
 from http.cookies import SimpleCookie, CookieError
 
@@ -45,6 +45,15 @@ from luxon.utils import js
 GMT_TIMEZONE = TimezoneGMT()
 
 
+def is_real_file(stream):
+    """Return True if stream is file object with file descriptor."""
+    try:
+        stream.fileno()
+        return True
+    except (AttributeError, OSError, UnsupportedOperation):
+        return False
+
+
 class Response(Redirects):
     """Represents an HTTP response to a client request.
 
@@ -83,6 +92,7 @@ class Response(Redirects):
         '_http_response_status_code',
         '_cookies',
         '_start_response',
+        '_file_wrapper',
         '_etags',
     )
 
@@ -94,6 +104,9 @@ class Response(Redirects):
 
         self._start_response = start_response
 
+        # Server provided file wrapper, used for sendfile(2) for example.
+        self._file_wrapper = environ.get('wsgi.file_wrapper')
+
         # Default Response Status Used internally.
         self._http_response_status_code = 204
 
@@ -141,6 +154,8 @@ class Response(Redirects):
             file, iter like objects must return bytes.
             OrderedDict, dict and list will be translated json
             and encoded to 'UTF-8'
+            luxon.utils.js.JsonStream will be streamed as json
+            while encoded.
 
         Args:
             obj (object): Any valid object for response body.
@@ -157,7 +172,11 @@ class Response(Redirects):
         elif isinstance(obj, (OrderedDict, dict, list, tuple,)):
             # If JSON serializeable object.
             self.content_type = const.APPLICATION_JSON
-            self._stream = if_unicode_to_bytes(js.dumps(obj))
+            self._stream = js.encode(obj)
+        elif isinstance(obj, js.JsonStream):
+            # If JSON document streamed while encoded.
+            self.content_type = const.APPLICATION_JSON
+            self._stream = obj
         elif hasattr(obj, 'json'):
             # If JSON serializeable object.
             self.content_type = const.APPLICATION_JSON
@@ -508,12 +527,13 @@ class Response(Redirects):
         if content_length is not None:
             headers['Content-Length'] = str(content_length)
 
-            # Set Content-Type Header.
-            if content_type is not None:
-                headers['Content-Type'] = content_type
+        # Set Content-Type Header.
+        # NOTE(cfrademan): Streamed bodies have no Content-Length, but still
+        # require the Content-Type.
+        if content_type is not None:
+            headers['Content-Type'] = content_type
 
-        elif (content_type is None and
-                status not in self._BODILESS_STATUS_CODES):
+        elif status not in self._BODILESS_STATUS_CODES:
             headers['Content-Type'] = self._DEFAULT_CONTENT_TYPE
 
         headers = list(self._headers.items())
@@ -527,6 +547,15 @@ class Response(Redirects):
                              const.HTTP_STATUS_CODES[status]),
                              headers)
 
+        # NOTE(cfrademan): Real files are handed to the server file wrapper,
+        # allowing the server to use high performance options such as
+        # sendfile(2).
+        if (self._file_wrapper is not None and
+                status not in self._BODILESS_STATUS_CODES and
+                is_real_file(self._stream)):
+            self._stream.seek(0)
+            return self._file_wrapper(self._stream, self._STREAM_BLOCK_SIZE)
+
         return self
 
     def __iter__(self):
@@ -535,28 +564,35 @@ class Response(Redirects):
 
         _STREAM_BLOCK_SIZE = self._STREAM_BLOCK_SIZE
 
-        if status not in self._BODILESS_STATUS_CODES:
+        if status in self._BODILESS_STATUS_CODES or stream is None:
+            return
+
+        if isinstance(stream, bytes):
+            # Bytes body is returned as is without copying chunks.
+            if stream:
+                yield stream
+        elif isinstance(stream, BytesIO):
+            # NOTE(cfrademan): WSGI servers only accept bytes, wsgiref
+            # asserts on memoryview from getbuffer(). getvalue() does not
+            # copy, CPython returns the BytesIO internal bytes object as
+            # long as no buffer is exported.
+            yield stream.getvalue()
+        elif hasattr(stream, 'read'):
             try:
                 # Rewind file like object to beginning
                 stream.seek(0)
-            except AttributeError:
+            except (AttributeError, OSError):
                 pass
 
-            try:
-                while True:
-                    chunk = stream.read(_STREAM_BLOCK_SIZE)
-                    if not chunk:
-                        break
-                    yield chunk
-            except AttributeError:
-                # If iterable body...
-                try:
-                    for i in range(0, len(stream), _STREAM_BLOCK_SIZE):
-                        yield stream[i:i + _STREAM_BLOCK_SIZE]
-                except TypeError:
-                    pass
-
-        yield b''
+            while True:
+                chunk = stream.read(_STREAM_BLOCK_SIZE)
+                if not chunk:
+                    break
+                yield chunk
+        else:
+            # If iterable body...
+            for chunk in stream:
+                yield if_unicode_to_bytes(chunk)
 
     def close(self):
         if hasattr(self._stream, 'close'):
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2020 Christiaan Frans Rademan <chris@fwiw.co.za>.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+from threading import Lock
+from timeit import default_timer
+from collections import OrderedDict
+
+from luxon.structs.histogram import Histogram
+from luxon.core.handlers.wsgi.cache import route_id
+
+
+class RequestTiming(object):
+    """Per phase timing of request.
+
+    Each mark adds the time elapsed since the previous mark to the phase.
+    Phases marked multiple times are accumulated, for example middleware
+    processed before and after the view.
+
+    Attributes:
+        route (str): Route found by router or None if not routed.
+        phases (OrderedDict): Seconds per phase.
+    """
+    __slots__ = ('_start', '_last', 'route', 'phases')
+
+    def __init__(self):
+        self._start = self._last = default_timer()
+        self.route = None
+        self.phases = OrderedDict()
+
+    def mark(self, phase):
+        """Add time elapsed since previous mark to phase.
+
+        Args:
+            phase (str): Phase name. (e.g. 'view')
+        """
+        now = default_timer()
+        self.phases[phase] = self.phases.get(phase, 0.0) + now - self._last
+        self._last = now
+
+    @property
+    def total(self):
+        """Seconds elapsed from start to last mark."""
+        return self._last - self._start
+
+    def server_timing(self):
+        """Return value for Server-Timing response header."""
+        timings = ['%s;dur=%.3f' % (phase, seconds * 1000)
+                   for phase, seconds in self.phases.items()]
+        timings.append('total;dur=%.3f' % (self.total * 1000))
+        return ', '.join(timings)
+
+
+class Timings(object):
+    """Request timing histograms.
+
+    Histograms in milliseconds of each phase per route for the process.
+    """
+    __slots__ = ('_routes', '_lock')
+
+    def __init__(self):
+        self._routes = {}
+        self._lock = Lock()
+
+    def record(self, method, timing):
+        """Record request timing for route.
+
+        Args:
+            method (str): Request method.
+            timing (RequestTiming): Timing of request.
+        """
+        if timing.route is not None:
+            route = method + ' ' + route_id(timing.route)
+        else:
+            route = method + ' None'
+
+        try:
+            histograms = self._routes[route]
+        except KeyError:
+            with self._lock:
+                histograms = self._routes.setdefault(route, {})
+
+        for phase, seconds in timing.phases.items():
+            self._histogram(histograms, phase).observe(seconds * 1000)
+        self._histogram(histograms, 'total').observe(timing.total * 1000)
+
+    def _histogram(self, histograms, phase):
+        try:
+            return histograms[phase]
+        except KeyError:
+            with self._lock:
+                return histograms.setdefault(phase, Histogram())
+
+    def clear(self):
+        """Clear all histograms."""
+        with self._lock:
+            self._routes = {}
+
+    def to_dict(self):
+        """Return histograms per route and phase as dict."""
+        # NOTE(cfrademan): Copied under lock, record() adds routes and
+        # phases from other threads.
+        with self._lock:
+            snapshot = {route: dict(histograms)
+                        for route, histograms in self._routes.items()}
+
+        routes = OrderedDict()
+        for route in sorted(snapshot):
+            routes[route] = OrderedDict()
+            for phase in sorted(snapshot[route]):
+                routes[route][phase] = snapshot[route][phase].to_dict()
+
+        return routes
+
+
+# Process wide timings.
+timings = Timings()
+
+
+def timings_view(req, resp):
+    """Resource returning request timing histograms."""
+    return timings.to_dict()
@@ -27,20 +27,75 @@
 # CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
 # THE POSSIBILITY OF SUCH DAMAGE.
-
 import re
+import ast
+import builtins
 
 from luxon.utils.timer import Timer
 from luxon.core.logger import GetLogger
+from luxon.core.policy.decisions import Decisions
 
 log = GetLogger(__name__)
 
+# MATCH : expression used within rule statements.
+_interpolation_match = re.compile(r"\$[a-z_\-:]+", re.IGNORECASE)
+
+
+class Rules(dict):
+    """Compiled rule functions by rule name.
+
+    Attributes:
+        decisions (obj): luxon.core.policy.decisions.Decisions cache for
+            this rule set.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.decisions = Decisions()
+
+
+# Names of builtins, environment kwargs with the same name take precedence.
+_builtins = frozenset(dir(builtins))
+
+
+class _Environment(ast.NodeTransformer):
+    """Rewrite free names in rule functions to '_env' lookups.
+
+    Names of other rules and names bound within the condition itself
+    (comprehensions, lambdas) are left as is. Builtins are only used when
+    not provided in the environment.
+    """
+    def __init__(self, skip):
+        self._skip = skip
+
+    def visit_FunctionDef(self, node):
+        bound = set(self._skip)
+        for child in ast.walk(node):
+            if (isinstance(child, ast.Name) and
+                    not isinstance(child.ctx, ast.Load)):
+                bound.add(child.id)
+            elif isinstance(child, ast.arg):
+                bound.add(child.arg)
+        self._bound = bound
+        self.generic_visit(node)
+        return node
+
+    def visit_Name(self, node):
+        if isinstance(node.ctx, ast.Load) and node.id not in self._bound:
+            if node.id in _builtins:
+                lookup = '_env.get(%r, %s)' % (node.id, node.id)
+            else:
+                lookup = '_env[%r]' % node.id
+            lookup = ast.parse(lookup, mode='eval').body
+            return ast.copy_location(lookup, node)
+        return node
+
 
 def compiler(dict_rule_set):
     """Policy Rules Compiler.
 
-    Compiles rule set into python executable machine code for enhanced
-    performance during conditional matching.
+    Compiles rule set into a table of python functions once, each taking the
+    policy environment as a dict. Validating a rule is then a single function
+    call.
 
     Example of rule_set in dict format:
 
@@ -55,16 +110,15 @@ def compiler(dict_rule_set):
 
     Args:
         dict_rule_set (dict): Rule Set loaded from JSON file for example.
+
+    Returns tuple of Rules functions dict and original rule set.
     """
 
     with Timer() as elapsed:
-        # MATCH : expression used within rule statements.
-        interpolation_match = re.compile(r"\$[a-z_\-:]+", re.IGNORECASE)
-
         # Build Rules - Need todo this before compiling.
         # Some rules reference others.
-        rule_set = '_validate_result = False\n'
-        rule_set += '_rules = {}\n\n'
+        rule_set = ''
+        functions = {}
 
         for rule in dict_rule_set:
             # Validate Rules.
@@ -77,12 +131,12 @@ def compiler(dict_rule_set):
             condition = dict_rule_set[rule]
 
             build_rule = ('def ' + rule.replace(':', '_') +
-                          '():\n    return ' +
-                          condition + '\n')
+                          '(_env):\n    return (' +
+                          condition + ')\n')
 
             # Correct build_rule for interpolation.
             # Any string with '$value' is an expression.
-            for expr in interpolation_match.findall(build_rule):
+            for expr in _interpolation_match.findall(build_rule):
                 if expr[1:] not in dict_rule_set:
                     log.error("Missing rule for interpolation of '" + expr +
                               "' in rule '" + rule + "' skipping.")
@@ -91,22 +145,24 @@ def compiler(dict_rule_set):
 
                 build_rule = build_rule.replace(expr, expr.replace(':',
                                                                    '_')[1:] +
-                                                '()')
-
-            # Add Rule to _rules dictionary for validation to select rule.
-            build_rule += "_rules['" + rule + "'] = " + rule.replace(':', '_')
-            build_rule += '\n\n'
-
-            rule_set += build_rule
+                                                '(_env)')
 
-        rule_set += '_validate_result = _rules[_validate_rule]()\n'
+            functions[rule] = rule.replace(':', '_')
+            rule_set += build_rule + '\n'
 
         # Compile Rules
         try:
-            compiled = compile(rule_set, 'policy.json.compiled', 'exec')
+            tree = ast.parse(rule_set, 'policy.json.compiled')
+            skip = set(functions.values())
+            tree = ast.fix_missing_locations(_Environment(skip).visit(tree))
+            compiled = compile(tree, 'policy.json.compiled', 'exec')
+            namespace = {}
+            exec(compiled, namespace, namespace)
+            rules = Rules((rule, namespace[functions[rule]])
+                          for rule in functions)
             log.info('%s Rules compile completed.' % len(dict_rule_set),
                      timer=elapsed())
 
-            return (compiled, dict_rule_set)
+            return (rules, dict_rule_set)
         except Exception:
             raise ValueError("Failed compiling rule_set")
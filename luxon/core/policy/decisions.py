@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2020 Christiaan Frans Rademan <chris@fwiw.co.za>.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+from time import time
+from threading import Lock
+
+
+class Decisions(object):
+    """Policy decision cache shared between requests.
+
+    Thread safe cache of rule decisions keyed on a caller supplied
+    fingerprint of the environment the rules read, for example the roles,
+    domain, tenant and user_id of the credentials. Each compiled rule set has
+    its own Decisions, so reloading the rule set starts with an empty cache.
+
+    Decisions expire at the epoch given when stored, normally the expiry of
+    the token the fingerprint was derived from.
+
+    Keyword Args:
+        max_entries (int): Maximum decisions cached. Expired decisions are
+            purged when full, or all if none expired.
+    """
+    __slots__ = ('_decisions', '_max_entries', '_lock', '_hits', '_misses',
+                 '_request_hits')
+
+    def __init__(self, max_entries=10000):
+        self._max_entries = max_entries
+        self._lock = Lock()
+        self.clear()
+
+    def clear(self):
+        """Clear cached decisions and counters."""
+        with self._lock:
+            self._decisions = {}
+            self._hits = 0
+            self._misses = 0
+            self._request_hits = 0
+
+    def get(self, fingerprint, rule):
+        """Get cached decision.
+
+        Args:
+            fingerprint (hashable): Fingerprint of environment.
+            rule (str): Rule name.
+
+        Returns tuple of (True, decision) or (False, None) when not cached or
+        expired.
+        """
+        key = (fingerprint, rule)
+        with self._lock:
+            try:
+                decision, expire = self._decisions[key]
+            except KeyError:
+                self._misses += 1
+                return (False, None)
+
+            if expire is not None and expire <= time():
+                del self._decisions[key]
+                self._misses += 1
+                return (False, None)
+
+            self._hits += 1
+            return (True, decision)
+
+    def set(self, fingerprint, rule, decision, expire=None):
+        """Cache decision.
+
+        Args:
+            fingerprint (hashable): Fingerprint of environment.
+            rule (str): Rule name.
+            decision (bool): Validated result of rule.
+
+        Keyword Args:
+            expire (int): Epoch when decision expires. (default never)
+        """
+        with self._lock:
+            if len(self._decisions) >= self._max_entries:
+                self._purge()
+            self._decisions[(fingerprint, rule)] = (decision, expire)
+
+    def _purge(self):
+        now = time()
+        decisions = {key: value for key, value in self._decisions.items()
+                     if value[1] is None or value[1] > now}
+        if len(decisions) >= self._max_entries:
+            decisions = {}
+        self._decisions = decisions
+
+    def request_hit(self):
+        """Count decision found in per request cache."""
+        # NOTE(cfrademan): Counted without the lock, every policy check
+        # would otherwise serialise on it. Counters are approximate.
+        self._request_hits += 1
+
+    def miss(self):
+        """Count decision validated without a fingerprint."""
+        self._misses += 1
+
+    def stats(self):
+        """Return dict of hit and miss counters.
+
+        Counters are approximate with concurrent requests, request hits and
+        misses without a fingerprint are counted without locking.
+
+        'hit_rate' is the ratio of decisions served by either cache to all
+        decisions requested.
+        """
+        with self._lock:
+            total = self._request_hits + self._hits + self._misses
+            hits = self._request_hits + self._hits
+            return {'entries': len(self._decisions),
+                    'request_hits': self._request_hits,
+                    'hits': self._hits,
+                    'misses': self._misses,
+                    'hit_rate': hits / total if total else 0.0}
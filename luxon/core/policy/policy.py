@@ -28,10 +28,11 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
 # THE POSSIBILITY OF SUCH DAMAGE.
 
+from luxon import g
 from luxon.utils.timer import Timer
 from luxon.core.logger import GetLogger
 from luxon.core.policy import compiler
-from luxon.exceptions import AccessDeniedError
+from luxon.exceptions import AccessDeniedError, NoContextError
 
 log = GetLogger(__name__)
 
@@ -42,6 +43,8 @@ class Policy(object):
     Used to validate rules against environmental arguements provided as kwargs.
 
     rule_set can be provided which will be compiled for better performance.
+    Alternatively the result of compiler() can be provided, in which case the
+    rule set is not compiled again.
 
     Example of rule_set in dict format:
 
@@ -57,19 +60,58 @@ class Policy(object):
         By default following kwargs are given to policy runtime in wsgi:
             * req being equel to the Request Object for the request.
 
+    Decisions are cached per Policy object, normally for the duration of a
+    request. When a fingerprint is provided, decisions are also cached across
+    Policy objects using the same compiled rule set. The fingerprint must
+    capture every input the rules read from the environment, for example
+    the roles, domain, tenant and user_id of the credentials.
+
     Keyword Args:
         rule_set (dict): Rule Set in dict loaded from JSON file for example.
+        fingerprint (hashable): Fingerprint of the environment for caching
+            decisions across Policy objects.
+        expire (int): Epoch when decisions cached for fingerprint expire.
     """
     __slots__ = ('_kwargs',
                  '_compiled',
-                 '_rule_set')
-
-    def __init__(self, rule_set=None, **kwargs):
+                 '_rule_set',
+                 '_debug',
+                 '_decisions',
+                 '_fingerprint',
+                 '_expire')
+
+    def __init__(self, rule_set=None, fingerprint=None, expire=None,
+                 **kwargs):
         self._kwargs = kwargs
         if isinstance(rule_set, dict):
             self._compiled, self._rule_set = compiler(rule_set)
         else:
             self._compiled, self._rule_set = rule_set
+        self._decisions = {}
+        self._fingerprint = fingerprint
+        self._expire = expire
+        try:
+            self._debug = g.app.debug
+        except (AttributeError, NoContextError):
+            self._debug = False
+
+    @property
+    def fingerprint(self):
+        """Fingerprint decisions are cached for across Policy objects."""
+        return self._fingerprint
+
+    @property
+    def decisions(self):
+        """Decisions cache of compiled rule set."""
+        return self._compiled.decisions
+
+    def clear(self):
+        """Clear decisions cached by Policy object.
+
+        Required when the environment changes, for example credentials
+        scoped during the request.
+        """
+        self._decisions = {}
 
     def validate(self, rule, access_denied_raise=False):
         """Validate Access to view.
@@ -77,35 +119,65 @@ class Policy(object):
         Args:
             view (str): View Name
         """
+        try:
+            val = self._decisions[rule]
+            self._compiled.decisions.request_hit()
+            return val
+        except KeyError:
+            pass
+
+        if self._fingerprint is not None:
+            cached, val = self._compiled.decisions.get(self._fingerprint,
+                                                       rule)
+            if cached:
+                self._decisions[rule] = val
+                return val
+        else:
+            self._compiled.decisions.miss()
+
         # Default Value
         val = False
 
-        if rule not in self._rule_set:
+        try:
+            # Compiled rule function.
+            function = self._compiled[rule]
+        except KeyError:
             log.error("No such rule '%s'" % rule)
             return val
 
-        # Import bit, ensures save environment...
-        exec_globals = {'__builtins__': {}}
-        exec_globals = {'_validate_rule': rule}
-
-        # Add Policy environment Kwargs to be referenced in rule_set.
-        exec_globals.update(self._kwargs)
-
         try:
-            with Timer() as elapsed:
-                # Execute compiled rule_set code.
-                exec(self._compiled, exec_globals, exec_globals)
-                # Value from compiled code.
-                val = exec_globals['_validate_result']
-            log.info('Rule %s validated to %s.' % (rule, val),
-                     timer=elapsed())
+            if self._debug:
+                with Timer() as elapsed:
+                    val = function(self._kwargs)
+                log.info('Rule %s validated to %s.' % (rule, val),
+                         timer=elapsed())
+            else:
+                val = function(self._kwargs)
         except AccessDeniedError as e:
             if access_denied_raise:
                 raise
             else:
                 log.error("AccessDeniedError validating '%s' %s" %
                           (rule, e,))
+            return False
         except Exception as e:
             log.error("Failed validating '%s' %s:%s" %
                       (rule, e.__class__.__name__, e))
+            return False
+
+        self._decisions[rule] = val
+        if self._fingerprint is not None:
+            self._compiled.decisions.set(self._fingerprint, rule, val,
+                                         self._expire)
         return val
+
+    def validate_many(self, rules, access_denied_raise=False):
+        """Validate multiple rules.
+
+        Args:
+            rules (iterable): Rule names.
+
+        Returns dict of rule name and validated result.
+        """
+        return {rule: self.validate(rule, access_denied_raise)
+                for rule in rules}
@@ -40,6 +40,10 @@ _sa_models = []
 _middleware_pre = []
 _middleware_resource = []
 _middleware_post = []
+_validators = {}
+# Incremented when middleware or validators are registered,
+# used to re-freeze handlers.
+_version = 0
 _error_template = None
 _ajax_error_template = None
 g.javascripts = []
@@ -50,13 +54,51 @@ g.dashboards = []
 class Register(object):
     __slots__ = ()
 
-    def resource(self, method, route, tag=None, cache=0):
+    def resource(self, method, route, tag=None, cache=0, validator=None):
         def resource_wrapper(func):
             router.add(method, route, func, tag, cache)
+            if validator is not None:
+                self.validator(func)(validator)
             return func
 
         return resource_wrapper
 
+    def validator(self, resource):
+        """Register conditional GET validator for resource.
+
+        The validator is called with the same arguments as the resource
+        before running it. It should cheaply return a datetime of when the
+        response was last modified, or any other value such as a version
+        counter or row hash used as the ETag. When the 'If-None-Match' or
+        'If-Modified-Since' request headers match, 304 Not Modified is
+        returned without running the resource.
+
+        Example:
+            .. code:: python
+
+                @register.resource('GET', '/users', cache=60)
+                def users(req, resp):
+                    return sql_list(req, 'users')
+
+                @register.validator(users)
+                def users_updated(req, resp):
+                    with db() as conn:
+                        return conn.execute('SELECT max(updated_at) AS' +
+                                            ' updated_at FROM users'
+                                            ).fetchone()['updated_at']
+
+        Args:
+            resource (callable): Resource view function or method.
+        """
+        def validator_wrapper(func):
+            global _version
+
+            _validators[resource] = func
+            _version += 1
+            return func
+
+        return validator_wrapper
+
     def resources(self, *args, name=None, **kwargs):
         def resource_wrapper(cls):
             if name is not None:
@@ -88,6 +130,8 @@ class Register(object):
         return model_wrapper
 
     def middleware(self, middleware_class, *args, **kwargs):
+        global _version
+
         try:
             middleware_obj = middleware_class(*args, **kwargs)
 
@@ -99,6 +143,8 @@ class Register(object):
 
             if hasattr(middleware_obj, 'post'):
                 _middleware_post.append(middleware_obj.post)
+
+            _version += 1
         except Exception:
             trace = str(traceback.format_exc())
             log.critical("%s" % trace)
@@ -28,7 +28,12 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
 # THE POSSIBILITY OF SUCH DAMAGE.
 import re
+from threading import Lock
 from collections import OrderedDict
+try:
+    from re import _parser as sre_parse
+except ImportError:
+    import sre_parse
 
 from luxon.utils.cast import to_tuple
 from luxon.utils.objects import object_name
@@ -48,27 +53,112 @@ log = GetLogger(__name__)
 retype = type(re.compile('hello, world'))
 
 
+def _literal_prefix(pattern):
+    """Return literal prefix every match of compiled pattern starts with."""
+    if pattern.flags & re.IGNORECASE:
+        return ''
+
+    prefix = []
+    for op, av in sre_parse.parse(pattern.pattern, pattern.flags):
+        if op is sre_parse.AT and av in (sre_parse.AT_BEGINNING,
+                                         sre_parse.AT_BEGINNING_STRING):
+            if prefix:
+                break
+            continue
+        if op is not sre_parse.LITERAL:
+            break
+        prefix.append(chr(av))
+
+    return ''.join(prefix)
+
+
+class _RegexMatcher(object):
+    """Regex routes matcher.
+
+    Regex routes are indexed in a trie by the literal prefix of each
+    expression. Only the routes with a prefix matching the requested path
+    are tried, in the order they were added. Hence first match ordering is
+    kept while the bulk of the expressions are never executed.
+
+    Args:
+        regex_routes (list): Routes as stored by Router.add.
+    """
+    __slots__ = ('_routes', '_trie')
+
+    def __init__(self, regex_routes):
+        self._routes = tuple(regex_routes)
+        # Nodes are (children, route indexes).
+        self._trie = ({}, [],)
+
+        for index, regex_route in enumerate(self._routes):
+            node = self._trie
+            for char in _literal_prefix(regex_route[3]):
+                try:
+                    node = node[0][char]
+                except KeyError:
+                    node[0][char] = ({}, [],)
+                    node = node[0][char]
+            node[1].append(index)
+
+    def match(self, route):
+        node = self._trie
+        candidates = list(node[1])
+        for char in route:
+            try:
+                node = node[0][char]
+            except KeyError:
+                break
+            candidates.extend(node[1])
+
+        candidates.sort()
+        for index in candidates:
+            if self._routes[index][3].match(route):
+                return self._routes[index]
+
+        return None
+
+
 class Router(object):
     """ Simple Router Interface.
 
     The router is used to index and return views based on url and method.
 
+    Resolved routes are memoized in a bounded LRU cache keyed on
+    (method, route). The cache is cleared whenever a route is added.
+
+    Keyword Args:
+        cache_size (int): Maximum resolved routes to cache. (0 disables)
+
     Attributes:
         routes (list): List of tuples containing routes.
             e.g. [ ( 'GET', '/test', 'rule1', resource_view_object), ]
     """
-    __slots__ = ('_routers', '_routes', '_regex_routes', '_methods')
+    __slots__ = ('_routers', '_routes', '_regex_routes', '_methods',
+                 '_version', '_regex_matchers', '_cache', '_cache_size',
+                 '_cache_lock', '_cache_hits', '_cache_misses')
 
-    def __init__(self):
+    def __init__(self, cache_size=4096):
         self._routers = {}
         self._routes = {}
         self._regex_routes = {}
+        self._regex_matchers = {}
         self._methods = set([])
+        self._version = 0
+        self._cache = OrderedDict()
+        self._cache_size = cache_size
+        self._cache_lock = Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
 
     @property
     def methods(self):
         return self._methods
 
+    @property
+    def version(self):
+        """Incremented every time a route is added."""
+        return self._version
+
     @property
     def routes(self):
         routes = []
@@ -118,6 +208,26 @@ class Router(object):
 
         return routes
 
+    @property
+    def cache_info(self):
+        """Resolved route cache statistics.
+
+        Returns:
+            dict: hits, misses, size and max_size of cache.
+        """
+        with self._cache_lock:
+            return {'hits': self._cache_hits,
+                    'misses': self._cache_misses,
+                    'size': len(self._cache),
+                    'max_size': self._cache_size}
+
+    def cache_clear(self):
+        """Clear resolved route cache and statistics."""
+        with self._cache_lock:
+            self._cache.clear()
+            self._cache_hits = 0
+            self._cache_misses = 0
+
     def find(self, method, route):
         """Route based on Request Object.
 
@@ -133,7 +243,36 @@ class Router(object):
                 * HTTP_PATCH
                 * HTTP_DELETE
             route (str): The requested path to route.
+
+        Returns:
+            tuple: (resource, method, kwargs, route, tag, cache). The kwargs
+                dict is unique to the caller.
         """
+        key = (method, route,)
+
+        with self._cache_lock:
+            try:
+                found = self._cache[key]
+                self._cache.move_to_end(key)
+                self._cache_hits += 1
+            except KeyError:
+                found = None
+                self._cache_misses += 1
+
+        if found is None:
+            found = self._find(method, route)
+            # NOTE(cfrademan): Only resolved routes are cached, otherwise
+            # random paths that do not exist will evict valid routes.
+            if found[0] is not None and self._cache_size > 0:
+                with self._cache_lock:
+                    self._cache[key] = found
+                    if len(self._cache) > self._cache_size:
+                        self._cache.popitem(last=False)
+
+        resource, method, kwargs, route, tag, cache = found
+        return (resource, method, kwargs.copy(), route, tag, cache)
+
+    def _find(self, method, route):
         method = method.upper()
 
         if method + ':' + route.strip('/') in self._routes:
@@ -145,11 +284,14 @@ class Router(object):
         except KeyError:
             pass
         try:
-            for regex_route in self._regex_routes[method]:
-                if regex_route[3].match(route):
-                    return regex_route
+            matcher = self._regex_matchers[method]
         except KeyError:
-            pass
+            matcher = _RegexMatcher(self._regex_routes.get(method, ()))
+            self._regex_matchers[method] = matcher
+
+        found = matcher.match(route)
+        if found is not None:
+            return found
 
         # DEFAULT EMPTY
         return (None, None, {}, None, None, 0)
@@ -256,6 +398,9 @@ class Router(object):
                                                                tag,
                                                                cache)
         self._methods.add(method)
+        self._version += 1
+        self._regex_matchers = {}
+        self.cache_clear()
         log.info('Added Route: %s' % route +
                  ' Methods: %s' % str(methods) +
                  ' Resource: %s' % object_name(resource) +
@@ -27,6 +27,8 @@
 # CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
 # THE POSSIBILITY OF SUCH DAMAGE.
+import pickle
+from tempfile import TemporaryFile
 from logging import getLogger
 
 from sqlalchemy.ext.declarative import declarative_base
@@ -40,26 +42,56 @@ from luxon.structs.models.sqlmodel import SQLModel
 log = getLogger(__name__)
 
 
+class _SpooledRows(object):
+    """Rows of table spooled to temporary file.
+
+    Rows are pickled one at a time while streaming from the database and
+    unpickled while iterating, keeping memory constant for large tables.
+    """
+    __slots__ = ('_file', '_count')
+
+    def __init__(self, rows):
+        self._file = TemporaryFile()
+        self._count = 0
+        for row in rows:
+            pickle.dump(row, self._file, pickle.HIGHEST_PROTOCOL)
+            self._count += 1
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        self._file.seek(0)
+        for row in range(self._count):
+            yield pickle.load(self._file)
+
+    def close(self):
+        self._file.close()
+
+
 def backup_tables(conn):
     """Makes a backup of a database
 
     Retrieves the models in use and returns the corresponding tables and
     their entries from the database
 
+    Rows are read with a streaming cursor and spooled to temporary files.
+
     Args:
         conn (connection object): connection object for the database
 
     Returns:
         Dictionary containing all tables in the database.
-        Each entry is a list(rows) of sequences(elements in row)
+        Each entry is an iterable of rows (dict of column values)
         with the key being the table name
     """
     models = {}
     for Model in reversed(_models):
         if issubclass(Model, SQLModel):
             if conn.has_table(Model.model_name):
-                crsr = conn.execute("SELECT * FROM %s" % Model.model_name)
-                models[Model.model_name] = crsr.fetchall()
+                with conn.execute("SELECT * FROM %s" % Model.model_name,
+                                  stream=True) as crsr:
+                    models[Model.model_name] = _SpooledRows(crsr)
                 conn.commit()
     return models
 
@@ -97,13 +129,20 @@ def create_tables():
 def restore_tables(conn, backup):
     """Restores database from backup
 
+    Spooled rows from backup_tables are closed once restored.
+
     Args:
         conn (connection object): connection object of the database
         backup (dict): backup dictionary
     """
-    for Model in _models:
-        if issubclass(Model, SQLModel):
-            if Model.model_name in backup:
-                conn.insert(Model.model_name, backup[Model.model_name])
-            else:
-                conn.insert(Model.model_name, Model.db_default_rows)
+    try:
+        for Model in _models:
+            if issubclass(Model, SQLModel):
+                if Model.model_name in backup:
+                    conn.insert(Model.model_name, backup[Model.model_name])
+                else:
+                    conn.insert(Model.model_name, Model.db_default_rows)
+    finally:
+        for rows in backup.values():
+            if isinstance(rows, _SpooledRows):
+                rows.close()
@@ -29,11 +29,13 @@
 # THE POSSIBILITY OF SUCH DAMAGE.
 from ipaddress import ip_address
 from math import ceil
+from collections import OrderedDict
 from luxon.utils.sort import Itemgetter
 from luxon.helpers.access import validate_access, validate_set_scope
 
 from luxon import g
 from luxon import db
+from luxon.utils import js
 from luxon.utils.sql import (Select,
                              Field,
                              Value,
@@ -52,8 +54,154 @@ from luxon import GetLogger
 log = GetLogger(__name__)
 
 
+def _in_context(req, row):
+    # Row within domain and tenant context of request.
+    if ('domain' in row and
+            req.context_domain is not None):
+        if row['domain'] != req.context_domain:
+            return False
+    if ('tenant_id' in row and
+            req.context_tenant_id is not None):
+        if (row['tenant_id'] != req.context_tenant_id and
+                row['id'] != req.context_tenant_id):
+            return False
+    return True
+
+
+def _callback(row, callbacks):
+    # Parse callbacks on fields of row.
+    for callback in callbacks:
+        updates = {}
+        for column in row:
+            if column == callback:
+                if row[column] is not None:
+                    value = callbacks[callback](row[column])
+                    if isinstance(value, dict):
+                        updates.update(value)
+                    else:
+                        updates[callback] = value
+        row.update(updates)
+
+
+def _links(req, limit, page, rows, sort_query, search_query):
+    # Build links next &/ /previous and number of pages.
+    links = {}
+    if g.app.config.get('application', 'use_forwarded') is True:
+        resource = (req.forwarded_scheme + "://" +
+                    req.forwarded_host +
+                    req.app + req.route)
+    else:
+        resource = (req.scheme + "://" +
+                    req.netloc +
+                    req.app + req.route)
+
+    if limit > 0:
+        if page > 1:
+            links['previous'] = resource + '?limit=%s&page=%s' % (limit, page,)
+            links['previous'] += sort_query
+            links['previous'] += search_query
+
+        if page < ceil(rows / limit):
+            links['next'] = resource + '?limit=%s&page=%s' % (limit, page + 2,)
+            links['next'] += sort_query
+            links['next'] += search_query
+        pages = ceil(rows / limit)
+    else:
+        pages = 1
+
+    return links, pages
+
+
+class _Deferred(object):
+    # Encoded as JSON from result of function once previous values in
+    # streamed document have been encoded. Result is cached, the JSON
+    # default hook probes dict with hasattr before using it.
+    __slots__ = ('_func', '_value')
+
+    def __init__(self, func):
+        self._func = func
+
+    @property
+    def dict(self):
+        try:
+            return self._value
+        except AttributeError:
+            self._value = self._func()
+            return self._value
+
+
+class _StreamList(object):
+    # Rows streamed from query followed by links and metadata.
+    __slots__ = ('_req', '_rows', '_limit', '_page', '_callbacks',
+                 '_records', '_pages')
+
+    def __init__(self, req, rows, limit, callbacks=None):
+        self._req = req
+        self._rows = rows
+        self._limit = limit
+        self._page = int(req.query_params.get('page', 1))
+        self._callbacks = callbacks
+        self._records = 0
+        self._pages = None
+
+    def payload(self):
+        req = self._req
+        limit = self._limit
+        callbacks = self._callbacks
+        served = 0
+        for row in self._rows:
+            self._records += 1
+            if limit > 0 and served >= limit:
+                # Only counted for pages, query includes rows of
+                # following pages.
+                continue
+            if not _in_context(req, row):
+                continue
+            if callbacks:
+                _callback(row, callbacks)
+            served += 1
+            yield row
+
+        self._records += (self._page - 1) * limit
+
+    def _sort(self):
+        return to_list(self._req.query_params.get('sort'))
+
+    def links(self):
+        sort = self._sort()
+        sort_query = '&sort=%s' % sort[-1] if sort else ''
+        links, self._pages = _links(self._req, self._limit, self._page,
+                                    self._records, sort_query, '')
+        return links
+
+    def metadata(self):
+        return {
+            "records": self._records,
+            "page": self._page,
+            "pages": self._pages,
+            "per_page": self._limit,
+            "sort": self._sort(),
+            "search": to_list(self._req.query_params.get('search')),
+        }
+
+    def stream(self):
+        return js.JsonStream(OrderedDict((
+            ('payload', self.payload()),
+            ('links', _Deferred(self.links)),
+            ('metadata', _Deferred(self.metadata)),
+        )))
+
+
 def raw_list(req, data, limit=None, context=True, sql=False,
-             callbacks=None, **kwargs):
+             callbacks=None, stream=False, **kwargs):
+    """Build list response with pages, sorting and search.
+
+    Keyword Args:
+        stream (bool): Return luxon.utils.js.JsonStream, the response is
+            encoded while streamed. Only the encoding is streamed, data is
+            still filtered, sorted and paged in memory. Use sql_list with
+            stream to stream rows from the database.
+    """
     # Step 1 Build Pages
     if limit is None:
         limit = int(req.query_params.get('limit', 10))
@@ -72,16 +220,8 @@ def raw_list(req, data, limit=None, context=True, sql=False,
     result = []
     search_query = ''
     for row in data:
-        if context is True:
-            if ('domain' in row and
-                    req.context_domain is not None):
-                if row['domain'] != req.context_domain:
-                    continue
-            if ('tenant_id' in row and
-                    req.context_tenant_id is not None):
-                if (row['tenant_id'] != req.context_tenant_id and
-                    row['id'] != req.context_tenant_id):
-                    continue
+        if context is True and not _in_context(req, row):
+            continue
         if sql is False and to_list(req.query_params.get('search')):
             for search_field, value in search_params(req):
                 search_query += '&search=%s:%s' % (search_field, value,)
@@ -148,45 +288,13 @@ def raw_list(req, data, limit=None, context=True, sql=False,
     # Step 5 Parse callback on fields
     if callbacks:
         for row in result:
-            for callback in callbacks:
-                updates = {}
-                for column in row:
-                    if column == callback:
-                        if row[column] is not None:
-                            value = callbacks[callback](row[column])
-                            if isinstance(value, dict):
-                                updates.update(value)
-                            else:
-                                updates[callback] = value
-                row.update(updates)
+            _callback(row, callbacks)
 
     # Step 6 Build links next &/ /previous
-    links = {}
-    if g.app.config.get('application', 'use_forwarded') is True:
-        resource = (req.forwarded_scheme + "://" +
-                    req.forwarded_host +
-                    req.app + req.route)
-    else:
-        resource = (req.scheme + "://" +
-                    req.netloc +
-                    req.app + req.route)
-
-    if limit > 0:
-        if page > 1:
-            links['previous'] = resource + '?limit=%s&page=%s' % (limit, page,)
-            links['previous'] += sort_query
-            links['previous'] += search_query
-
-        if page < ceil(rows / limit):
-            links['next'] = resource + '?limit=%s&page=%s' % (limit, page + 2,)
-            links['next'] += sort_query
-            links['next'] += search_query
-        pages = ceil(rows / limit)
-    else:
-        pages = 1
+    links, pages = _links(req, limit, page, rows, sort_query, search_query)
 
     # Step 7 Finally return result
-    return {
+    result = {
         'links': links,
         'payload': result,
         'metadata': {
@@ -199,9 +307,41 @@ def raw_list(req, data, limit=None, context=True, sql=False,
         }
     }
 
+    if stream:
+        return js.JsonStream(result)
+
+    return result
+
+
+def _context_where(conn, req, select, context):
+    # Restrict select to domain and tenant context of request.
+    grouped = []
+    if isinstance(context, bool):
+        context = select._table
+
+    if (conn.has_field(context, 'domain') and
+            req.context_domain is not None):
+        grouped.append(Field(
+            '%s.domain' % context) == Value(req.context_domain))
+
+    if (conn.has_field(context, 'tenant_id') and
+            req.context_tenant_id is not None):
+        grouped.append(Field(
+            '%s.tenant_id' % context) == Value(
+                req.context_tenant_id))
+
+    if grouped:
+        select.where = Group(And(*grouped))
+
 
 def sql_list(req, select, fields={}, limit=None, order=True,
-             search=None, callbacks=None, context=True):
+             search=None, callbacks=None, context=True, stream=False):
+    """Build list response from query with pages, sorting and search.
+
+    Keyword Args:
+        stream (bool): Return luxon.utils.js.JsonStream, rows are encoded
+            while fetched from the query and streamed in the response.
+    """
 
     if not isinstance(select, Select):
         select = Select(select)
@@ -343,25 +483,22 @@ def sql_list(req, select, fields={}, limit=None, order=True,
         select.where = Group(Or(*conditions))
 
     # Step 5 Query
+    if stream:
+        def rows():
+            with db() as conn:
+                if context:
+                    _context_where(conn, req, select, context)
+
+                with conn.execute(select.query, select.values,
+                                  stream=True) as crsr:
+                    for row in crsr:
+                        yield row
+
+        return _StreamList(req, rows(), limit, callbacks).stream()
+
     with db() as conn:
         if context:
-            grouped = []
-            if isinstance(context, bool):
-                context = select._table
-
-            if (conn.has_field(context, 'domain') and
-                    req.context_domain is not None):
-                grouped.append(Field(
-                    '%s.domain' % context) == Value(req.context_domain))
-
-            if (conn.has_field(context, 'tenant_id') and
-                    req.context_tenant_id is not None):
-                grouped.append(Field(
-                    '%s.tenant_id' % context) == Value(
-                        req.context_tenant_id))
-
-            if grouped:
-                    select.where = Group(And(*grouped))
+            _context_where(conn, req, select, context)
 
         result = conn.execute(select.query, select.values).fetchall()
 
@@ -27,20 +27,46 @@
 # CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
 # THE POSSIBILITY OF SUCH DAMAGE.
+import math
+import time
 import pickle
+import random
+from threading import Lock, Event
+from collections import namedtuple
 
 from luxon.utils.objects import object_name
 from luxon.core.cache import Cache
+from luxon.core.cache.rd import Redis as RedisCache
+from luxon.core.cache.tiered import Tiered
+from luxon.helpers.rd import Redis
 from luxon.utils.hashing import md5sum
 from luxon.utils.objects import orderdict
 from operator import itemgetter
 
+# Cached result with epoch it expires and seconds it took to compute.
+_Entry = namedtuple('_Entry', ('value', 'expiry', 'delta'))
 
-def cache(expire, func, *args, **kwargs):
-    global _cache_engine
+# Results being computed in this process by reference.
+_flights = {}
+_flights_lock = Lock()
+
+
+class _Flight(object):
+    __slots__ = ('event', 'result', 'error')
 
-    _cache_engine = Cache()
+    def __init__(self):
+        self.event = Event()
+        self.result = None
+        self.error = None
 
+    def wait(self):
+        self.event.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+def _reference(func, args, kwargs):
     # mem args used to build reference id for cache.
     mem_args = [object_name(func), ]
 
@@ -51,7 +77,6 @@ def cache(expire, func, *args, **kwargs):
 
     # Handle Args
     scan_args += list(args)
-    
 
     # NOTE(cfrademan): This is important, we dont want object address,
     # types etc inside of the cache reference. We cannot memoize based
@@ -66,14 +91,121 @@ def cache(expire, func, *args, **kwargs):
                              " other than 'str', 'int', 'float', 'bytes'")
 
     # create the actual key / reference id.
-    key = md5sum(pickle.dumps(mem_args))
+    return md5sum(pickle.dumps(mem_args))
+
+
+def _expired(entry, now, beta):
+    # NOTE(cfrademan): Probabilistic early expiration, the closer to expiry
+    # and the longer the result took to compute, the more likely a caller
+    # will refresh the result before it expires.
+    if beta > 0:
+        now -= entry.delta * beta * math.log(1.0 - random.random())
+    return now >= entry.expiry
+
+
+def cached(func, args=(), kwargs={}, expire=60, stale=0, beta=0.0,
+           lock_timeout=30):
+    """Return cached result of callable.
+
+    Only one caller per process computes an expired or missing result, other
+    callers wait for its result. With the Redis cache backend only one
+    process computes the result, using a Redis lock.
+
+    Args:
+        func (callable): Function to call.
+        args (tuple): Positional arguments for func.
+        kwargs (dict): Keyword arguments for func.
 
-    cached = _cache_engine.load(key)
+    Keyword Args:
+        expire (int): Seconds to cache result.
+        stale (int): Seconds the expired result is served to other callers
+            while one caller refreshes it.
+        beta (float): Probabilistic early expiration factor, 1.0 is
+            recommended. Expires results early based on the time it took to
+            compute them. (default 0.0 disabled)
+        lock_timeout (int): Seconds the Redis lock is held at most.
+
+    Returns result of func.
+    """
+    cache = Cache()
+    key = _reference(func, args, kwargs)
+
+    entry = cache.load(key)
+    if not isinstance(entry, _Entry):
+        entry = None
+
+    now = time.time()
+    if entry is not None:
+        if not _expired(entry, now, beta):
+            return entry.value
+        if now >= entry.expiry + stale:
+            entry = None
+
+    with _flights_lock:
+        flight = _flights.get(key)
+        leader = flight is None
+        if leader:
+            flight = _flights[key] = _Flight()
+
+    if not leader:
+        if entry is not None:
+            # Serve stale value while refreshing.
+            return entry.value
+        return flight.wait()
+
+    lock = None
+    try:
+        if isinstance(cache._cached_backend, (RedisCache, Tiered,)):
+            with Redis() as redis:
+                if entry is not None:
+                    lock = redis.lock('cache:lock:' + key,
+                                      lock_timeout * 1000,
+                                      retry_count=0)
+                    if lock is None:
+                        # Another process is refreshing.
+                        flight.result = entry.value
+                        return entry.value
+                else:
+                    lock = redis.lock('cache:lock:' + key,
+                                      lock_timeout * 1000)
+                    # Another process may have stored the result already.
+                    entry = cache.load(key)
+                    if (isinstance(entry, _Entry) and
+                            not _expired(entry, time.time(), 0)):
+                        flight.result = entry.value
+                        return entry.value
+
+        start = time.time()
+        result = func(*args, **kwargs)
+        delta = time.time() - start
+        cache.store(key, _Entry(result, time.time() + expire, delta),
+                    expire + stale)
+        flight.result = result
+        return result
+    except Exception as e:
+        flight.error = e
+        raise
+    finally:
+        if lock is not None:
+            with Redis() as redis:
+                redis.unlock(lock)
+        with _flights_lock:
+            del _flights[key]
+        flight.event.set()
+
+
+def cache(expire, func, *args, **kwargs):
+    """Return cached result of callable.
 
-    if cached is not None:
-        return cached
+    Only one caller per process, or process with Redis cache backend,
+    computes an expired or missing result. See cached().
 
-    result = func(*args, **kwargs)
-    _cache_engine.store(key, result, expire)
+    Args:
+        expire (int): Seconds to cache result.
+        func (callable): Function to call.
+        args: Positional arguments for func.
+        kwargs: Keyword arguments for func.
 
-    return result
+    Returns result of func.
+    """
+    return cached(func, args, kwargs, expire=expire)
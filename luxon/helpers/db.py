@@ -28,12 +28,14 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
 # THE POSSIBILITY OF SUCH DAMAGE.
 import os
+from threading import Lock
 
 from luxon import g
 from luxon.utils.pool import Pool
 from luxon.core.db.mysql import connect
 
 _cached_pool = {}
+_lock = Lock()
 
 
 def _get_conn():
@@ -51,6 +53,25 @@ def _get_conn():
                        port=int(kwargs.get('port', 3306)))
 
 
+def _pool(get_conn):
+    """Return connection Pool as per the 'database' section.
+
+    Pool timeouts and ages are in seconds, 0 for max_lifetime and max_idle
+    disables them.
+    """
+    config = g.app.config
+    return Pool(get_conn,
+                pool_size=config.getint('database', 'pool_size'),
+                max_overflow=config.getint('database', 'max_overflow'),
+                timeout=config.getfloat('database', 'pool_timeout'),
+                min_size=config.getint('database', 'pool_min_size'),
+                ping_idle=config.getfloat('database', 'pool_ping_idle'),
+                max_lifetime=config.getfloat('database',
+                                             'pool_max_lifetime') or None,
+                max_idle=config.getfloat('database',
+                                         'pool_max_idle') or None)
+
+
 def db():
     """Function db - returns a Database Connection object from pool.
 
@@ -69,12 +90,12 @@ def db():
     kwargs = g.app.config.kwargs('database')
     global _cached_pool
     if kwargs.get('type') == 'mysql':
-        if _cached_pool.get(os.getpid()) is None:
-            _cached_pool[os.getpid()] = Pool(
-                _get_conn,
-                pool_size=kwargs.get('pool_size', 64),
-                max_overflow=kwargs.get('max_overflow', 0))
-        return _cached_pool[os.getpid()]()
+        pid = os.getpid()
+        if _cached_pool.get(pid) is None:
+            with _lock:
+                if _cached_pool.get(pid) is None:
+                    _cached_pool[pid] = _pool(_get_conn)
+        return _cached_pool[pid]()
     elif kwargs.get('type') == 'sqlite3':
         from luxon.core.db.sqlite import connect
         db = "sqlite3.db"
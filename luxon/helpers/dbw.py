@@ -28,12 +28,14 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
 # THE POSSIBILITY OF SUCH DAMAGE.
 import os
+from threading import Lock
 
 from luxon import g
-from luxon.utils.pool import Pool
+from luxon.helpers.db import _pool
 from luxon.core.db.mysql import connect
 
 _cached_pool = {}
+_lock = Lock()
 
 
 def _get_conn():
@@ -68,11 +70,11 @@ def dbw():
     kwargs = g.app.config.kwargs('database')
     global _cached_pool
     if kwargs.get('type') == 'mysql':
-        if _cached_pool.get(os.getpid()) is None:
-            _cached_pool[os.getpid()] = Pool(
-                _get_conn,
-                pool_size=kwargs.get('pool_size', 64),
-                max_overflow=kwargs.get('max_overflow', 0))
-        return _cached_pool[os.getpid()]()
+        pid = os.getpid()
+        if _cached_pool.get(pid) is None:
+            with _lock:
+                if _cached_pool.get(pid) is None:
+                    _cached_pool[pid] = _pool(_get_conn)
+        return _cached_pool[pid]()
     else:
         raise TypeError('Unknown Database type defined in configuration')
@@ -28,11 +28,23 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
 # THE POSSIBILITY OF SUCH DAMAGE.
 from luxon.utils.decorator import decorator
-from luxon.helpers.cache import cache
+from luxon.helpers.cache import cached
 
 
-def memoize(expire=3600):
+def memoize(expire=3600, stale=0, beta=0.0):
+    """Memoize decorator.
+
+    Caches the result of the decorated function by arguments. See
+    luxon.helpers.cache.cached().
+
+    Keyword Args:
+        expire (int): Seconds to cache result.
+        stale (int): Seconds the expired result is served to other callers
+            while one caller refreshes it.
+        beta (float): Probabilistic early expiration factor.
+    """
     def _memoize(func, *args, **kwargs):
-        return cache(expire, func, *args, *kwargs)
+        return cached(func, args, kwargs, expire=expire, stale=stale,
+                      beta=beta)
 
     return decorator(_memoize)
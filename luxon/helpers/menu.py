@@ -84,12 +84,16 @@ class Menu(object):
                 # Render for Submenu.
                 render_item(submenu, path_name[1:], href, **kwargs)
 
-        has_policy_engine = hasattr(req, 'policy')
+        if hasattr(req, 'policy'):
+            allowed = req.policy.validate_many(
+                {item[1] for item in self._items if item[1] is not None})
+        else:
+            allowed = {}
+
         # Run through items.
         for item in self._items:
             path_name, view, href, endpoint, kwargs = item
-            if (view is None or (has_policy_engine and
-                                 req.policy.validate(view))):
+            if view is None or allowed.get(view):
                 if (endpoint is None or endpoint in
                     g.current_request.context.api.endpoints):
                     path_name = path_name.strip('/').split('/')
@@ -70,3 +70,16 @@ def policy(**kwargs):
         _cached_compiled = compiler(policy)
 
     return Policy(_cached_compiled, **kwargs)
+
+
+def reload():
+    """Reload policy rule set.
+
+    The policy.json files are read and compiled again on the next policy()
+    call. Policy decisions cached for the previous rule set are discarded.
+    """
+    global _cached_compiled
+
+    if _cached_compiled is not None:
+        _cached_compiled[0].decisions.clear()
+    _cached_compiled = None
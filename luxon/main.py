@@ -43,6 +43,7 @@ from luxon import metadata
 from luxon.core.servers.web import server as web_server
 from luxon import db
 from luxon.utils.rsa import RSAKey
+from luxon.utils.ecc import ECKey, EdKey
 from luxon.utils.crypto import Crypto
 from luxon.utils.files import mkdir
 from luxon.utils.pkg import Module
@@ -94,15 +95,31 @@ def setup(args):
     mkdir('%s/templates/%s' % (path, args.pkg), recursive=True)
 
 
-def rsa(args):
-    """Generates a new RSA *private.pem* and *public.pem*"""
-    print("Generating new RSA private.pem and public.pem")
-    rsakey = RSAKey()
-    pk = rsakey.generate_private_key(password=args.password)
-    with Open(args.path.rstrip('/') + '/private.pem', 'w') as f:
-        f.write(pk)
-    with Open(args.path.rstrip('/') + '/public.pem', 'w') as f:
-        f.write(rsakey.public_key)
+def keys(args):
+    """Generates a new *private.pem* and *public.pem*
+
+    The key type is chosen by the JWT algorithm, RS256 (RSA), ES256 (NIST
+    P-256) or EdDSA (Ed25519). When rolling over, the new keys are placed
+    before the existing keys, which remain valid for validating tokens of
+    other algorithms.
+    """
+    print("Generating new %s private.pem and public.pem" % args.alg)
+    if args.alg == 'ES256':
+        key = ECKey()
+    elif args.alg == 'EdDSA':
+        key = EdKey()
+    else:
+        key = RSAKey()
+    pk = key.generate_private_key(password=args.password)
+
+    for pem, value in (('private.pem', pk),
+                       ('public.pem', key.public_key)):
+        path = args.path.rstrip('/') + '/' + pem
+        if args.rollover and exists(path):
+            with Open(path, 'r') as f:
+                value = value.rstrip('\n') + '\n' + f.read()
+        with Open(path, 'w') as f:
+            f.write(value)
 
 
 def gen_key(args):
@@ -213,8 +230,8 @@ def main(argv):
     group.add_argument('-r',
                        dest='funcs',
                        action='append_const',
-                       const=rsa,
-                       help='Generate RSA Private/Public Key pairs')
+                       const=keys,
+                       help='Generate Private/Public Key pairs')
 
     group.add_argument('-k',
                        dest='funcs',
@@ -223,9 +240,18 @@ def main(argv):
                        help='Generate Symmetrical Encryption Key')
 
     parser.add_argument('--password',
-                        help='RSA Private Key Password',
+                        help='Private Key Password',
                         default=None)
 
+    parser.add_argument('--alg',
+                        help='Key pair JWT Algorithm (RS256)',
+                        choices=('RS256', 'ES256', 'EdDSA'),
+                        default='RS256')
+
+    parser.add_argument('--rollover',
+                        help='Keep existing keys of other algorithms',
+                        action='store_true')
+
     parser.add_argument('--ip',
                         help='Binding IP Address (127.0.0.1)',
                         default='127.0.0.1')
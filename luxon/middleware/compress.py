@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2020 Christiaan Frans Rademan <chris@fwiw.co.za>.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+import zlib
+
+from luxon.utils.http import parse_headers_values
+
+# Content types compressed by default.
+COMPRESS_CONTENT_TYPES = ('text/',
+                          'application/json',
+                          'application/javascript',
+                          'application/xml',
+                          'image/svg+xml',)
+
+# Window bits for zlib.compressobj per content-coding.
+_WBITS = {'gzip': 31, 'deflate': 15}
+
+
+def accept_encoding(header):
+    """Negotiate content-coding from Accept-Encoding header.
+
+    Args:
+        header (str): Value of Accept-Encoding request header.
+
+    Returns:
+        str: 'gzip', 'deflate' or None.
+    """
+    accepted = {}
+
+    for value in parse_headers_values(header):
+        coding, _, params = value.partition(';')
+        coding = coding.strip().lower()
+        quality = 1.0
+        if params.strip().lower().startswith('q='):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding] = quality
+
+    for coding in ('gzip', 'deflate',):
+        if accepted.get(coding, accepted.get('*', 0.0)) > 0.0:
+            return coding
+
+    return None
+
+
+class CompressedStream(object):
+    """Compress response body stream incrementally.
+
+    Behaves like a file object for luxon.core.handlers.wsgi.Response.
+    Each read returns the next compressed chunk, hence file and iterable
+    bodies are never buffered completely in memory.
+
+    Args:
+        stream (obj): File like or iterable object returning bytes.
+        coding (str): Content-Coding 'gzip' or 'deflate'.
+
+    Keyword Args:
+        level (int): Compression level 1-9.
+        block_size (int): Size of blocks read from file like stream.
+    """
+    __slots__ = ('_stream', '_chunks', '_compressor')
+
+    def __init__(self, stream, coding, level=6, block_size=8192):
+        self._stream = stream
+        self._chunks = self._read(stream, block_size)
+        self._compressor = zlib.compressobj(level,
+                                            zlib.DEFLATED,
+                                            _WBITS[coding])
+
+    def _read(self, stream, block_size):
+        try:
+            # Rewind file like object to beginning
+            stream.seek(0)
+        except AttributeError:
+            pass
+
+        if hasattr(stream, 'read'):
+            while True:
+                chunk = stream.read(block_size)
+                if not chunk:
+                    break
+                yield chunk
+        else:
+            for chunk in stream:
+                yield chunk
+
+    def read(self, size=-1):
+        if self._compressor is None:
+            return b''
+
+        for chunk in self._chunks:
+            chunk = self._compressor.compress(chunk)
+            if chunk:
+                return chunk
+
+        chunk = self._compressor.flush()
+        self._compressor = None
+        return chunk
+
+    def close(self):
+        if hasattr(self._stream, 'close'):
+            self._stream.close()
+
+
+class Compress(object):
+    """Response Compression Middleware.
+
+    Compresses response bodies with gzip or deflate as per the request
+    'Accept-Encoding' header. Bytes bodies are compressed at once, while
+    file and iterable bodies are compressed while streaming.
+
+    Register it before other middleware, since 'post' middleware are
+    processed in reverse order and compression should be last.
+
+    Keyword Args:
+        min_size (int): Minimum size in bytes of body to compress.
+        content_types (tuple): Prefixes of content types to compress.
+        level (int): Compression level 1-9.
+
+    Example:
+        .. code:: python
+
+            from luxon import register
+            from luxon.middleware.compress import Compress
+
+            register.middleware(Compress, min_size=1024)
+    """
+    __slots__ = ('_min_size', '_content_types', '_level')
+
+    def __init__(self, min_size=1024, content_types=COMPRESS_CONTENT_TYPES,
+                 level=6):
+        self._min_size = min_size
+        self._content_types = tuple(content_types)
+        self._level = level
+
+    def post(self, req, resp, error):
+        if (resp.status in resp._BODILESS_STATUS_CODES or
+                req.method == 'HEAD' or
+                resp.get_header('Content-Encoding') or
+                resp._stream is None):
+            return
+
+        content_type = (resp.content_type or '').lower()
+        if not content_type.startswith(self._content_types):
+            return
+
+        # NOTE(cfrademan): Caches should uniquely cache on encoding even
+        # when not compressed for this request.
+        vary = resp.get_header('Vary')
+        if vary is None:
+            resp.set_header('Vary', 'Accept-Encoding')
+        elif 'accept-encoding' not in vary.lower():
+            resp.set_header('Vary', vary + ', Accept-Encoding')
+
+        if isinstance(resp._stream, bytes):
+            if len(resp._stream) < self._min_size:
+                return
+        elif hasattr(resp._stream, 'getbuffer'):
+            # BytesIO written to by responder.
+            if resp._stream.getbuffer().nbytes < self._min_size:
+                return
+        elif (resp._content_length and
+                int(resp._content_length) < self._min_size):
+            return
+
+        coding = accept_encoding(req.get_header('Accept-Encoding'))
+        if coding is None:
+            return
+
+        if isinstance(resp._stream, bytes):
+            compressor = zlib.compressobj(self._level,
+                                          zlib.DEFLATED,
+                                          _WBITS[coding])
+            resp._stream = (compressor.compress(resp._stream) +
+                            compressor.flush())
+        else:
+            resp._stream = CompressedStream(resp._stream,
+                                            coding,
+                                            level=self._level,
+                                            block_size=resp._STREAM_BLOCK_SIZE)
+
+        # Length is unknown for stream until compressed.
+        resp.content_length = None
+        resp.set_header('Content-Encoding', coding)
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2020 Christiaan Frans Rademan <chris@fwiw.co.za>.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+from contextvars import ContextVar
+
+
+class ContextDict(object):
+    """Dictionary for contexts.
+
+    Unique key/value hash table per thread and per asyncio task. Context for
+    hash table being the contextvars context, each thread starts with its
+    own context and each task runs in a copy of the context it was created
+    in.
+
+    Tasks created within a context share the hash table of the context.
+    Use *isolate* at the start of a task to use its own.
+
+    Define globally for process and not within thread to take advantage of
+    unique key/value pair functionality.
+    """
+    __slots__ = ('_context',)
+
+    def __init__(self):
+        self._context = ContextVar('context_dict')
+
+    @property
+    def _dict(self):
+        try:
+            return self._context.get()
+        except LookupError:
+            context = {}
+            self._context.set(context)
+            return context
+
+    def isolate(self):
+        """Use new hash table for current context."""
+        self._context.set({})
+
+    def __setitem__(self, key, value):
+        self._dict[key] = value
+
+    def __getitem__(self, key):
+        return self._dict[key]
+
+    def __contains__(self, key):
+        return key in self._dict
+
+    def __delitem__(self, key):
+        del self._dict[key]
+
+    def pop(self, key):
+        return self._dict.pop(key)
+
+    def __iter__(self):
+        return iter(self._dict)
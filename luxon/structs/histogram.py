@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2020 Christiaan Frans Rademan <chris@fwiw.co.za>.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+from bisect import bisect_left
+from threading import Lock
+from collections import OrderedDict
+
+# Default upper bounds of buckets in milliseconds.
+BUCKETS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class Histogram(object):
+    """Histogram of observed values.
+
+    Thread safe histogram counting observed values in buckets with fixed
+    upper bounds. Values greater than the last bound are counted in the
+    '+Inf' bucket.
+
+    Keyword Args:
+        buckets (tuple): Sorted upper bounds of buckets.
+    """
+    __slots__ = ('_buckets', '_counts', '_count', '_sum', '_min', '_max',
+                 '_lock')
+
+    def __init__(self, buckets=BUCKETS):
+        self._buckets = tuple(buckets)
+        self._lock = Lock()
+        self.clear()
+
+    def clear(self):
+        """Clear all observed values."""
+        self._counts = [0] * (len(self._buckets) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._min = None
+        self._max = None
+
+    def observe(self, value):
+        """Add observed value.
+
+        Args:
+            value (float): Observed value.
+        """
+        index = bisect_left(self._buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum += value
+            if self._min is None or value < self._min:
+                self._min = value
+            if self._max is None or value > self._max:
+                self._max = value
+
+    @property
+    def count(self):
+        return self._count
+
+    def to_dict(self):
+        """Return histogram as dict.
+
+        Returns:
+            dict: count, sum, min, max, mean and buckets with count of
+                values per upper bound.
+        """
+        with self._lock:
+            buckets = OrderedDict()
+            for bound, count in zip(self._buckets + ('+Inf',), self._counts):
+                buckets[str(bound)] = count
+
+            return {'count': self._count,
+                    'sum': self._sum,
+                    'min': self._min,
+                    'max': self._max,
+                    'mean': self._sum / self._count if self._count else None,
+                    'buckets': buckets}
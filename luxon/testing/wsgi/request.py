@@ -72,6 +72,8 @@ def request(app, method='GET', path='/', query_string='',
         env['wsgi.run_once'] = False
         env['wsgi.url_scheme'] = protocol
         env['wsgi.version'] = (1, 0)
+        if file_wrapper is not None:
+            env['wsgi.file_wrapper'] = file_wrapper
 
         for header in headers:
             if header.lower() == 'content-type':
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2020 Christiaan Frans Rademan <chris@fwiw.co.za>.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+import abc
+
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.asymmetric import ed25519
+
+from luxon.utils.encoding import (if_unicode_to_bytes,
+                                  if_bytes_to_unicode)
+
+
+class _Key(metaclass=abc.ABCMeta):
+    def __init__(self):
+        self._private_key = None
+        self._public_key = None
+
+    @abc.abstractmethod
+    def _generate(self):
+        """Return new private key for algorithm."""
+
+    def generate_private_key(self, password=None):
+        """Method to generate a private key.
+
+        Args:
+            password (str): Key password.
+
+        Returns:
+             Unicode encoded private key.
+        """
+        self._private_key = self._generate()
+        self._public_key = None
+
+        if password is not None:
+            password = if_unicode_to_bytes(password)
+            encryption_algorithm = serialization.BestAvailableEncryption(
+                password
+            )
+        else:
+            encryption_algorithm = serialization.NoEncryption()
+
+        return if_bytes_to_unicode(self._private_key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=encryption_algorithm
+        ))
+
+    @property
+    def public_key(self):
+        """Property to return the unicode encoded public key"""
+        if self._public_key is None and self._private_key is None:
+            raise ValueError('No Public or Private Key Loaded')
+
+        if self._public_key is None:
+            self._public_key = self._private_key.public_key()
+
+        return if_bytes_to_unicode(self._public_key.public_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo
+        ))
+
+
+class ECKey(_Key):
+    """Utility class to generate NIST P-256 keys for ES256 JWT Tokens.
+    """
+    def _generate(self):
+        return ec.generate_private_key(ec.SECP256R1(), default_backend())
+
+
+class EdKey(_Key):
+    """Utility class to generate Ed25519 keys for EdDSA JWT Tokens.
+    """
+    def _generate(self):
+        return ed25519.Ed25519PrivateKey.generate()
@@ -0,0 +1,388 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2020 Christiaan Frans Rademan <chris@fwiw.co.za>.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+from collections import OrderedDict
+from tempfile import SpooledTemporaryFile
+from urllib.parse import parse_qsl
+
+from luxon.exceptions import HTTPBadRequest, HTTPPayloadTooLarge
+
+# Maximum size of part headers in multipart form.
+_MAX_HEADER_SIZE = 64 * 1024  # 64 KiB
+
+
+def parse_header(line):
+    """Parse Content-Type or Content-Disposition like header.
+
+    Args:
+        line (str): Header value. (e.g. 'form-data; name="file"')
+
+    Returns:
+        tuple: (value, dict of parameters)
+    """
+    value, _, line = line.partition(';')
+    params = {}
+    while line:
+        line = line.lstrip(' \t;')
+        name, eq, line = line.partition('=')
+        if not eq:
+            break
+        line = line.lstrip()
+        if line[:1] == '"':
+            # Quoted string with escaped characters.
+            param = []
+            i = 1
+            while i < len(line) and line[i] != '"':
+                if line[i] == '\\' and i + 1 < len(line):
+                    i += 1
+                param.append(line[i])
+                i += 1
+            param = ''.join(param)
+            line = line[i + 1:].partition(';')[2]
+        else:
+            param, _, line = line.partition(';')
+            param = param.strip()
+        params[name.strip().lower()] = param
+
+    return value.strip().lower(), params
+
+
+class FormField(object):
+    """Form field or uploaded file.
+
+    Attributes:
+        name (str): Field name.
+        filename (str): Filename of uploaded file or None for fields.
+        type (str): Content type.
+        file (file): Uploaded file or None for fields.
+        value (str): Value of field or content of uploaded file (bytes).
+    """
+    __slots__ = ('name', 'filename', 'type', 'file', '_value')
+
+    def __init__(self, name, value=None, filename=None, type=None,
+                 file=None):
+        self.name = name
+        self.filename = filename
+        self.type = type
+        self.file = file
+        self._value = value
+
+    def __repr__(self):
+        return 'FormField(%r, %r)' % (self.name, self.filename or
+                                      self._value)
+
+    @property
+    def value(self):
+        if self.file is not None:
+            self.file.seek(0)
+            value = self.file.read()
+            self.file.seek(0)
+            return value
+        return self._value
+
+
+class Form(object):
+    """Form fields and uploaded files.
+
+    Provides the interface of cgi.FieldStorage used by luxon.
+    """
+    __slots__ = ('_fields',)
+
+    def __init__(self):
+        self._fields = OrderedDict()
+
+    def append(self, field):
+        try:
+            self._fields[field.name].append(field)
+        except KeyError:
+            self._fields[field.name] = [field]
+
+    def keys(self):
+        return list(self._fields.keys())
+
+    def __iter__(self):
+        return iter(self._fields)
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __contains__(self, name):
+        return name in self._fields
+
+    def __getitem__(self, name):
+        """Return field, or list of fields with multiple values."""
+        fields = self._fields[name]
+        if len(fields) == 1:
+            return fields[0]
+        return fields
+
+    def fields(self, name):
+        """Return list of fields for name."""
+        return self._fields.get(name, [])
+
+    def getfirst(self, name, default=None):
+        """Return first value for field."""
+        try:
+            return self._fields[name][0].value
+        except KeyError:
+            return default
+
+    def getlist(self, name):
+        """Return list of values for field."""
+        return [field.value for field in self.fields(name)]
+
+    def close(self):
+        """Close uploaded files."""
+        for fields in self._fields.values():
+            for field in fields:
+                if field.file is not None:
+                    field.file.close()
+
+
+class _Reader(object):
+    # Reads request payload in blocks within content length and the
+    # maximum size of form.
+    __slots__ = ('_stream', '_remaining', '_max_size', '_size',
+                 '_block_size')
+
+    def __init__(self, stream, content_length, max_size, block_size):
+        self._stream = stream
+        self._remaining = content_length or None
+        self._max_size = max_size
+        self._size = 0
+        self._block_size = block_size
+
+    def read(self):
+        size = self._block_size
+        if self._remaining is not None:
+            if self._remaining <= 0:
+                return b''
+            size = min(size, self._remaining)
+
+        block = self._stream.read(size)
+        if self._remaining is not None:
+            self._remaining -= len(block)
+
+        self._size += len(block)
+        if self._max_size and self._size > self._max_size:
+            raise HTTPPayloadTooLarge(
+                description="Form larger than %s bytes" % self._max_size)
+
+        return block
+
+
+class _Value(bytearray):
+    # Value of field written in parts.
+    def write(self, data):
+        self.extend(data)
+
+    def tell(self):
+        return len(self)
+
+    def getvalue(self):
+        return bytes(self)
+
+
+def _write(field, sink, data, max_size):
+    # Write data of field to file or value within maximum size.
+    if data:
+        sink.write(data)
+        if max_size and sink.tell() > max_size:
+            raise HTTPPayloadTooLarge(
+                description="Form field '%s' larger than %s bytes" % (
+                    field, max_size))
+
+
+def _multipart(form, reader, boundary, spool_size, max_field_size,
+               max_file_size):
+    delimiter = b'--' + boundary
+    marker = b'\n' + delimiter
+    buffer = b''
+
+    def readline():
+        # Return line without line ending from buffer.
+        nonlocal buffer
+        while True:
+            i = buffer.find(b'\n')
+            if i >= 0:
+                line = buffer[:i]
+                buffer = buffer[i + 1:]
+                return line.rstrip(b'\r')
+            if len(buffer) > _MAX_HEADER_SIZE:
+                raise HTTPBadRequest(
+                    description='Multipart form header too large')
+            block = reader.read()
+            if not block:
+                raise HTTPBadRequest(description='Incomplete multipart form')
+            buffer += block
+
+    # Preamble before first delimiter.
+    while True:
+        i = buffer.find(delimiter)
+        if i >= 0:
+            buffer = buffer[i + len(delimiter):]
+            break
+        block = reader.read()
+        if not block:
+            return
+        buffer = buffer[-len(delimiter):] + block
+
+    while True:
+        while len(buffer) < 2:
+            block = reader.read()
+            if not block:
+                return
+            buffer += block
+
+        if buffer[:2] == b'--':
+            # Close delimiter.
+            return
+
+        # Remainder of delimiter line.
+        readline()
+
+        # Part headers.
+        headers = {}
+        while True:
+            line = readline()
+            if not line:
+                break
+            name, _, value = line.decode('UTF-8', 'replace').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        disposition, params = parse_header(headers.get(
+            'content-disposition', ''))
+        name = params.get('name')
+        filename = params.get('filename')
+
+        if filename is not None:
+            content_type = headers.get('content-type',
+                                       'application/octet-stream')
+            sink = SpooledTemporaryFile(max_size=spool_size)
+            max_size = max_file_size
+        else:
+            content_type = headers.get('content-type', 'text/plain')
+            sink = _Value()
+            max_size = max_field_size
+
+        # Part body until next delimiter. The line ending before the
+        # delimiter is part of the delimiter.
+        while True:
+            i = buffer.find(marker)
+            if i >= 0:
+                data = buffer[:i]
+                if data[-1:] == b'\r':
+                    data = data[:-1]
+                _write(name, sink, data, max_size)
+                buffer = buffer[i + len(marker):]
+                break
+
+            # NOTE(cfrademan): Retain enough for a delimiter split between
+            # blocks, including the preceding carriage return.
+            safe = len(buffer) - len(marker) - 1
+            if safe > 0:
+                _write(name, sink, buffer[:safe], max_size)
+                buffer = buffer[safe:]
+
+            block = reader.read()
+            if not block:
+                raise HTTPBadRequest(description='Incomplete multipart form')
+            buffer += block
+
+        if filename is not None:
+            sink.seek(0)
+            form.append(FormField(name, filename=filename,
+                                  type=content_type, file=sink))
+        else:
+            form.append(FormField(name, sink.getvalue().decode('UTF-8',
+                                                               'replace'),
+                                  type=content_type))
+
+
+def parse(stream, content_type, content_length=None,
+          spool_size=1024 * 1024, max_field_size=0, max_file_size=0,
+          max_size=0, block_size=64 * 1024):
+    """Parse form from request payload while read.
+
+    Supports 'multipart/form-data' and 'application/x-www-form-urlencoded'.
+    Uploaded files are spooled to temporary files on disk once larger than
+    the spool size. Other content types result in an empty form.
+
+    Args:
+        stream (file): Request payload.
+        content_type (str): Content-Type header of request.
+
+    Keyword Args:
+        content_length (int): Content-Length of request.
+        spool_size (int): Maximum size of uploaded file in memory.
+        max_field_size (int): Maximum size of field value, 0 for no limit.
+        max_file_size (int): Maximum size of uploaded file, 0 for no limit.
+        max_size (int): Maximum size of form, 0 for no limit.
+        block_size (int): Size of blocks read from payload.
+
+    Returns:
+        Form: Form fields and uploaded files.
+
+    Raises:
+        HTTPBadRequest: Malformed form.
+        HTTPPayloadTooLarge: Form, field or file larger than limits.
+    """
+    form = Form()
+    content_type, params = parse_header(content_type or '')
+    reader = _Reader(stream, content_length, max_size, block_size)
+
+    if content_type == 'multipart/form-data':
+        boundary = params.get('boundary')
+        if not boundary:
+            raise HTTPBadRequest(description='Multipart form boundary'
+                                 ' missing')
+        try:
+            _multipart(form, reader, boundary.encode('latin1'), spool_size,
+                       max_field_size, max_file_size)
+        except Exception:
+            form.close()
+            raise
+    elif content_type == 'application/x-www-form-urlencoded':
+        payload = _Value()
+        while True:
+            block = reader.read()
+            if not block:
+                break
+            payload.write(block)
+
+        for name, value in parse_qsl(payload.decode('UTF-8', 'replace'),
+                                     keep_blank_values=True,
+                                     encoding='UTF-8', errors='replace'):
+            if max_field_size and len(value) > max_field_size:
+                raise HTTPPayloadTooLarge(
+                    description="Form field '%s' larger than %s bytes" % (
+                        name, max_field_size))
+            form.append(FormField(name, value))
+
+    return form
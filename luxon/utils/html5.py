@@ -38,18 +38,24 @@ from luxon.structs.htmldoc import HTMLDoc
 BR_P_HTML_TAG = re.compile('<(br.*?|/p)>', re.IGNORECASE)
 
 
-def strip_tags(html):
-    class _HTMLStripper(HTMLParser):
-        def __init__(self):
-            self.reset()
-            self.fed = []
-            self.convert_charrefs = True
+class _HTMLStripper(HTMLParser):
+    def __init__(self):
+        self.reset()
+        self.fed = []
+        self.convert_charrefs = True
+
+    def handle_data(self, d):
+        self.fed.append(d)
 
-        def handle_data(self, d):
-            self.fed.append(d)
+    def get_data(self):
+        return ''.join(self.fed)
 
-        def get_data(self):
-            return ''.join(self.fed)
+
+def strip_tags(html):
+    # NOTE(cfrademan): Without tags or character references there is
+    # nothing to strip.
+    if '<' not in html and '&' not in html:
+        return html
 
     html = BR_P_HTML_TAG.sub('\n', html)
     stripper = _HTMLStripper()
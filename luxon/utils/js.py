@@ -29,6 +29,8 @@
 # THE POSSIBILITY OF SUCH DAMAGE.
 import json
 import datetime
+from itertools import chain
+from collections.abc import Iterator
 from decimal import Decimal
 from ipaddress import IPv4Address, IPv6Address
 
@@ -36,6 +38,30 @@ from luxon.exceptions import JSONDecodeError
 from luxon.utils.timezone import format_datetime, to_user
 from luxon.utils.html5 import strip_tags
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _default(o):
+    # Objects not natively serializable to JSON.
+    if isinstance(o, Decimal):
+        # Parse Decimal Value
+        return str(o)
+    elif isinstance(o, datetime.datetime):
+        # Parse Datetime
+        return format_datetime(to_user(o))
+    elif isinstance(o, (IPv4Address, IPv6Address,)):
+        return str(o)
+    elif isinstance(o, bytes):
+        return strip_tags(o.decode('utf-8'))
+    elif hasattr(o, 'dict'):
+        return o.dict
+    else:
+        raise TypeError('Object of type %s' % o.__class__.__name__ +
+                        ' is not JSON serializable')
+
 
 class _JsonEncoder(json.JSONEncoder):
     """Custom encoder.
@@ -54,21 +80,110 @@ class _JsonEncoder(json.JSONEncoder):
         Returns:
             formatted data object
         """
-        if isinstance(o, Decimal):
-            # Parse Decimal Value
-            return str(o)
-        elif isinstance(o, datetime.datetime):
-            # Parse Datetime
-            return format_datetime(to_user(o))
-        elif isinstance(o, (IPv4Address, IPv6Address,)):
-            return str(o)
-        elif isinstance(o, bytes):
-            return strip_tags(o.decode('utf-8'))
-        elif hasattr(o, 'dict'):
-            return o.dict
-        else:
-            # Pass to Default Encoder
-            return json.JSONEncoder.default(self, o)
+        return _default(o)
+
+
+# Encoders by indentation and separators, encoders do not keep state
+# between calls.
+_encoders = {}
+
+
+def _encoder(indent, separators=None):
+    try:
+        return _encoders[(indent, separators)]
+    except KeyError:
+        encoder = _JsonEncoder(indent=indent, separators=separators)
+        _encoders[(indent, separators)] = encoder
+        return encoder
+
+
+def _stdlib_backend(indent):
+    if indent:
+        encode = _encoder(indent).encode
+    else:
+        # NOTE(cfrademan): Without indentation the C encoder is used.
+        encode = _encoder(None, (',', ':')).encode
+
+    def backend(obj):
+        return encode(obj).encode('UTF-8')
+
+    return backend
+
+
+def _orjson_backend():
+    # NOTE(cfrademan): Datetimes and dataclasses are passed to _default for
+    # the same output as the stdlib backend.
+    option = (orjson.OPT_NON_STR_KEYS |
+              orjson.OPT_PASSTHROUGH_DATETIME |
+              orjson.OPT_PASSTHROUGH_DATACLASS)
+    dumps = orjson.dumps
+    stdlib = _stdlib_backend(0)
+
+    def backend(obj):
+        try:
+            return dumps(obj, default=_default, option=option)
+        except TypeError:
+            # Such as integers larger than 64 bit.
+            return stdlib(obj)
+
+    return backend
+
+
+_backend = None
+
+# Indentation configured, used by JsonStream.
+_indent = 0
+
+
+def configure(backend='auto', indent=0):
+    """Configure JSON backend used by encode.
+
+    Backends:
+        * json: Python standard library json.
+        * orjson: orjson, requires 'pip install orjson'.
+        * auto: orjson if installed, otherwise json.
+
+    Output is compact without whitespace, unless indented. Indented output
+    always uses the standard library.
+
+    Keyword Args:
+        backend (str): JSON backend.
+        indent (int): Indentation level, 0 for compact output.
+    """
+    global _backend
+    global _indent
+
+    if backend not in ('auto', 'json', 'orjson'):
+        raise ValueError("Unknown JSON backend '%s'" % backend)
+
+    if backend == 'orjson' and orjson is None:
+        raise ImportError("JSON backend 'orjson' requires"
+                          " 'pip install orjson'")
+
+    _indent = indent
+
+    if indent or backend == 'json' or orjson is None:
+        _backend = _stdlib_backend(indent)
+    else:
+        _backend = _orjson_backend()
+
+
+def encode(obj):
+    """Serializes an object to JSON encoded as UTF-8.
+
+    Uses the backend configured with *configure*, by default compact
+    output with orjson if installed.
+
+    Args:
+        obj(obj): object to be serialized.
+
+    Returns:
+        bytes: JSON document.
+    """
+    if _backend is None:
+        configure()
+
+    return _backend(obj)
 
 
 def parse_load(parse):
@@ -86,9 +201,44 @@ def parse_load(parse):
         return parse
 
 
+def _strip(value, depth):
+    # NOTE(cfrademan): Strings were stripped once for every object
+    # containing them, stripping again only changes the value while it
+    # still contains tags or character references.
+    for i in range(depth):
+        if '<' not in value and '&' not in value:
+            break
+        value = strip_tags(value)
+    return value
+
+
+def _sanitise(obj):
+    # Strip tags from strings within objects in a single pass. Depth is the
+    # number of objects containing the value.
+    stack = [(obj, 0)]
+    while stack:
+        parent, depth = stack.pop()
+        if isinstance(parent, dict):
+            depth += 1
+            items = parent.items()
+        else:
+            items = enumerate(parent)
+
+        for key, value in items:
+            if isinstance(value, str):
+                if depth:
+                    parent[key] = _strip(value, depth)
+            elif isinstance(value, (dict, list)):
+                stack.append((value, depth))
+
+    return obj
+
+
 def loads(json_text, **kwargs):
     """Deserializes a json document to a python object.
 
+    Tags are stripped from strings within objects.
+
     Args:
         json_text (str/bytes): document to be deserialized.
 
@@ -100,12 +250,15 @@ def loads(json_text, **kwargs):
         # JSON requires str not bytes hence decode.
         json_text = json_text.decode('UTF-8')
     try:
-        obj = json.loads(json_text, object_hook=parse_load, **kwargs)
-        return obj
-
+        obj = json.loads(json_text, **kwargs)
     except json.decoder.JSONDecodeError as e:
         raise JSONDecodeError(e) from None
 
+    if isinstance(obj, (dict, list)):
+        return _sanitise(obj)
+
+    return obj
+
 
 def dumps(obj, indent=4):
     """Serializes an object as a JSON formatted stream.
@@ -116,4 +269,94 @@ def dumps(obj, indent=4):
     Returns:
         JSON formatted stream.
     """
-    return json.dumps(obj, indent=indent, cls=_JsonEncoder)
+    return _encoder(indent).encode(obj)
+
+
+class _Rows(list):
+    """Rows consumed from iterator while encoding.
+
+    The pure python encoder used by iterencode treats it as list, iterating
+    the rows without holding them.
+    """
+    __slots__ = ('_rows',)
+
+    def __init__(self, rows):
+        self._rows = rows
+
+    def __iter__(self):
+        return self._rows
+
+    def __bool__(self):
+        # NOTE(cfrademan): Encoder checks for empty list before iterating.
+        try:
+            first = next(self._rows)
+        except StopIteration:
+            return False
+        self._rows = chain((first,), self._rows)
+        return True
+
+
+class _JsonStreamEncoder(_JsonEncoder):
+    def default(self, o):
+        if isinstance(o, Iterator):
+            return _Rows(o)
+        return super().default(o)
+
+
+class JsonStream(object):
+    """JSON document encoded incrementally.
+
+    Iterators such as generators within the document are encoded as JSON
+    arrays while being consumed. Peak memory is that of a single row, and
+    the first chunks are available before the last row is produced.
+
+    Used as response body the document is streamed to the client.
+
+    **Example**
+
+    .. code:: python
+
+        def rows():
+            for row in cursor:
+                yield row
+
+        return js.JsonStream({'payload': rows()})
+
+    Args:
+        obj (obj): Object to be serialized.
+
+    Keyword Args:
+        indent (int): Indentation level, 0 for compact output. By default
+            as configured with *configure*, same as encode.
+        chunk_size (int): Minimum size of chunks in characters.
+    """
+    __slots__ = ('_obj', '_indent', '_chunk_size')
+
+    def __init__(self, obj, indent=None, chunk_size=8192):
+        self._obj = obj
+        self._indent = indent
+        self._chunk_size = chunk_size
+
+    def __iter__(self):
+        """Yields UTF-8 encoded chunks of document."""
+        indent = self._indent
+        if indent is None:
+            indent = _indent
+
+        if indent:
+            encoder = _JsonStreamEncoder(indent=indent)
+        else:
+            encoder = _JsonStreamEncoder(separators=(',', ':'))
+        chunk_size = self._chunk_size
+        buffer = []
+        size = 0
+        for chunk in encoder.iterencode(self._obj):
+            buffer.append(chunk)
+            size += len(chunk)
+            if size >= chunk_size:
+                yield ''.join(buffer).encode('UTF-8')
+                buffer = []
+                size = 0
+
+        if buffer:
+            yield ''.join(buffer).encode('UTF-8')
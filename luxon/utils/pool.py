@@ -1,209 +1,414 @@
-# -*- coding: utf-8 -*-
-#
-# Copyright (c) 2018 Dave Kruger.
-# All rights reserved.
-#
-# Copyright (c) 2018-2020 Christiaan Frans Rademan <chris@fwiw.co.za>.
-# All rights reserved.
-#
-# Redistribution and use in source and binary forms, with or without
-# modification, are permitted provided that the following conditions are met:
-#
-# * Redistributions of source code must retain the above copyright notice, this
-#   list of conditions and the following disclaimer.
-#
-# * Redistributions in binary form must reproduce the above copyright notice,
-#   this list of conditions and the following disclaimer in the documentation
-#   and/or other materials provided with the distribution.
-#
-# * Neither the name of the copyright holders nor the names of its
-#   contributors may be used to endorse or promote products derived from
-#   this software without specific prior written permission.
-#
-# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
-# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
-# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
-# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
-# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
-# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
-# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
-# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
-# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
-# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
-# THE POSSIBILITY OF SUCH DAMAGE.
-import queue
-import atexit
-
-from luxon.core.logger import GetLogger
-from luxon.exceptions import PoolExhausted
-from luxon.utils.objects import object_name
-
-log = GetLogger(__name__)
-
-
-def _log(msg, obj, pool):
-    log.debug('%s: %s (COUNT: %s, MAX_POOL_SIZE: %s, MAX_OVERFLOW %s' %
-              (msg, object_name(obj), pool._count,
-               pool._pool_size, pool._max_overflow))
-
-
-class ProxyObject(object):
-    """ Class ProxyObject
-
-    Class that creates objects with same attributes as
-    the original, but is also aware of object pool.
-
-    When the close() method is called on the Proxy object,
-    it will not really be closed, and instead simply returned
-    to the pool.
-
-    Unless the pool limit has been reached, in which case the real
-    close() method will be called on the object.
-
-    Args:
-        obj (obj): original (proxied) object.
-        pool (Pool): queue.Queue object which is the pool.
-    """
-
-    def __init__(self, obj, pool):
-        self._obj = obj
-        self._pool = pool
-
-    def __getattr__(self, attr):
-        if self._obj is None:
-            raise ReferenceError('Object already returned to pool %s'
-                                 % self._pool)
-
-        if attr[0] == '_':
-            return self.__dict__[attr]
-        else:
-            return getattr(self._obj, attr)
-
-    def __setattr__(self, attr, value):
-        if attr[0] == '_':
-            self.__dict__[attr] = value
-        else:
-            setattr(self._obj, attr, value)
-
-    def _close_or_return(self):
-        """ Method _close_or_return().
-
-        Internal Method that either returns the object to the pool,
-        or closes the proxied object in the case where the pool_size
-        has been reached.
-        """
-        if self._pool._count <= self._pool._pool_size:
-            _log('Returning object to pool', self._obj, self._pool)
-            try:
-                self._obj.clean_up()
-            except AttributeError:
-                pass
-            self._pool._queue.put(self._obj)
-        else:
-            try:
-                self._obj.close()
-            except AttributeError:
-                pass
-            # Since we have closed the connection,
-            # we can now decrease spawn count to allow
-            # for one more instance.
-            self._pool._count -= 1
-
-        # In order to prevent the use of the connector object after
-        # its returned, the proxied object is deleted.
-        self._obj = None
-
-    def close(self):
-        """ Method close()
-
-        Put back in queue this proxy object.
-        But only if we have not exceeded pool_size.
-        """
-        self._close_or_return()
-
-    def __enter__(self):
-        # Used when entering the with statement.
-        return self
-
-    def __exit__(self, type, value, traceback):
-        # When exiting the with statement.
-        self._close_or_return()
-
-
-class Pool(object):
-    """ Class Pool.
-
-    Pool manager for any objects such as db connections.
-
-    Specify pool_size and max_overflow when creating the pool object.
-    Call it to obtain a connector object. If one is available in the pool,
-    it will be returned, otherwise a new object will be created and returned.
-
-    Args:
-        get_obj_func (obj): The function that creates and returns the connector object.
-        pool_size (int): Length of the queue. At any given time no more than this many objects will
-                         exist in the queue.
-        max_overflow (int): How many objects can be created over an
-                            above the pool size. The maximum
-                            number of objects that will exist at any given time equals the sum of pool_size
-                            and max_overflow. When the number of created objects exceed the pool_size, the next object
-                            to be closed will really be closed and not returned to the pool.
-
-    Example:
-        .. code:: python
-
-            def someFunc():
-                return some_connector_object
-
-            pool = Pool(someFunc, pool_size=10, max_overflow=10)
-
-            conn = pool()
-            conn.someMethod()
-            conn.close()
-
-        or
-
-        .. code:: python
-
-            with pool() as conn:
-                conn.someMethod()
-    """
-
-    def __init__(self, get_obj_func, pool_size=10, max_overflow=10):
-        self._pool_size = pool_size
-        self._max_overflow = max_overflow
-        self._queue = queue.Queue(maxsize=pool_size)
-        self._get_obj_func = get_obj_func
-        self._count = 0
-
-    def __call__(self):
-        count = self._count
-        pool_size = self._pool_size
-        max_pool_size = pool_size + self._max_overflow
-        if count < max_pool_size:
-            q = self._queue
-
-            # First trying to get object from the pool
-            # (connector obj returned from from get_obj_func)
-            try:
-                # if in queue, grab it there
-                _get_obj = q.get(False)
-                try:
-                    _get_obj.ping()
-                except AttributeError:
-                    pass
-                _log('Using object from pool', _get_obj, self)
-            except queue.Empty:
-                # If not in queue
-                # create new conn object.
-                _get_obj = self._get_obj_func()
-                self._count += 1
-                _log('Created new object', _get_obj, self)
-                try:
-                    atexit.register(_get_obj.close)
-                except AttributeError:
-                    pass
-
-            return ProxyObject(_get_obj, self)
-        else:
-            raise PoolExhausted(self._get_obj_func.__name__, self._count)
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2018 Dave Kruger.
+# All rights reserved.
+#
+# Copyright (c) 2018-2020 Christiaan Frans Rademan <chris@fwiw.co.za>.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+import time
+import atexit
+from threading import Lock, Condition
+
+from luxon.core.logger import GetLogger
+from luxon.exceptions import PoolExhausted
+from luxon.utils.objects import object_name
+
+log = GetLogger(__name__)
+
+
+def _log(msg, obj, pool):
+    log.debug('%s: %s (COUNT: %s, MAX_POOL_SIZE: %s, MAX_OVERFLOW %s' %
+              (msg, object_name(obj), pool._count,
+               pool._pool_size, pool._max_overflow))
+
+
+def _close(obj):
+    try:
+        obj.close()
+    except AttributeError:
+        pass
+    except Exception as e:
+        log.warning('Failed closing %s: %s' % (object_name(obj), e))
+
+
+class _Entry(object):
+    # Pooled object with monotonic time created and last returned.
+    __slots__ = ('obj', 'created', 'used')
+
+    def __init__(self, obj):
+        self.obj = obj
+        self.created = self.used = time.monotonic()
+
+
+class ProxyObject(object):
+    """ Class ProxyObject
+
+    Class that creates objects with same attributes as
+    the original, but is also aware of object pool.
+
+    When the close() method is called on the Proxy object,
+    it will not really be closed, and instead simply returned
+    to the pool.
+
+    Unless the pool limit has been reached, in which case the real
+    close() method will be called on the object.
+
+    Closing the proxy more than once has no effect.
+
+    Args:
+        obj (obj): original (proxied) object.
+        pool (Pool): Pool the object belongs to.
+        entry (_Entry): Pool entry of object.
+    """
+
+    def __init__(self, obj, pool, entry=None):
+        self._obj = obj
+        self._pool = pool
+        self._entry = entry
+
+    def __getattr__(self, attr):
+        if self._obj is None:
+            raise ReferenceError('Object already returned to pool %s'
+                                 % self._pool)
+
+        if attr[0] == '_':
+            return self.__dict__[attr]
+        else:
+            return getattr(self._obj, attr)
+
+    def __setattr__(self, attr, value):
+        if attr[0] == '_':
+            self.__dict__[attr] = value
+        else:
+            setattr(self._obj, attr, value)
+
+    def _close_or_return(self):
+        """ Method _close_or_return().
+
+        Internal Method that either returns the object to the pool,
+        or closes the proxied object in the case where the pool_size
+        has been reached.
+        """
+        obj = self.__dict__['_obj']
+        if obj is None:
+            return
+
+        # In order to prevent the use of the connector object after
+        # its returned, the proxied object is deleted.
+        self._obj = None
+        self._pool._return(self._entry)
+
+    def close(self):
+        """ Method close()
+
+        Put back in queue this proxy object.
+        But only if we have not exceeded pool_size.
+        """
+        self._close_or_return()
+
+    def __enter__(self):
+        # Used when entering the with statement.
+        return self
+
+    def __exit__(self, type, value, traceback):
+        # When exiting the with statement.
+        self._close_or_return()
+
+
+class Pool(object):
+    """ Class Pool.
+
+    Pool manager for any objects such as db connections.
+
+    Specify pool_size and max_overflow when creating the pool object.
+    Call it to obtain a connector object. If one is available in the pool,
+    it will be returned, otherwise a new object will be created and returned.
+
+    Idle objects are reused last in first out, keeping the most recently
+    used connections warm while the rest age out using max_idle. Objects
+    are only pinged when idle for longer than ping_idle.
+
+    Args:
+        get_obj_func (obj): The function that creates and returns the connector object.
+        pool_size (int): Length of the queue. At any given time no more than this many objects will
+                         exist in the queue.
+        max_overflow (int): How many objects can be created over an
+                            above the pool size. The maximum
+                            number of objects that will exist at any given time equals the sum of pool_size
+                            and max_overflow. When the number of created objects exceed the pool_size, the next object
+                            to be closed will really be closed and not returned to the pool.
+
+    Keyword Args:
+        timeout (float): Seconds to wait for an object when the pool is
+                         exhausted before raising PoolExhausted. 0 raises
+                         immediately and None waits forever.
+        min_size (int): Objects created when the pool is created and kept
+                        when reaping idle objects.
+        ping_idle (float): Seconds idle after which ping() is called on
+                           checkout. 0 pings on every checkout.
+        max_lifetime (float): Seconds after which objects are closed and
+                              replaced. None for no limit.
+        max_idle (float): Seconds idle after which objects are closed.
+                          None for no limit.
+
+    Example:
+        .. code:: python
+
+            def someFunc():
+                return some_connector_object
+
+            pool = Pool(someFunc, pool_size=10, max_overflow=10)
+
+            conn = pool()
+            conn.someMethod()
+            conn.close()
+
+        or
+
+        .. code:: python
+
+            with pool() as conn:
+                conn.someMethod()
+    """
+
+    def __init__(self, get_obj_func, pool_size=10, max_overflow=10,
+                 timeout=0, min_size=0, ping_idle=30, max_lifetime=None,
+                 max_idle=None):
+        self._pool_size = pool_size
+        self._max_overflow = max_overflow
+        self._get_obj_func = get_obj_func
+        self._timeout = timeout
+        self._min_size = min(min_size, pool_size)
+        self._ping_idle = ping_idle
+        self._max_lifetime = max_lifetime
+        self._max_idle = max_idle
+        self._lock = Lock()
+        self._available = Condition(self._lock)
+        self._idle = []
+        self._count = 0
+        self._closed = False
+        self._waits = 0
+        self._wait_time = 0.0
+        self._created = 0
+        self._recycled = 0
+
+        atexit.register(self.close)
+
+        self.warm()
+
+    def __call__(self):
+        entry, reaped = self._checkout()
+
+        for expired in reaped:
+            _close(expired.obj)
+
+        if entry is None:
+            entry = self._create()
+        elif time.monotonic() - entry.used >= self._ping_idle:
+            try:
+                entry.obj.ping()
+            except AttributeError:
+                pass
+            except Exception as e:
+                # NOTE(cfrademan): The count stays reserved for the
+                # replacement, _create releases it if creating fails.
+                log.warning('Ping failed %s: %s' % (object_name(entry.obj),
+                                                    e))
+                _close(entry.obj)
+                entry = self._create()
+                return ProxyObject(entry.obj, self, entry)
+            _log('Using object from pool', entry.obj, self)
+
+        return ProxyObject(entry.obj, self, entry)
+
+    def _checkout(self):
+        """Reserve idle object or count for new object.
+
+        Returns tuple of entry, None to create new object, and list of
+        entries reaped to be closed outside of the lock.
+        """
+        max_pool_size = self._pool_size + self._max_overflow
+        deadline = None
+        waited = None
+        with self._lock:
+            reaped = self._reap()
+            while True:
+                if self._idle:
+                    entry = self._idle.pop()
+                    break
+                if self._count < max_pool_size:
+                    self._count += 1
+                    entry = None
+                    break
+
+                if waited is None:
+                    waited = time.monotonic()
+                    self._waits += 1
+                    if self._timeout is not None:
+                        deadline = waited + self._timeout
+
+                if deadline is None:
+                    self._available.wait()
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or not self._available.wait(remaining):
+                        self._wait_time += time.monotonic() - waited
+                        raise PoolExhausted(self._get_obj_func.__name__,
+                                            self._count)
+
+            if waited is not None:
+                self._wait_time += time.monotonic() - waited
+
+        return (entry, reaped)
+
+    def _reap(self):
+        """Remove expired idle objects, lock must be held.
+
+        Objects are closed by the caller outside of the lock.
+        """
+        if self._max_lifetime is None and self._max_idle is None:
+            return []
+
+        now = time.monotonic()
+        reaped = []
+        keep = []
+        # NOTE(cfrademan): Idle is a stack, least recently used first.
+        for entry in self._idle:
+            if (self._max_lifetime is not None and
+                    now - entry.created >= self._max_lifetime):
+                reaped.append(entry)
+            elif (self._max_idle is not None and
+                    now - entry.used >= self._max_idle and
+                    self._count - len(reaped) > self._min_size):
+                reaped.append(entry)
+            else:
+                keep.append(entry)
+
+        if reaped:
+            self._idle = keep
+            self._count -= len(reaped)
+            self._recycled += len(reaped)
+            for entry in reaped:
+                _log('Recycled object', entry.obj, self)
+
+        return reaped
+
+    def _create(self):
+        """Create new object, count must already be reserved."""
+        try:
+            entry = _Entry(self._get_obj_func())
+        except Exception:
+            with self._lock:
+                self._count -= 1
+                self._available.notify()
+            raise
+
+        with self._lock:
+            self._created += 1
+        _log('Created new object', entry.obj, self)
+        return entry
+
+    def _return(self, entry):
+        """Return checked out object to pool or close it."""
+        obj = entry.obj
+        recycle = (self._max_lifetime is not None and
+                   time.monotonic() - entry.created >= self._max_lifetime)
+
+        if not recycle:
+            try:
+                obj.clean_up()
+            except AttributeError:
+                pass
+            except Exception:
+                # NOTE(cfrademan): Object in unknown state, its closed and
+                # the count released.
+                with self._lock:
+                    self._count -= 1
+                    self._available.notify()
+                _close(obj)
+                raise
+
+        with self._lock:
+            if (recycle or self._closed or
+                    self._count > self._pool_size):
+                # Since we close the object, we can now decrease spawn
+                # count to allow for one more instance.
+                self._count -= 1
+                if recycle:
+                    self._recycled += 1
+                close = True
+            else:
+                entry.used = time.monotonic()
+                self._idle.append(entry)
+                close = False
+            self._available.notify()
+
+        if close:
+            _log('Closing object', obj, self)
+            _close(obj)
+        else:
+            _log('Returning object to pool', obj, self)
+
+    def warm(self):
+        """Create objects until the pool holds min_size objects."""
+        while True:
+            with self._lock:
+                if self._closed or self._count >= self._min_size:
+                    return
+                self._count += 1
+
+            self._return(self._create())
+
+    def stats(self):
+        """Return pool statistics.
+
+        Returns dict with size (objects in existance), idle, in_use,
+        waits (checkouts that had to wait), wait_time (total seconds
+        waited), created and recycled (closed for max_lifetime or
+        max_idle).
+        """
+        with self._lock:
+            return {'size': self._count,
+                    'idle': len(self._idle),
+                    'in_use': self._count - len(self._idle),
+                    'waits': self._waits,
+                    'wait_time': self._wait_time,
+                    'created': self._created,
+                    'recycled': self._recycled}
+
+    def close(self):
+        """Close idle objects.
+
+        Objects checked out are closed when returned.
+        """
+        with self._lock:
+            self._closed = True
+            idle = self._idle
+            self._idle = []
+            self._count -= len(idle)
+            self._available.notify_all()
+
+        for entry in idle:
+            _close(entry.obj)
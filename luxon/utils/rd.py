@@ -67,24 +67,41 @@ class Redis(object):
                 # redlock already slept for retry-delay
                 continue
 
+            return None
+
     def unlock(self, lock):
         dlm = redlock.Redlock([self._redis])
         lock = redlock.Lock(0, lock.resource, lock.key)
         dlm.unlock(lock)
 
-    def set(self, attr, value, expire=None):
-        value = pickle.dumps(value)
+    def set(self, attr, value, expire=None, pickled=False):
+        if not pickled:
+            value = pickle.dumps(value)
         self._redis.set(attr, value, ex=expire)
 
-    def delete(self, attr, value):
+    def delete(self, attr, value=None):
         return self._redis.delete(attr)
 
-    def get(self, attr):
+    def get(self, attr, pickled=False):
         value = self._redis.get(attr)
-        if value is not None:
+        if value is not None and not pickled:
             return pickle.loads(value)
         else:
-            return None
+            return value
+
+    def publish(self, channel, message):
+        return self._redis.publish(channel, message)
+
+    def subscribe(self, *channels):
+        """Generator of messages published on channels."""
+        pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(*channels)
+        try:
+            for message in pubsub.listen():
+                if message['type'] == 'message':
+                    yield message['data']
+        finally:
+            pubsub.close()
 
     def __setatrr__(self, attr, value):
         return self.set(attr, value)
@@ -28,6 +28,8 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
 # THE POSSIBILITY OF SUCH DAMAGE.
 
+from threading import RLock
+
 from luxon.structs.threaddict import ThreadDict
 
 
@@ -80,14 +82,18 @@ class Singleton(type):
     """Singleton MetaClass
 
     Ensure class is not duplicated and always references
-    initial instantiated object.
+    initial instantiated object. Thread safe, concurrent first calls
+    instantiate the object once.
     """
     _instances = {}
+    _lock = RLock()
 
     def __call__(cls, *args, **kwargs):
         if cls not in cls._instances:
-            cls._instances[cls] = super(
-                Singleton, cls).__call__(*args, **kwargs)
+            with Singleton._lock:
+                if cls not in cls._instances:
+                    cls._instances[cls] = super(
+                        Singleton, cls).__call__(*args, **kwargs)
 
         if hasattr(cls._instances[cls], '_singleton_init'):
             cls._instances[cls]._singleton_init
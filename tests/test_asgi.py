@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2020 Christiaan Frans Rademan <chris@fwiw.co.za>.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+import os
+import json
+import asyncio
+
+import pytest
+
+from luxon import g, register
+
+
+@pytest.fixture(scope="module")
+def app():
+    from luxon.core.handlers.asgi import Asgi
+    app_root = os.path.abspath(os.path.dirname(__file__))
+    previous = g.app
+    yield Asgi(__name__, app_root + '/wsgi')
+    g.app = previous
+
+
+@register.resource('GET', '/asgi/sync/{id}')
+def sync_view(req, resp, id):
+    return {'id': id, 'request': g.current_request is req}
+
+
+@register.resource('POST', '/asgi/async')
+async def async_view(req, resp):
+    await asyncio.sleep(0.01)
+    return {'json': req.json, 'request': g.current_request is req}
+
+
+def request(app, method, path, body=b'', headers=()):
+    scope = {'type': 'http',
+             'http_version': '1.1',
+             'method': method,
+             'scheme': 'http',
+             'path': path,
+             'root_path': '',
+             'query_string': b'',
+             'headers': [(b'host', b'tachyonic.org')] + list(headers),
+             'server': ('tachyonic.org', 80),
+             'client': ('127.0.0.1', 12345)}
+    messages = [{'type': 'http.request', 'body': body[:2],
+                 'more_body': True},
+                {'type': 'http.request', 'body': body[2:]}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    return app(scope, receive, send), sent
+
+
+def test_asgi(app):
+    requests = [request(app, 'GET', '/asgi/sync/%s' % i) for i in range(5)]
+    requests.append(request(app, 'POST', '/asgi/async', b'{"a": 1}',
+                            [(b'content-type', b'application/json')]))
+    requests.append(request(app, 'GET', '/asgi/not_found'))
+
+    loop = asyncio.new_event_loop()
+    try:
+        async def main():
+            await asyncio.gather(*[r[0] for r in requests])
+
+        loop.run_until_complete(main())
+    finally:
+        loop.close()
+
+    for i, (_, sent) in enumerate(requests[:5]):
+        assert sent[0]['type'] == 'http.response.start'
+        assert sent[0]['status'] == 200
+        assert (b'content-type',
+                b'application/json; charset=utf-8') in sent[0]['headers']
+        assert json.loads(sent[1]['body']) == {'id': str(i),
+                                               'request': True}
+
+    sent = requests[5][1]
+    assert sent[0]['status'] == 200
+    assert json.loads(sent[1]['body']) == {'json': {'a': 1},
+                                           'request': True}
+
+    sent = requests[6][1]
+    assert sent[0]['status'] == 404
+
+
+def test_asgi_environ_headers():
+    from luxon.core.handlers.asgi.request import environ
+
+    env = environ({'method': 'GET',
+                   'path': '/',
+                   'headers': [(b'cookie', b'a=1'),
+                               (b'cookie', b'b=2'),
+                               (b'accept', b'text/html'),
+                               (b'accept', b'text/plain')]}, None)
+    assert env['HTTP_COOKIE'] == 'a=1; b=2'
+    assert env['HTTP_ACCEPT'] == 'text/html,text/plain'
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2020 Christiaan Frans Rademan <chris@fwiw.co.za>.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+import os
+import tempfile
+
+import pytest
+from authlib.jose.errors import BadSignatureError
+
+from luxon import g
+from luxon.exceptions import NoContextError
+
+
+def keys(path):
+    from luxon.utils.rsa import RSAKey
+    rsakey = RSAKey()
+    with open(path + '/private.pem', 'w') as f:
+        f.write(rsakey.generate_private_key(bits=2048))
+    with open(path + '/public.pem', 'w') as f:
+        f.write(rsakey.public_key)
+
+
+@pytest.fixture(scope="module")
+def app():
+    from luxon.core.app import App
+    try:
+        previous = g.app
+    except NoContextError:
+        previous = None
+    path = tempfile.mkdtemp()
+    keys(path)
+    yield App(__name__, path)
+    if previous is not None:
+        g.app = previous
+
+
+def test_auth_cache(app):
+    from luxon.core.auth import Auth, tokens, _keys
+
+    auth = Auth(expire=60)
+    auth.new('user', username='user', roles=['Admin'])
+    token = auth.token
+
+    auth = Auth(expire=60)
+    auth.token = token
+    assert auth.user_id == 'user'
+    assert tokens.get(token, auth._public_keys) is not None
+
+    # Scoping cached claims does not modify the cache.
+    auth.tenant_id = 'tenant'
+    auth = Auth(expire=60)
+    auth.token = token
+    assert auth.tenant_id is None
+    assert auth.roles == ('Admin',)
+
+    # Keys are reloaded when changed, invalidating verified tokens.
+    key = _keys[app.path + '/public.pem'][1]
+    assert Auth()._public_keys is key
+    keys(app.path)
+    stat = os.stat(app.path + '/public.pem')
+    os.utime(app.path + '/public.pem', ns=(stat.st_atime_ns,
+                                           stat.st_mtime_ns + 1000))
+    auth = Auth(expire=60)
+    assert auth._public_keys is not key
+    assert tokens.get(token, auth._public_keys) is None
+    with pytest.raises(BadSignatureError):
+        auth.token = token
+
+
+def test_auth_algorithms(app):
+    from luxon.core.auth import Auth
+    from luxon.utils.ecc import ECKey, EdKey
+
+    auth = Auth(expire=60)
+    auth.new('user', roles=['Admin'])
+    rs256 = auth.token
+
+    for algorithm, key in (('ES256', ECKey()), ('EdDSA', EdKey())):
+        # Rollover to new algorithm, keeping existing keys.
+        for pem, value in (('private.pem', key.generate_private_key()),
+                           ('public.pem', key.public_key)):
+            with open(app.path + '/' + pem) as f:
+                value += f.read()
+            with open(app.path + '/' + pem, 'w') as f:
+                f.write(value)
+            stat = os.stat(app.path + '/' + pem)
+            os.utime(app.path + '/' + pem, ns=(stat.st_atime_ns,
+                                               stat.st_mtime_ns + 1000))
+
+        auth = Auth(expire=60, algorithm=algorithm)
+        auth.new('user', roles=['Admin'])
+        token = auth.token
+
+        auth = Auth(expire=60, algorithm=algorithm)
+        auth.token = token
+        assert auth._jwt.header['alg'] == algorithm
+        assert auth.roles == ('Admin',)
+
+        auth = Auth(expire=60, algorithm=algorithm)
+        auth.token = rs256
+        assert auth.user_id == 'user'
+
+
+def test_auth_policy_generation(app):
+    from luxon.core.auth import Auth
+    from luxon.core.handlers.request import RequestBase
+
+    class Request(RequestBase):
+        pass
+
+    auth = Auth(expire=60)
+    auth.new('user', username='user', roles=['Operations'])
+    token = auth.token
+
+    req = Request()
+    req._cached_auth = Auth(expire=60)
+    assert req.policy.validate('login') is False
+
+    # Credentials set during the request discard previous decisions.
+    req.credentials.token = token
+    assert req.policy.validate('login') is True
+    assert req.policy.validate('role:ops') is True
+
+    req.credentials.clear()
+    assert req.policy.validate('role:ops') is False
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2020 Christiaan Frans Rademan <chris@fwiw.co.za>.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+import pytest
+
+from luxon.core.db.base.args import args_to
+from luxon.core.db.base.connection import cast_map
+
+
+def test_args_to():
+    query = 'SELECT * FROM t WHERE a = %(a)s AND b = :b AND c = %(a)s'
+    args = {'a': True, 'b': 'x'}
+
+    for i in range(2):
+        assert (args_to(query, args, 'qmark', cast_map) ==
+                ('SELECT * FROM t WHERE a = ? AND b = ? AND c = ?',
+                 [1, 'x', 1]))
+    assert (args_to(query, args, 'numeric', cast_map) ==
+            ('SELECT * FROM t WHERE a = :0 AND b = :1 AND c = :2',
+             [1, 'x', 1]))
+    assert (args_to(query, args, 'named', cast_map) ==
+            ('SELECT * FROM t WHERE a = :a AND b = :b AND c = :a',
+             {'a': 1, 'b': 'x'}))
+    assert (args_to('SELECT ?, ?', (1, 2), 'pyformat', cast_map) ==
+            ('SELECT %(p0)s, %(p1)s', {'p0': 1, 'p1': 2}))
+    assert (args_to('SELECT %s', 5, 'qmark', cast_map) ==
+            ('SELECT ?', [5]))
+    assert (args_to('SELECT 1', None, 'qmark', cast_map) ==
+            ('SELECT 1', None))
+
+    with pytest.raises(KeyError):
+        args_to(query, {'a': 1}, 'qmark', cast_map)
+    with pytest.raises(TypeError):
+        args_to(query, [1, 2, 3], 'qmark', cast_map)
+    with pytest.raises(IndexError):
+        args_to('SELECT ?, ?', [1], 'qmark', cast_map)
+    with pytest.raises(ValueError):
+        args_to('SELECT ?', [1], 'unknown', cast_map)
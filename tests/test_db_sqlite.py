@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2020 Christiaan Frans Rademan <chris@fwiw.co.za>.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+import tempfile
+
+import pytest
+
+from luxon import g
+from luxon.exceptions import NoContextError
+
+
+@pytest.fixture(scope="module")
+def conn():
+    from luxon.core.app import App
+    from luxon.core.db.sqlite import connect
+
+    try:
+        previous = g.app
+    except NoContextError:
+        previous = None
+    App(__name__, tempfile.mkdtemp())
+
+    conn = connect(':memory:')
+    conn.execute('CREATE TABLE test (id INTEGER, name TEXT, value REAL)')
+    yield conn
+    conn.close()
+
+    if previous is not None:
+        g.app = previous
+
+
+def test_executemany(conn):
+    crsr = conn.executemany('INSERT INTO test VALUES (%s, %s, %s)',
+                            [(1, 'a', 1.5), (2, 'b', 2.5)])
+    assert crsr.rowcount == 2
+    assert conn.execute('SELECT count(*) AS count FROM test').fetchall() == [
+        {'count': 2}]
+    conn.execute('DELETE FROM test')
+
+
+def test_insert(conn):
+    rows = [{'id': i, 'name': 'row %s' % i} for i in range(5)]
+    rows += [(5, 'tuple', 5.0), [6, 'list', 6.0]]
+    rows += [{'name': 'name only', 'id': 7}]
+    conn.insert('test', rows, batch_size=2)
+    result = conn.execute('SELECT * FROM test ORDER BY id').fetchall()
+    assert [row['id'] for row in result] == list(range(8))
+    assert result[5] == {'id': 5, 'name': 'tuple', 'value': 5.0}
+    assert result[7]['name'] == 'name only'
+    conn.execute('DELETE FROM test')
+
+
+def test_commit(conn):
+    crsr = conn.cursor()
+    crsr.execute('INSERT INTO test VALUES (%s, %s, %s)', (1, 'a', 1.5,))
+    assert crsr._uncommited is True
+    conn.commit()
+    assert not any(c._uncommited for c in conn._cursors)
+    crsr.close()
+    conn.execute('DELETE FROM test')
+    conn.commit()
+
+    # Work through driver cursor is committed without flagged cursor.
+    conn._conn.execute("INSERT INTO test VALUES (2, 'b', 2.5)")
+    assert conn._conn.in_transaction
+    conn.commit()
+    assert not conn._conn.in_transaction
+    conn.execute('DELETE FROM test')
+    conn.commit()
+
+
+def test_fetch(conn):
+    conn.insert('test', [(i, 'row %s' % i, None) for i in range(5)])
+
+    crsr = conn.execute('SELECT id FROM test ORDER BY id')
+    assert crsr.fetchone() == {'id': 0}
+    assert crsr.fetchmany(3) == [{'id': 1}, {'id': 2}, {'id': 3}]
+    assert crsr.fetchmany(3) == [{'id': 4}]
+    assert crsr.fetchmany(3) == []
+    assert crsr.fetchone() is None
+    assert crsr.rownumber == 5
+
+    with conn.execute('SELECT id FROM test ORDER BY id',
+                      stream=True) as crsr:
+        assert [row['id'] for row in crsr] == list(range(5))
+    assert crsr not in conn._cursors
+
+    conn.execute('DELETE FROM test')
+    conn.commit()
+
+    # Closing read cursors leaves open transaction of connection.
+    conn.execute("INSERT INTO test VALUES (1, 'a', 1.5)")
+    with conn.execute('SELECT id FROM test', stream=True) as crsr:
+        assert crsr.fetchall() == [{'id': 1}]
+    assert conn._conn.in_transaction
+    conn.rollback()
+    assert conn.execute('SELECT id FROM test').fetchall() == []
+
+
+def test_parse(conn):
+    conn.execute('CREATE TABLE parse (id INTEGER, created TIMESTAMP)')
+    conn.execute("INSERT INTO parse VALUES (1, NULL),"
+                 " (2, '2020-01-01 12:00:00')")
+
+    rows = conn.execute('SELECT * FROM parse ORDER BY id').fetchall()
+    assert rows[0] == {'id': 1, 'created': None}
+    assert rows[1]['created'].tzinfo is not None
+    assert rows[1]['created'].hour == 12
+
+    crsr = conn.execute('SELECT * FROM parse ORDER BY id')
+    assert [row['created'] for row in crsr] == [None, rows[1]['created']]
+
+
+def test_parse_duplicate_columns(conn):
+    conn.execute('CREATE TABLE parse_a (id INTEGER, name TEXT)')
+    conn.execute('CREATE TABLE parse_b (id INTEGER, a_id INTEGER)')
+    conn.execute("INSERT INTO parse_a VALUES (1, 'a')")
+    conn.execute('INSERT INTO parse_b VALUES (99, 1)')
+
+    # First column with the name is kept, as with sqlite3.Row.
+    query = ('SELECT * FROM parse_a JOIN parse_b'
+             ' ON parse_a.id = parse_b.a_id')
+    assert conn.execute(query).fetchall() == [
+        {'id': 1, 'name': 'a', 'a_id': 1}]
+    assert conn.execute(query).fetchone()['id'] == 1
+    assert [row['id'] for row in conn.execute(query)] == [1]
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2020 Christiaan Frans Rademan <chris@fwiw.co.za>.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+from luxon.core.policy import compiler, Policy
+
+rules = {'role:admin': "'Admin' in roles",
+         'login': 'authenticated is True',
+         'admin': '$role:admin and $login',
+         'staff': "any(role in roles for role in ('Admin', 'Support'))",
+         'broken': 'undefined_kwarg',
+         'missing': '$role:missing or $login'}
+
+
+def test_policy():
+    compiled = compiler(rules)
+    assert all(callable(rule) for rule in compiled[0].values())
+
+    policy = Policy(compiled, roles=['Admin'], authenticated=True)
+    assert policy.validate('role:admin') is True
+    assert policy.validate('admin') is True
+    assert policy.validate('staff') is True
+    assert policy.validate('broken') is False
+    assert policy.validate('missing') is True
+    assert policy.validate('unknown') is False
+
+    policy = Policy(rules, roles=['Support'], authenticated=False)
+    assert policy.validate('role:admin') is False
+    assert policy.validate('admin') is False
+    assert policy.validate('staff') is True
+    assert policy.validate('missing') is False
+
+
+def test_policy_builtin_names():
+    # Kwargs named after builtins take precedence, like rule environment.
+    rule_set = {'owner': "id == 'user' and all == 1",
+                'builtin': 'len(roles) == 1 and type(roles) is list'}
+    policy = Policy(rule_set, id='user', all=1, roles=['Admin'])
+    assert policy.validate('owner') is True
+    assert policy.validate('builtin') is True
+
+
+def test_policy_decisions():
+    from time import time
+
+    compiled = compiler(rules)
+    decisions = compiled[0].decisions
+
+    policy = Policy(compiled, roles=['Admin'], authenticated=True)
+    assert policy.validate_many(['admin', 'login', 'unknown']) == {
+        'admin': True, 'login': True, 'unknown': False}
+    assert policy.validate('admin') is True
+    assert decisions.stats()['request_hits'] == 1
+
+    # Same fingerprint shares decisions across Policy objects.
+    policy = Policy(compiled, fingerprint=('Admin',), expire=time() + 60,
+                    roles=['Admin'], authenticated=True)
+    assert policy.validate('admin') is True
+    policy = Policy(compiled, fingerprint=('Admin',), expire=time() + 60,
+                    roles=[], authenticated=False)
+    assert policy.validate('admin') is True
+    stats = decisions.stats()
+    assert stats['hits'] == 1
+    assert stats['entries'] == 1
+
+    # Expired decisions are validated again.
+    policy = Policy(compiled, fingerprint=('Other',), expire=time() - 1,
+                    roles=['Admin'], authenticated=True)
+    assert policy.validate('admin') is True
+    policy = Policy(compiled, fingerprint=('Other',), expire=time() - 1,
+                    roles=[], authenticated=False)
+    assert policy.validate('admin') is False
+
+    # Recompiled rule set has its own decisions.
+    assert compiler(rules)[0].decisions.stats()['entries'] == 0
+    decisions.clear()
+    assert decisions.stats()['hit_rate'] == 0.0
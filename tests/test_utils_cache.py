@@ -28,6 +28,8 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
 # THE POSSIBILITY OF SUCH DAMAGE.
 
+import pickle
+
 import pytest
 from luxon import g
 #from luxon.utils.cache import *
@@ -36,3 +38,167 @@ from luxon import g
 
 def test_Cache():
     pass
+
+
+def test_Memory():
+    import time
+    import pickle
+    from luxon.core.cache import Memory
+
+    size = len(pickle.dumps('x' * 1000))
+    memory = Memory(max_objs=10, max_obj_size=2, max_size=size * 3 / 1024)
+    for i in range(4):
+        memory.store(str(i), 'x' * 1000, 60)
+    assert memory.load('0') is None
+    assert memory.load('1') == 'x' * 1000
+
+    # Least recently used is evicted.
+    memory.store('4', 'x' * 1000, 60)
+    assert memory.load('2') is None
+    assert memory.load('1') == 'x' * 1000
+
+    # Objects larger than max_obj_size replace previous value.
+    memory.store('1', 'x' * 4096, 60)
+    assert memory.load('1') is None
+
+    memory.store('5', 'value', 0.01)
+    time.sleep(0.02)
+    assert memory.load('5') is None
+
+    stats = memory.stats()
+    assert stats['hits'] == 2
+    assert stats['misses'] == 4
+    assert stats['evictions'] == 2
+    assert stats['objects'] == 2
+    assert stats['bytes'] == size * 2
+
+
+def test_cached():
+    import time
+    import tempfile
+    import threading
+    from luxon.core.app import App
+    from luxon.exceptions import NoContextError
+    from luxon.helpers.cache import cached
+
+    try:
+        previous = g.app
+    except NoContextError:
+        previous = None
+    App(__name__, tempfile.mkdtemp())
+
+    calls = []
+    release = threading.Event()
+
+    def compute(value):
+        calls.append(value)
+        release.wait(5)
+        return value * len(calls)
+
+    def call(expire):
+        return cached(compute, (2,), expire=expire, stale=60)
+
+    # Single flight, concurrent callers wait for one result.
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(call(0.3)))
+               for i in range(8)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert calls == [2]
+    assert results == [2] * 8
+
+    # Stale result served while one caller refreshes.
+    release.clear()
+    time.sleep(0.35)
+    refresh = threading.Thread(target=lambda: results.append(call(60)))
+    refresh.start()
+    while len(calls) < 2:
+        time.sleep(0.01)
+    assert call(60) == 2
+    release.set()
+    refresh.join()
+    assert results[-1] == 4
+    assert call(60) == 4
+    assert calls == [2, 2]
+
+    if previous is not None:
+        g.app = previous
+
+
+class FakeRedis(object):
+    """In-process fake of luxon.utils.rd.Redis interface."""
+    def __init__(self):
+        self.data = {}
+        self.subscribers = []
+        self.gets = 0
+
+    def __call__(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        pass
+
+    def get(self, attr, pickled=False):
+        self.gets += 1
+        value = self.data.get(attr)
+        if value is not None and not pickled:
+            return pickle.loads(value)
+        return value
+
+    def set(self, attr, value, expire=None, pickled=False):
+        if not pickled:
+            value = pickle.dumps(value)
+        self.data[attr] = value
+
+    def delete(self, attr, value=None):
+        self.data.pop(attr, None)
+
+    def publish(self, channel, message):
+        for subscriber in self.subscribers:
+            subscriber.put(message.encode('UTF-8'))
+
+    def subscribe(self, *channels):
+        import queue
+        subscriber = queue.Queue()
+        self.subscribers.append(subscriber)
+        while True:
+            yield subscriber.get()
+
+
+def test_Tiered():
+    import time
+    from luxon.core.cache import Tiered
+
+    redis = FakeRedis()
+    worker1 = Tiered(None, 50, redis=redis)
+    worker2 = Tiered(None, 50, redis=redis)
+
+    worker1.store('key', 'value', 60)
+    assert worker2.load('key') == 'value'
+    assert worker2.load('key') == 'value'
+    assert redis.gets == 1
+    while len(redis.subscribers) < 2:
+        time.sleep(0.01)
+
+    # Stores and deletes invalidate L1 of other workers.
+    worker1.store('key', 'new', 60)
+    time.sleep(0.05)
+    assert worker2.load('key') == 'new'
+    worker1.delete('key')
+    time.sleep(0.05)
+    assert worker2.load('key') is None
+    assert worker1.load('key') is None
+
+    stats = worker2.stats()
+    assert stats['invalidations'] == 2
+    assert stats['l1']['hits'] == 1
+    assert stats['l2']['hits'] == 2
+    assert stats['l2']['misses'] == 1
+    assert stats['l2']['hit_ratio'] == 2 / 3
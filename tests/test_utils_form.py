@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2020 Christiaan Frans Rademan <chris@fwiw.co.za>.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+from io import BytesIO
+
+import pytest
+
+from luxon.utils.form import parse
+from luxon.exceptions import HTTPPayloadTooLarge
+
+BOUNDARY = 'boundary'
+CONTENT_TYPE = 'multipart/form-data; boundary=' + BOUNDARY
+
+
+def multipart(*parts):
+    payload = b''
+    for name, filename, value in parts:
+        payload += b'--boundary\r\n'
+        if filename is not None:
+            payload += (b'Content-Disposition: form-data; name="%s";'
+                        b' filename="%s"\r\n'
+                        b'Content-Type: application/octet-stream\r\n'
+                        b'\r\n' % (name, filename))
+        else:
+            payload += (b'Content-Disposition: form-data;'
+                        b' name="%s"\r\n\r\n' % name)
+        payload += value + b'\r\n'
+    return payload + b'--boundary--\r\n'
+
+
+def test_form_multipart():
+    data = bytes(range(256)) * 100 + b'\r\n--boundar'
+    payload = multipart((b'text', None, b'hello'),
+                        (b'text', None, b''),
+                        (b'file', b'file.bin', data))
+
+    # Small blocks split delimiters between blocks.
+    for block_size in (1, 7, 64, 65536):
+        form = parse(BytesIO(payload), CONTENT_TYPE, len(payload),
+                     spool_size=1024, block_size=block_size)
+        assert form.keys() == ['text', 'file']
+        assert form.getlist('text') == ['hello', '']
+        assert form['file'].filename == 'file.bin'
+        assert form['file'].type == 'application/octet-stream'
+        assert form['file'].file.read() == data
+        # Spooled to disk.
+        assert form['file'].file._rolled is True
+
+
+def test_form_limits():
+    payload = multipart((b'text', None, b'x' * 100),
+                        (b'file', b'file', b'x' * 1000))
+
+    parse(BytesIO(payload), CONTENT_TYPE, max_field_size=100,
+          max_file_size=1000)
+    with pytest.raises(HTTPPayloadTooLarge):
+        parse(BytesIO(payload), CONTENT_TYPE, max_field_size=99)
+    with pytest.raises(HTTPPayloadTooLarge):
+        parse(BytesIO(payload), CONTENT_TYPE, max_file_size=999)
+    with pytest.raises(HTTPPayloadTooLarge):
+        parse(BytesIO(payload), CONTENT_TYPE, max_size=1000)
+
+
+def test_form_urlencoded():
+    payload = b'a=1&a=&b=%C3%A9+x'
+    form = parse(BytesIO(payload), 'application/x-www-form-urlencoded',
+                 len(payload))
+    assert form.getlist('a') == ['1', '']
+    assert form.getfirst('b') == '\xe9 x'
+    assert 'c' not in form
@@ -66,3 +66,73 @@ x = json.dumps(data)
 assert type(x) == str
 
 
+
+
+def test_json_stream():
+    from decimal import Decimal
+
+    rows = ({'id': i, 'value': Decimal('1.5')} for i in range(100))
+    stream = json.JsonStream({'payload': rows, 'empty': iter(())},
+                             chunk_size=64)
+    chunks = list(stream)
+    assert len(chunks) > 1
+    assert json.loads(b''.join(chunks)) == {
+        'payload': [{'id': i, 'value': '1.5'} for i in range(100)],
+        'empty': []}
+
+    # Compact unless indentation is configured.
+    assert b'\n' not in b''.join(json.JsonStream({'payload': iter([1, 2])}))
+    json.configure('json', indent=4)
+    assert b'\n' in b''.join(json.JsonStream({'payload': iter([1, 2])}))
+    json.configure()
+
+    # Deferred values are evaluated once when encoded.
+    from luxon.helpers.api import _Deferred
+    calls = []
+    deferred = _Deferred(lambda: calls.append(1) or {'links': True})
+    assert json.loads(b''.join(json.JsonStream(
+        {'payload': iter([1]), 'links': deferred}))) == {
+            'payload': [1], 'links': {'links': True}}
+    assert len(calls) == 1
+
+
+def test_loads_strip_tags():
+    doc = json.loads('{"a": "<b>x</b>", "b": ["<i>y</i>", 1],'
+                     ' "c": {"d": "&amp;lt;b&amp;gt;"}}')
+    # Stripped once for every object containing the string.
+    assert doc == {'a': 'x', 'b': ['y', 1], 'c': {'d': '<b>'}}
+
+    # Strings not within objects are returned as is.
+    assert json.loads('["<b>x</b>"]') == ['<b>x</b>']
+
+
+def test_encode():
+    from decimal import Decimal
+    from ipaddress import IPv4Address
+    from collections import OrderedDict
+
+    class Obj(object):
+        dict = {'obj': True}
+
+    obj = OrderedDict((('decimal', Decimal('1.10')),
+                       ('ip', IPv4Address('10.0.0.1')),
+                       ('bytes', b'<b>bytes</b>'),
+                       ('obj', Obj()),
+                       ('list', [1, 2.5, None, True, 'aé']),
+                       ('big', 2 ** 70),
+                       (1, 'int key')))
+    expected = json.loads(json.dumps(obj))
+
+    for backend in ('json', 'orjson'):
+        try:
+            json.configure(backend)
+        except ImportError:
+            continue
+        encoded = json.encode(obj)
+        assert isinstance(encoded, bytes)
+        assert b'\n' not in encoded
+        assert json.loads(encoded) == expected
+
+    json.configure('json', indent=4)
+    assert json.encode(obj).decode('UTF-8') == json.dumps(obj)
+    json.configure()
@@ -28,6 +28,8 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
 # THE POSSIBILITY OF SUCH DAMAGE.
 
+import threading
+
 import pytest
 from luxon.utils.pool import *
 
@@ -51,21 +53,21 @@ def test_pool():
 
     #fetch/create conn objects
 
-    conn = pool()
+    conn1 = pool()
     assert pool._count == 1
-    assert conn.host == "host"
+    assert conn1.host == "host"
 
-    conn = pool()
+    conn2 = pool()
     assert pool._count == 2
 
-    conn = pool()
+    conn3 = pool()
     assert pool._count == 3
 
     #overflow starts
-    conn = pool()
+    conn4 = pool()
     assert pool._count == 4
 
-    conn = pool()
+    conn5 = pool()
     assert pool._count == 5
 
     #max size reached
@@ -77,13 +79,109 @@ def test_pool():
 
     #close/return connection objects
 
-    conn.close()
+    conn5.close()
     assert pool._count == 4
 
-    conn.close()
+    conn4.close()
     assert pool._count == 3
 
     #overflow empty
-    conn.close()
+    conn3.close()
     assert pool._count == 3
 
+
+def test_pool_close_twice():
+    class Connect():
+        pass
+
+    pool = Pool(Connect, pool_size=1, max_overflow=2)
+    conn1 = pool()
+    conn2 = pool()
+    conn3 = pool()
+    conn3.close()
+    assert pool.stats()['size'] == 2
+
+    # Closing again above pool_size never releases another count.
+    conn3.close()
+    assert pool.stats()['size'] == 2
+    assert pool.stats()['idle'] == 0
+
+    conn2.close()
+    assert pool.stats()['size'] == 1
+    conn1.close()
+    conn1.close()
+    assert pool.stats()['size'] == 1
+    assert pool.stats()['idle'] == 1
+
+    with pool() as conn:
+        assert conn.__dict__['_obj'] is not None
+    assert pool.stats()['idle'] == 1
+
+
+def test_pool_wait():
+    class Connect():
+        pass
+
+    pool = Pool(Connect, pool_size=1, max_overflow=0, timeout=0.05,
+                min_size=1)
+    assert pool.stats()['size'] == 1
+    assert pool.stats()['created'] == 1
+
+    conn = pool()
+    with pytest.raises(PoolExhausted):
+        pool()
+    assert pool.stats()['waits'] == 1
+    assert pool.stats()['wait_time'] >= 0.05
+
+    pool = Pool(Connect, pool_size=1, max_overflow=0, timeout=1)
+    conn = pool()
+    timer = threading.Timer(0.01, conn.close)
+    timer.start()
+    with pool():
+        assert pool.stats()['waits'] == 1
+    timer.join()
+    assert pool.stats()['created'] == 1
+
+    pool = Pool(Connect, pool_size=1, max_overflow=0, max_lifetime=0)
+    pool().close()
+    assert pool.stats()['recycled'] == 1
+    assert pool.stats()['size'] == 0
+
+
+def test_pool_ping_failed():
+    server = {'up': True}
+
+    class Connect():
+        closed = False
+
+        def __init__(self):
+            if not server['up']:
+                raise ConnectionError('server gone')
+
+        def ping(self):
+            if not server['up'] or self is dead:
+                raise ConnectionError('server gone')
+
+        def close(self):
+            self.closed = True
+
+    pool = Pool(Connect, pool_size=1, max_overflow=0, ping_idle=0)
+    conn = pool()
+    dead = conn.__dict__['_obj']
+    conn.close()
+
+    # Dead object is closed and replaced without leaking its count.
+    with pool() as conn:
+        assert conn.__dict__['_obj'] is not dead
+    assert dead.closed is True
+    assert pool.stats()['size'] == 1
+    assert pool.stats()['created'] == 2
+
+    # Replacement failing releases the count.
+    server['up'] = False
+    with pytest.raises(ConnectionError):
+        pool()
+    assert pool.stats()['size'] == 0
+    server['up'] = True
+    pool().close()
+    assert pool.stats()['size'] == 1
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2020 Christiaan Frans Rademan <chris@fwiw.co.za>.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+from datetime import datetime
+
+import pytest
+
+from luxon import register
+
+calls = []
+
+
+@pytest.fixture(scope="module")
+def client():
+    from luxon.testing.wsgi.client import Client
+    return Client(__file__)
+
+
+@register.resource('GET', '/response_cache/{key}', cache=60)
+def cached(req, resp, key):
+    calls.append(key)
+    return {'key': key, 'calls': len(calls)}
+
+
+def test_wsgi_response_cache(client):
+    from luxon.core.handlers.wsgi.cache import invalidate
+
+    result = client.get(path='/response_cache/one')
+    assert result.status_code == 200
+    assert result.json == {'key': 'one', 'calls': 1}
+    etag = result.headers['etag']
+
+    # Served from cache without running view.
+    result = client.get(path='/response_cache/one')
+    assert result.status_code == 200
+    assert result.json == {'key': 'one', 'calls': 1}
+    assert result.headers['etag'] == etag
+    assert result.headers['content-type'] == 'application/json; charset=utf-8'
+
+    # Etag matches without running view.
+    result = client.get(path='/response_cache/one',
+                        headers={'If-None-Match': etag})
+    assert result.status_code == 304
+    assert len(calls) == 1
+
+    # Different query string or session is not the same response.
+    result = client.get(path='/response_cache/one', query_string='a=1')
+    assert result.json == {'key': 'one', 'calls': 2}
+    result = client.get(path='/response_cache/one',
+                        headers={'Cookie': 'tachyonic.org=session'})
+    assert result.json == {'key': 'one', 'calls': 3}
+    assert 'private' in result.headers['cache-control']
+
+    # Unrelated cookies share the cached response.
+    result = client.get(path='/response_cache/one',
+                        headers={'Cookie': '_ga=GA1.1.1'})
+    assert result.json == {'key': 'one', 'calls': 1}
+
+    # Invalidate route.
+    invalidate('/response_cache/{key}')
+    result = client.get(path='/response_cache/one')
+    assert result.json == {'key': 'one', 'calls': 4}
+
+
+version = {'users': 1}
+
+
+@register.resource('GET', '/conditional', validator=lambda req, resp:
+                   version['users'])
+def conditional(req, resp):
+    calls.append('conditional')
+    return {'version': version['users']}
+
+
+def test_wsgi_conditional(client):
+    result = client.get(path='/conditional')
+    assert result.status_code == 200
+    assert result.json == {'version': 1}
+    etag = result.headers['etag']
+    count = len(calls)
+
+    # Validator matches without running view.
+    result = client.get(path='/conditional',
+                        headers={'If-None-Match': etag})
+    assert result.status_code == 304
+    assert result.headers['etag'] == etag
+    assert len(calls) == count
+
+    # Changed version runs view.
+    version['users'] = 2
+    result = client.get(path='/conditional',
+                        headers={'If-None-Match': etag})
+    assert result.status_code == 200
+    assert result.json == {'version': 2}
+    assert result.headers['etag'] != etag
+    assert len(calls) == count + 1
+
+
+@register.resource('GET', '/response_cache_modified', cache=60,
+                   validator=lambda req, resp: datetime(2020, 1, 1))
+def cached_modified(req, resp):
+    calls.append('modified')
+    return {'modified': True}
+
+
+def test_wsgi_response_cache_modified(client):
+    result = client.get(path='/response_cache_modified')
+    assert result.status_code == 200
+    last_modified = result.headers['last-modified']
+    count = len(calls)
+
+    # Stored without etag, served from cache with Last-Modified.
+    result = client.get(path='/response_cache_modified')
+    assert result.status_code == 200
+    assert result.json == {'modified': True}
+    assert result.headers['last-modified'] == last_modified
+    assert len(calls) == count
+
+    result = client.get(path='/response_cache_modified',
+                        headers={'If-Modified-Since': last_modified})
+    assert result.status_code == 304
+    assert len(calls) == count
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2020 Christiaan Frans Rademan <chris@fwiw.co.za>.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+import gzip
+import zlib
+from io import BytesIO
+
+import pytest
+
+from luxon import register
+from luxon.core import register as registered
+from luxon.middleware.compress import (Compress, CompressedStream,
+                                       accept_encoding)
+
+BODY = b'{"compress": "%s"}' % (b'x' * 4096)
+
+
+@pytest.fixture(scope="module")
+def client():
+    from luxon.testing.wsgi.client import Client
+    return Client(__file__)
+
+
+@register.resource('GET', '/compress/bytes')
+def compress_bytes(req, resp):
+    resp.content_type = 'application/json'
+    return BODY
+
+
+@register.resource('GET', '/compress/stream')
+def compress_stream(req, resp):
+    resp.content_type = 'text/plain'
+    return iter([BODY, BODY])
+
+
+def test_accept_encoding():
+    assert accept_encoding('gzip, deflate') == 'gzip'
+    assert accept_encoding('deflate') == 'deflate'
+    assert accept_encoding('gzip;q=0, deflate;q=0.5') == 'deflate'
+    assert accept_encoding('*') == 'gzip'
+    assert accept_encoding('identity') is None
+    assert accept_encoding(None) is None
+
+
+def test_compressed_stream():
+    stream = CompressedStream(BytesIO(BODY), 'deflate', block_size=100)
+    compressed = b''
+    while True:
+        chunk = stream.read()
+        if not chunk:
+            break
+        compressed += chunk
+    assert zlib.decompress(compressed) == BODY
+
+
+def test_wsgi_compress(client):
+    register.middleware(Compress, min_size=100)
+    try:
+        result = client.get(path='/compress/bytes',
+                            headers={'Accept-Encoding': 'gzip'})
+        assert result.headers['content-encoding'] == 'gzip'
+        assert result.headers['vary'] == 'Accept-Encoding'
+        assert int(result.headers['content-length']) == len(result.content)
+        assert gzip.decompress(result.content) == BODY
+
+        result = client.get(path='/compress/stream',
+                            headers={'Accept-Encoding': 'gzip'})
+        assert result.headers['content-encoding'] == 'gzip'
+        assert 'content-length' not in result.headers
+        assert gzip.decompress(result.content) == BODY + BODY
+
+        result = client.get(path='/compress/bytes')
+        assert 'content-encoding' not in result.headers
+        assert result.content == BODY
+    finally:
+        del registered._middleware_post[-1]
+        registered._version += 1
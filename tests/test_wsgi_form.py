@@ -182,3 +182,16 @@ def test_wsgi_form_get_all_files(client):
         assert response[i]['name'] == 'file'
         assert response[i]['type'] == 'application/octet-stream'
         assert response[i]['data'] == 'test\n'
+
+def test_wsgi_form_closed(client):
+    files = []
+
+    @register.resource('POST', '/form_closed')
+    def form_closed(req, resp):
+        files.append(req.get_file('file').file)
+        return {'closed': files[0].closed}
+
+    result = client.post(path='/form_closed', headers=headers, body=payload)
+    assert result.status_code == 200
+    assert result.json == {'closed': False}
+    assert files[0].closed is True
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2020 Christiaan Frans Rademan <chris@fwiw.co.za>.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+import tempfile
+from wsgiref.util import FileWrapper
+
+import pytest
+
+from luxon import register
+
+
+@pytest.fixture(scope="module")
+def client():
+    from luxon.testing.wsgi.client import Client
+    return Client(__file__)
+
+
+@register.resource('GET', '/response/iterable')
+def iterable(req, resp):
+    resp.content_type = 'text/plain'
+    return iter([b'hello ', 'world'])
+
+
+@register.resource('GET', '/response/file')
+def file_body(req, resp):
+    body = tempfile.TemporaryFile()
+    body.write(b'hello file')
+    return body
+
+
+def test_wsgi_response_iterable(client):
+    result = client.get(path='/response/iterable')
+    assert result.status_code == 200
+    assert result.text == 'hello world'
+
+
+def test_wsgi_response_file_wrapper(client):
+    wrapped = []
+
+    def file_wrapper(stream, block_size):
+        wrapped.append(stream)
+        return FileWrapper(stream, block_size)
+
+    result = client.get(path='/response/file', file_wrapper=file_wrapper)
+    assert result.status_code == 200
+    assert result.content == b'hello file'
+    assert len(wrapped) == 1
+
+    result = client.get(path='/response/file')
+    assert result.content == b'hello file'
+
+
+@register.resource('GET', '/response/json_stream')
+def json_stream(req, resp):
+    from luxon.utils.js import JsonStream
+    return JsonStream({'payload': ({'id': i} for i in range(3))})
+
+
+def test_wsgi_response_json_stream(client):
+    result = client.get(path='/response/json_stream')
+    assert result.status_code == 200
+    assert result.headers['content-type'] == ('application/json;'
+                                              ' charset=utf-8')
+    assert 'content-length' not in result.headers
+    assert result.json == {'payload': [{'id': 0}, {'id': 1}, {'id': 2}]}
@@ -78,3 +78,73 @@ def test_wsgi_route_keywords(client):
     result = client.get(path='/routing/iamkey1/next/iamkey2')
     assert result.status_code == 200
     assert result.text == "iamkey1:iamkey2"
+
+def test_router_find_cache():
+    from luxon.core.router import Router
+
+    def view(req, resp, key1):
+        return key1
+
+    rt = Router(cache_size=2)
+    rt.add('GET', '/cached/{key1}', view)
+
+    found = rt.find('GET', '/cached/one')
+    assert found[0] is view
+    assert found[2] == {'key1': 'one'}
+    assert rt.cache_info['misses'] == 1
+
+    # Cached kwargs are copied for every hit.
+    found[2]['key1'] = 'changed'
+    found = rt.find('GET', '/cached/one')
+    assert found[2] == {'key1': 'one'}
+    assert rt.cache_info['hits'] == 1
+
+    # Bounded and only resolved routes are cached.
+    rt.find('GET', '/cached/two')
+    rt.find('GET', '/cached/three')
+    rt.find('GET', '/notfound')
+    assert rt.cache_info['size'] == 2
+
+    # Adding routes clears the cache.
+    rt.add('GET', '/other', view)
+    assert rt.cache_info['size'] == 0
+    assert rt.cache_info['hits'] == 0
+
+def test_router_regex_routes():
+    from luxon.core.router import Router
+
+    def view1(req, resp):
+        pass
+
+    def view2(req, resp):
+        pass
+
+    def view3(req, resp):
+        pass
+
+    rt = Router(cache_size=0)
+    rt.add('GET', 'regex:^/static/(?P<path>.*)$', view1)
+    rt.add('GET', 'regex:^/static/css/.*$', view2)
+    rt.add('GET', 'regex:(?i)^/upper/(.*)$', view3)
+    rt.add('GET', 'regex:^/(?P<path>proxy)/(a)\\2$', view2)
+    rt.add('GET', 'regex:^/(?P<path>.*)$', view3)
+
+    # First match ordering is kept.
+    assert rt.find('GET', '/static/css/main.css')[0] is view1
+    assert rt.find('GET', '/UPPER/test')[0] is view3
+    assert rt.find('GET', '/proxy/aa')[0] is view2
+    assert rt.find('GET', '/proxy/ab')[0] is view3
+    assert rt.find('POST', '/static/css/main.css')[0] is None
+
+def test_wsgi_freeze(client):
+    client.get(path='/routing')
+    frozen = client.app._frozen
+
+    # Routes added after freeze trigger re-freeze.
+    g.router.add('GET', '/routing_late', lambda req, resp: 'late', cache=10)
+    result = client.get(path='/routing_late')
+    assert client.app._frozen != frozen
+    assert result.status_code == 200
+    assert result.text == 'late'
+    assert result.headers['cache-control'] == 'must-revalidate, max-age=10'
+    assert result.headers['vary'] == 'Cookie, Accept-Encoding, Content-Type'
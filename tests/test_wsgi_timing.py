@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2018-2020 Christiaan Frans Rademan <chris@fwiw.co.za>.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holders nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+import pytest
+
+from luxon import register
+
+
+@pytest.fixture(scope="module")
+def client():
+    from luxon.testing.wsgi.client import Client
+    client = Client(__file__)
+    client.app._timing = True
+    client.app._server_timing = True
+    yield client
+    client.app._timing = False
+    client.app._server_timing = False
+
+
+@register.resource('GET', '/timing/{id}')
+def timed(req, resp, id):
+    return {'id': id}
+
+
+@register.resource('GET', '/timing_failed')
+def failed(req, resp):
+    from luxon.exceptions import NotFoundError
+    raise NotFoundError('Failed view')
+
+
+def test_histogram():
+    from luxon.structs.histogram import Histogram
+
+    histogram = Histogram(buckets=(1, 10))
+    for value in (0.5, 1, 5, 50):
+        histogram.observe(value)
+
+    result = histogram.to_dict()
+    assert result['count'] == 4
+    assert result['sum'] == 56.5
+    assert result['min'] == 0.5
+    assert result['max'] == 50
+    assert list(result['buckets'].items()) == [('1', 2), ('10', 1),
+                                               ('+Inf', 1)]
+
+
+def test_wsgi_timing(client):
+    from luxon.core.handlers.wsgi.timing import timings
+
+    timings.clear()
+    result = client.get(path='/timing/1')
+    assert result.status_code == 200
+    phases = [timing.split(';')[0] for timing in
+              result.headers['server-timing'].split(', ')]
+    assert phases == ['request', 'middleware', 'routing', 'policy',
+                      'cache', 'view', 'encoding', 'total']
+
+    client.get(path='/timing/2')
+    result = client.get(path='/timing_not_found')
+    assert result.status_code == 404
+    assert 'error' in result.headers['server-timing']
+
+    result = timings.to_dict()
+    assert result['GET timing/{id}']['view']['count'] == 2
+    assert result['GET timing/{id}']['total']['count'] == 2
+    assert result['GET None']['error']['count'] == 1
+
+
+def test_wsgi_timing_failed(client):
+    result = client.get(path='/timing_failed')
+    assert result.status_code == 404
+    phases = [timing.split(';')[0] for timing in
+              result.headers['server-timing'].split(', ')]
+    assert 'view' in phases
+    assert 'error' in phases